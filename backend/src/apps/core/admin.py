@@ -0,0 +1,196 @@
+"""
+Admin changelists for tables too large to count or page through with OFFSET.
+
+KeysetPaginationMixin makes a ModelAdmin estimate the number of rows from
+the planner statistics instead of running COUNT(*), and page through its
+default ordering with a cursor of the last row shown instead of OFFSET, so
+every page is read with one index range scan however deep it is.
+"""
+
+import json
+
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+CURSOR_VAR = 'after'
+
+# Rows of every partition of a table, or of the table itself, as of the last
+# ANALYZE; -1 means never analyzed
+TABLE_ESTIMATE_SQL = """
+    SELECT SUM(c.reltuples) FILTER (WHERE c.reltuples >= 0)
+    FROM pg_class c
+    WHERE c.relkind <> 'p'
+      AND (c.oid = %(table)s::regclass
+           OR c.oid IN (SELECT relid FROM pg_partition_tree(%(table)s::regclass)))
+"""
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that estimates the count of large querysets.
+
+    Unfiltered querysets are estimated from pg_class.reltuples and filtered
+    ones from the rows expected by the query plan. Estimates below
+    `exact_count_limit` are counted exactly, but only up to the limit, so a
+    bad estimate never turns into a full scan; beyond it the count is a lower
+    bound.
+
+    Attributes:
+        estimated (bool): Whether the count is an estimate.
+    """
+
+    exact_count_limit = 10000
+
+    estimated = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list.select_related(None).order_by()
+        estimate = None
+        if not queryset.query.where:
+            estimate = self._get_table_estimate(queryset)
+        if estimate is None:
+            plan = json.loads(queryset.explain(format='json'))
+            estimate = int(plan[0]['Plan']['Plan Rows'])
+
+        if estimate < self.exact_count_limit:
+            count = queryset[: self.exact_count_limit + 1].count()
+            if count <= self.exact_count_limit:
+                return count
+            estimate = count
+
+        self.estimated = True
+        return estimate
+
+    def _get_table_estimate(self, queryset):
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(TABLE_ESTIMATE_SQL, {'table': queryset.model._meta.db_table})
+            estimate = cursor.fetchone()[0]
+        return None if estimate is None else int(estimate)
+
+
+def _get_keyset_condition(ordering, values):
+    """
+    Get the condition of the rows after the values in the ordering.
+
+    The first field is bounded inclusively as well, so the rows are read with
+    an index range scan rather than by filtering every row.
+    """
+    first = ordering[0].lstrip('-')
+    bound = 'lte' if ordering[0].startswith('-') else 'gte'
+    condition = Q()
+    for index, field in enumerate(ordering):
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        equal = {
+            name.lstrip('-'): value
+            for name, value in zip(ordering[:index], values[:index], strict=True)
+        }
+        condition |= Q(**equal, **{f'{field.lstrip("-")}__{lookup}': values[index]})
+    return Q(**{f'{first}__{bound}': values[0]}) & condition
+
+
+class KeysetChangeList(ChangeList):
+    """
+    Changelist that pages through the default ordering with a cursor.
+
+    Attributes:
+        keyset (bool): Whether the list is in the default ordering and paged
+            with a cursor. Lists sorted by other columns are paged as usual.
+        cursor (str | None): The cursor of the row the page starts after.
+        next_page_url (str | None): The query string of the next page.
+    """
+
+    def __init__(self, request, *args, **kwargs):
+        self.cursor = request.GET.get(CURSOR_VAR) or None
+        self.next_page_url = None
+        self.keyset = False
+        super().__init__(request, *args, **kwargs)
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_query_string(self, new_params=None, remove=None):
+        # Filters and sorting start over from the first page
+        new_params = new_params or {}
+        if CURSOR_VAR not in new_params:
+            remove = [*(remove or []), CURSOR_VAR]
+        return super().get_query_string(new_params, remove)
+
+    def get_cursor_values(self):
+        fields = [
+            self.lookup_opts.get_field(field.lstrip('-'))
+            for field in self.keyset_ordering
+        ]
+        parts = self.cursor.rsplit(',', len(fields) - 1)
+        if len(parts) != len(fields):
+            raise IncorrectLookupParameters
+        try:
+            return [
+                field.to_python(part) for field, part in zip(fields, parts, strict=True)
+            ]
+        except ValidationError as error:
+            raise IncorrectLookupParameters from error
+
+    def get_results(self, request):
+        # The ordering of the admin queryset is repeated after the columns
+        self.keyset_ordering = list(self.model_admin.ordering or ())
+        ordering = self.get_ordering(request, self.root_queryset)
+        self.keyset = bool(self.keyset_ordering) and (
+            ordering[: len(self.keyset_ordering)] == self.keyset_ordering
+        )
+        if not self.keyset:
+            if self.cursor:
+                raise IncorrectLookupParameters
+            return super().get_results(request)
+
+        paginator = self.model_admin.get_paginator(
+            request, self.queryset, self.list_per_page
+        )
+        queryset = self.queryset
+        if self.cursor:
+            queryset = queryset.filter(
+                _get_keyset_condition(self.keyset_ordering, self.get_cursor_values())
+            )
+
+        # One more row tells whether there is a next page
+        rows = list(queryset[: self.list_per_page + 1])
+        if len(rows) > self.list_per_page:
+            rows = rows[: self.list_per_page]
+            last = rows[-1]
+            cursor = ','.join(
+                self.lookup_opts.get_field(field.lstrip('-')).value_to_string(last)
+                for field in self.keyset_ordering
+            )
+            self.next_page_url = self.get_query_string({CURSOR_VAR: cursor})
+
+        self.result_count = paginator.count
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = rows
+        self.can_show_all = False
+        self.multi_page = bool(self.cursor or self.next_page_url)
+        self.paginator = paginator
+
+
+class KeysetPaginationMixin:
+    """
+    ModelAdmin mixin for changelists of large tables.
+
+    The default `ordering` must end with a unique field and be covered by an
+    index, e.g. ('-created_at', '-id').
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    change_list_template = 'admin/keyset_change_list.html'
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
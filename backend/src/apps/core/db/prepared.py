@@ -0,0 +1,59 @@
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+
+from django.db import connections
+
+
+def supports_prepared_statements(connection) -> bool:
+    """
+    Check whether a connection binds parameters on the server and may prepare
+    statements, see DJANGO_DB_PREPARED_STATEMENTS.
+    """
+    options = connection.settings_dict['OPTIONS']
+    return (
+        options.get('server_side_binding') is True
+        and options.get('prepare_threshold') is not None
+    )
+
+
+def _execute_prepared(execute, sql, params, many, context):
+    # Statements without parameters may hold several commands, which cannot
+    # be prepared
+    if many or params is None:
+        return execute(sql, params, many, context)
+
+    connection = context['connection']
+    connection.validate_no_broken_transaction()
+    with connection.wrap_database_errors:
+        return context['cursor'].cursor.execute(sql, params, prepare=True)
+
+
+@contextmanager
+def prepared_statements():
+    """
+    Prepare the queries executed inside the context on their first execution
+    instead of after prepare_threshold executions.
+
+    Prepared statements are kept by the connection, so later executions of
+    the same SQL skip parsing and planning. Without prepared statements
+    enabled for a database its queries are executed as usual.
+    """
+    with ExitStack() as stack:
+        for connection in connections.all():
+            if supports_prepared_statements(connection):
+                stack.enter_context(connection.execute_wrapper(_execute_prepared))
+        yield
+
+
+def prepare_statements(view_method):
+    """
+    Decorator for APIView handler methods whose queries are hot enough to be
+    prepared right away, see `prepared_statements`.
+    """
+
+    @wraps(view_method)
+    def wrapper(view, request, *args, **kwargs):
+        with prepared_statements():
+            return view_method(view, request, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,97 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+STICKY_CACHE_KEY = 'db:primary-sticky:{user_id}'
+
+_read_from_replica = ContextVar('read_from_replica', default=False)
+
+
+class PrimaryReplicaRouter:
+    """
+    Database router that sends writes to the primary database and reads
+    to the replica only inside the `use_replica` context.
+
+    Without a configured replica (REPLICA_DATABASE_ALIAS is None) every query
+    goes to the primary database.
+    """
+
+    def db_for_read(self, model, **hints):
+        if _read_from_replica.get() and settings.REPLICA_DATABASE_ALIAS:
+            return settings.REPLICA_DATABASE_ALIAS
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def use_replica():
+    """
+    Route reads executed inside the context to the replica database.
+    """
+    token = _read_from_replica.set(True)
+    try:
+        yield
+    finally:
+        _read_from_replica.reset(token)
+
+
+def mark_primary_sticky(user_id: int):
+    """
+    Pin reads of the user to the primary database for the sticky period,
+    so the user sees their own writes despite replication lag.
+
+    Args:
+        user_id (int): The ID of the user who has written data.
+    """
+    cache.set(
+        STICKY_CACHE_KEY.format(user_id=user_id),
+        True,
+        timeout=settings.REPLICA_STICKY_SECONDS,
+    )
+
+
+def is_primary_sticky(user_id: int) -> bool:
+    """
+    Check whether reads of the user are pinned to the primary database.
+
+    Args:
+        user_id (int): The ID of the user.
+
+    Returns:
+        bool: True if the user has written within the sticky period.
+    """
+    return bool(cache.get(STICKY_CACHE_KEY.format(user_id=user_id)))
+
+
+def read_from_replica(view_method):
+    """
+    Decorator for APIView handler methods that routes their reads to the replica.
+
+    Reads stay on the primary database when no replica is configured or the
+    authenticated user is within the read-after-write sticky period.
+    """
+
+    @wraps(view_method)
+    def wrapper(view, request, *args, **kwargs):
+        user = getattr(request, 'user', None)
+        if not settings.REPLICA_DATABASE_ALIAS or (
+            user is not None and user.is_authenticated and is_primary_sticky(user.pk)
+        ):
+            return view_method(view, request, *args, **kwargs)
+
+        with use_replica():
+            return view_method(view, request, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.services.schema import (
+    diff_schema,
+    generate_schema,
+    load_schema_file,
+    render_schema,
+)
+
+
+class Command(BaseCommand):
+    help = 'Generates the OpenAPI schema file and reports changes against it'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            dest='output',
+            default=None,
+            help='Schema file path, defaults to DOCS_SCHEMA_FILE or docs/v1.yaml; '
+            'written as JSON if it ends with .json, otherwise as YAML',
+        )
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            dest='check',
+            default=False,
+            help='Only report changes, fail if the schema file is outdated',
+        )
+
+    def handle(self, *args, **options):
+        path = Path(
+            options['output']
+            or settings.DOCS_SCHEMA_FILE
+            or settings.BASE_DIR.parent / 'docs' / 'v1.yaml'
+        )
+        schema = generate_schema()
+
+        if path.exists():
+            changes = diff_schema(load_schema_file(path), schema)
+        else:
+            changes = [f'Schema file {path} does not exist']
+
+        for change in changes:
+            self.stdout.write(change)
+
+        if options['check']:
+            if changes:
+                raise CommandError(f'Schema file {path} is outdated')
+            self.stdout.write(self.style.SUCCESS(f'Schema file {path} is up to date'))
+            return
+
+        schema_format = 'json' if path.suffix == '.json' else 'yaml'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(render_schema(schema, schema_format))
+        self.stdout.write(self.style.SUCCESS(f'Schema written to {path}'))
@@ -0,0 +1,94 @@
+import json
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.startup import parse_import_times
+
+
+class Command(BaseCommand):
+    help = 'Profiles the application startup in a fresh interpreter'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top',
+            type=int,
+            dest='top',
+            default=20,
+            help='Number of slowest modules and packages to report',
+        )
+        parser.add_argument(
+            '--sort',
+            choices=['self', 'cumulative'],
+            dest='sort',
+            default='cumulative',
+            help='Order modules by their own import time or including '
+            'the modules they import',
+        )
+        parser.add_argument(
+            '--prefix',
+            dest='prefix',
+            default=None,
+            help='Only report modules with names starting with this prefix',
+        )
+
+    def handle(self, *args, **options):
+        top = options['top']
+        if top < 1:
+            raise CommandError('--top must be positive')
+
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-m', 'apps.core.startup'],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+        )
+        if process.returncode != 0:
+            raise CommandError(f'Startup failed:\n{process.stderr[-2000:]}')
+
+        phases = json.loads(process.stdout.splitlines()[-1])
+        imports = parse_import_times(process.stderr.splitlines())
+
+        self.stdout.write(self.style.MIGRATE_HEADING('Startup phases'))
+        self.write_time('django.setup()', phases['django.setup'])
+        for label, seconds in sorted(
+            phases['ready'].items(), key=lambda item: item[1], reverse=True
+        ):
+            if seconds >= 0.0005:
+                self.write_time(f'  {label}.ready()', seconds)
+        self.write_time('URL resolver', phases['url_resolver'])
+        self.write_time('Middleware', phases['middleware'])
+        self.write_time('Total', phases['total'])
+
+        if options['prefix']:
+            imports = [
+                item for item in imports if item['module'].startswith(options['prefix'])
+            ]
+
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(f'Slowest imports ({options["sort"]})')
+        )
+        self.stdout.write(f'{"self":>10}{"cumulative":>12}  module')
+        imports.sort(key=lambda item: item[options['sort']], reverse=True)
+        for item in imports[:top]:
+            self.stdout.write(
+                f'{item["self"] * 1000:>7.1f} ms{item["cumulative"] * 1000:>9.1f} ms'
+                f'  {item["module"]}'
+            )
+
+        packages = defaultdict(float)
+        for item in imports:
+            packages[item['module'].split('.')[0]] += item['self']
+
+        self.stdout.write(self.style.MIGRATE_HEADING('Import time by package'))
+        for package, seconds in sorted(
+            packages.items(), key=lambda item: item[1], reverse=True
+        )[:top]:
+            self.write_time(package, seconds)
+        self.write_time('Total', sum(packages.values()))
+
+    def write_time(self, label: str, seconds: float):
+        self.stdout.write(f'{label:<40}{seconds * 1000:>9.1f} ms')
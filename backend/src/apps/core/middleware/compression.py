@@ -0,0 +1,197 @@
+import zlib
+
+import brotli
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+# Encodings in the order of server preference when the client accepts several
+# with the same quality
+SUPPORTED_ENCODINGS = ('br', 'gzip')
+
+
+def choose_encoding(accept_encoding: str):
+    """
+    Choose the response encoding from the Accept-Encoding request header.
+
+    Args:
+        accept_encoding (str): The value of the Accept-Encoding header.
+
+    Returns:
+        str | None: 'br' or 'gzip', or None if the client accepts neither.
+    """
+    qualities = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+
+    candidates = [
+        (qualities.get(encoding, qualities.get('*', 0.0)), -index, encoding)
+        for index, encoding in enumerate(SUPPORTED_ENCODINGS)
+    ]
+    quality, _, encoding = max(candidates)
+    return encoding if quality > 0 else None
+
+
+def _gzip_compressor():
+    return zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+
+def _brotli_compressor():
+    return brotli.Compressor(
+        mode=brotli.MODE_TEXT, quality=settings.COMPRESSION_BROTLI_QUALITY
+    )
+
+
+def compress_bytes(content: bytes, encoding: str) -> bytes:
+    """
+    Compress a response body.
+
+    Args:
+        content (bytes): The response body.
+        encoding (str): 'br' or 'gzip'.
+
+    Returns:
+        bytes: The compressed body.
+    """
+    if encoding == 'br':
+        return brotli.compress(
+            content, mode=brotli.MODE_TEXT, quality=settings.COMPRESSION_BROTLI_QUALITY
+        )
+
+    compressor = _gzip_compressor()
+    return compressor.compress(content) + compressor.flush()
+
+
+class _StreamCompressor:
+    """
+    Incremental compressor that flushes after every chunk, so each chunk of a
+    streamed response reaches the client without waiting for the next ones.
+    """
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == 'br':
+            self.compressor = _brotli_compressor()
+        else:
+            self.compressor = _gzip_compressor()
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == 'br':
+            return self.compressor.process(chunk) + self.compressor.flush()
+        return self.compressor.compress(chunk) + self.compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        if self.encoding == 'br':
+            return self.compressor.finish()
+        return self.compressor.flush()
+
+
+def compress_sequence(sequence, encoding: str):
+    """
+    Compress the chunks of a streamed response body.
+
+    Args:
+        sequence: An iterable of byte chunks.
+        encoding (str): 'br' or 'gzip'.
+
+    Yields:
+        bytes: Compressed chunks.
+    """
+    compressor = _StreamCompressor(encoding)
+    for chunk in sequence:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def acompress_sequence(sequence, encoding: str):
+    """
+    Compress the chunks of an asynchronously streamed response body.
+
+    Args:
+        sequence: An async iterable of byte chunks.
+        encoding (str): 'br' or 'gzip'.
+
+    Yields:
+        bytes: Compressed chunks.
+    """
+    compressor = _StreamCompressor(encoding)
+    async for chunk in sequence:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress API responses with brotli or gzip, as negotiated by Accept-Encoding.
+
+    Only responses with a content type from COMPRESSION_CONTENT_TYPES are
+    compressed. Regular responses shorter than COMPRESSION_MIN_SIZE bytes are
+    sent as is, streamed responses are compressed chunk by chunk.
+    """
+
+    def process_response(
+        self, request: HttpRequest, response: HttpResponse
+    ) -> HttpResponse:
+        content_type = response.get('Content-Type', '').split(';')[0].strip()
+        if content_type not in settings.COMPRESSION_CONTENT_TYPES:
+            return response
+
+        if not response.streaming and (
+            len(response.content) < settings.COMPRESSION_MIN_SIZE
+        ):
+            return response
+
+        if response.has_header('Content-Encoding'):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = acompress_sequence(
+                    response.streaming_content, encoding
+                )
+            else:
+                response.streaming_content = compress_sequence(
+                    response.streaming_content, encoding
+                )
+            # The compressed size is unknown until the stream ends
+            del response.headers['Content-Length']
+        else:
+            compressed_content = compress_bytes(response.content, encoding)
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers['Content-Length'] = str(len(response.content))
+
+        # A strong ETag must change with the encoding (RFC 9110 Section 8.8.1)
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+
+        return response
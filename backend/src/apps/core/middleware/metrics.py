@@ -0,0 +1,22 @@
+import time
+
+from django.http import HttpRequest, HttpResponse
+
+from apps.core.services.warmup import record_request
+
+
+class WorkerMetricsMiddleware:
+    """
+    Record the latency of the first request served by each worker process.
+
+    Placed first, so the measured time covers the other middleware too.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        started = time.perf_counter()
+        response = self.get_response(request)
+        record_request(request.path, time.perf_counter() - started)
+        return response
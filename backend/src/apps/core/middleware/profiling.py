@@ -0,0 +1,187 @@
+"""
+On-demand profiling of single requests.
+
+A staff user profiles a request by sending the X-Profile header with one of
+the modes below; PROFILING_SAMPLE_RATE profiles a share of all requests with
+PROFILING_SAMPLE_MODE. The profile is written to PROFILING_DIR and the name
+of the file is returned in the X-Profile-File response header to staff users,
+sampled profiles are only logged:
+
+    cprofile
+        A pstats file of the calls made by the request, to be read with
+        `python -m pstats` or snakeviz.
+    tracemalloc
+        The allocations made by the request that were still alive when it
+        finished, largest first, with their tracebacks.
+    sql
+        Every query of the request with its parameters and duration.
+
+Profiling covers the view and the middleware after this one. cProfile and
+tracemalloc see the whole process, so requests served by other threads at
+the same time are profiled too.
+"""
+
+import cProfile
+import logging
+import os
+import random
+import re
+import time
+import tracemalloc
+import uuid
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FILE_HEADER = 'X-Profile-File'
+
+# Allocations listed by the tracemalloc report
+TRACEMALLOC_TOP = 25
+
+
+def _profile_cprofile(get_response, request):
+    profiler = cProfile.Profile()
+    response = profiler.runcall(get_response, request)
+    return response, 'prof', profiler.dump_stats
+
+
+def _profile_tracemalloc(get_response, request):
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(settings.PROFILING_TRACEMALLOC_FRAMES)
+    tracemalloc.reset_peak()
+    ignored = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    before = tracemalloc.take_snapshot().filter_traces(ignored)
+    try:
+        response = get_response(request)
+    finally:
+        after = tracemalloc.take_snapshot().filter_traces(ignored)
+        _, peak = tracemalloc.get_traced_memory()
+        if started:
+            tracemalloc.stop()
+
+    lines = [f'Peak traced memory: {peak / 1024:.1f} KiB', '']
+    for stat in after.compare_to(before, 'traceback')[:TRACEMALLOC_TOP]:
+        lines.append(f'{stat.size_diff / 1024:+.1f} KiB in {stat.count_diff:+d} blocks')
+        lines.extend(stat.traceback.format(most_recent_first=True))
+        lines.append('')
+    return response, 'txt', lambda path: _write_lines(path, lines)
+
+
+class _QueryLog:
+    """Execute wrapper that records every query with its duration."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            alias = context['connection'].alias
+            self.queries.append((alias, sql, params, many, duration))
+
+    def format(self):
+        total = sum(query[-1] for query in self.queries)
+        lines = [f'{len(self.queries)} queries in {total * 1000:.3f} ms', '']
+        for index, (alias, sql, params, many, duration) in enumerate(self.queries, 1):
+            lines.append(
+                f'-- #{index} {alias} {duration * 1000:.3f} ms'
+                + (' (executemany)' if many else '')
+            )
+            lines.append(sql)
+            if params and not many:
+                lines.append(f'-- params: {params!r}')
+            lines.append('')
+        return lines
+
+
+def _profile_sql(get_response, request):
+    query_log = _QueryLog()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(query_log))
+        response = get_response(request)
+    return response, 'sql', lambda path: _write_lines(path, query_log.format())
+
+
+PROFILERS = {
+    'cprofile': _profile_cprofile,
+    'tracemalloc': _profile_tracemalloc,
+    'sql': _profile_sql,
+}
+
+
+def _write_lines(path, lines):
+    with open(path, 'w') as file:
+        file.write('\n'.join(lines))
+
+
+def is_staff_request(request: HttpRequest) -> bool:
+    """
+    Check whether a request is made by a staff user.
+
+    API requests are authenticated with their JWT here, as DRF only
+    authenticates them in the view.
+    """
+    user = getattr(request, 'user', None)
+    if user is None or not user.is_authenticated:
+        try:
+            authenticated = JWTAuthentication().authenticate(request)
+        except AuthenticationFailed:
+            return False
+        user = authenticated[0] if authenticated else None
+    return user is not None and user.is_staff
+
+
+def get_profile_name(request: HttpRequest, mode: str, extension: str) -> str:
+    """
+    Get a unique file name of the profile of a request.
+    """
+    path = re.sub(r'[^A-Za-z0-9]+', '-', request.path).strip('-')[:80]
+    return (
+        f'{timezone.now():%Y%m%dT%H%M%S}-{mode}-{request.method.lower()}-'
+        f'{path or "root"}-{uuid.uuid4().hex[:8]}.{extension}'
+    )
+
+
+class ProfilingMiddleware:
+    """
+    Profile requests of staff users that ask for it, and sampled requests.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        mode = request.headers.get('X-Profile', '').strip().lower()
+        requested = mode in PROFILERS and is_staff_request(request)
+        if not requested:
+            if random.random() >= settings.PROFILING_SAMPLE_RATE:
+                return self.get_response(request)
+            mode = settings.PROFILING_SAMPLE_MODE
+
+        response, extension, write = PROFILERS[mode](self.get_response, request)
+
+        name = get_profile_name(request, mode, extension)
+        try:
+            os.makedirs(settings.PROFILING_DIR, exist_ok=True)
+            write(os.path.join(settings.PROFILING_DIR, name))
+        except OSError:
+            logger.exception('Failed to write the profile %s', name)
+            return response
+
+        if requested:
+            response[PROFILE_FILE_HEADER] = name
+        else:
+            logger.info('Profiled %s %s to %s', request.method, request.path, name)
+        return response
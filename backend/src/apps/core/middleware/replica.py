@@ -0,0 +1,30 @@
+from django.http import HttpRequest, HttpResponse
+from rest_framework.permissions import SAFE_METHODS
+
+from apps.core.db.routers import mark_primary_sticky
+
+
+class PrimaryStickyMiddleware:
+    """
+    Pin reads of a user to the primary database after a successful write.
+
+    DRF authenticates inside the view and copies the user to the underlying
+    request, so the user is available here when the response goes back.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+
+        user = getattr(request, 'user', None)
+        if (
+            request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and user is not None
+            and user.is_authenticated
+        ):
+            mark_primary_sticky(user.pk)
+
+        return response
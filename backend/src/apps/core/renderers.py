@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+import msgpack
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renderer which serializes to JSON with orjson.
+
+    Datetimes, dates, UUIDs and dataclasses are serialized natively. Other
+    types (e.g. Decimal, lazy translation strings) are passed to DRF's JSON
+    encoder, so the output matches JSONRenderer.
+    """
+
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        options = self.options
+        # orjson only supports an indentation of two spaces
+        if self.get_indent(accepted_media_type, renderer_context):
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=self.encoder_class().default, option=options)
+
+
+class CompactJSONRenderer(ORJSONRenderer):
+    """
+    Renderer selected with ?format=compact.
+
+    Renders like ORJSONRenderer, views check the format of the accepted
+    renderer to respond with a compact payload.
+    """
+
+    format = 'compact'
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renderer which serializes to MessagePack.
+
+    Decimal values are encoded as strings to keep them exact, other types
+    unsupported by MessagePack (e.g. datetimes) are encoded like in JSON.
+    """
+
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+    encoder_class = JSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        encoder = self.encoder_class()
+
+        def default(obj):
+            if isinstance(obj, Decimal):
+                return str(obj)
+            return encoder.default(obj)
+
+        return msgpack.packb(data, default=default, use_bin_type=True)
@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Test runner that keeps reads on the primary database.
+
+    A replica configured as a test mirror uses its own connection and does
+    not see data created inside TestCase transactions, so replica routing is
+    disabled for the test run. Test cases exercising replica reads enable it
+    with override_settings(REPLICA_DATABASE_ALIAS=...).
+
+    Throttling is disabled as well, since the token buckets are shared by all
+    test cases; throttle tests enable it with override_settings.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._replica_database_alias = settings.REPLICA_DATABASE_ALIAS
+        settings.REPLICA_DATABASE_ALIAS = None
+        self._throttle_enabled = settings.THROTTLE_ENABLED
+        settings.THROTTLE_ENABLED = False
+
+    def teardown_test_environment(self, **kwargs):
+        settings.REPLICA_DATABASE_ALIAS = self._replica_database_alias
+        settings.THROTTLE_ENABLED = self._throttle_enabled
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,46 @@
+import os
+
+from django.db import connections
+
+
+def get_pool_stats(alias: str):
+    """
+    Get connection pool statistics of the current process for a database alias.
+
+    Counters are accumulated since the pool was opened, so the values describe
+    the lifetime of the current worker process.
+
+    Args:
+        alias (str): The database alias from the DATABASES setting.
+
+    Returns:
+        dict | None: Pool statistics with the average wait time per connection
+            request, or None if pooling is disabled for the alias.
+    """
+    pool = getattr(connections[alias], 'pool', None)
+    if pool is None:
+        return None
+
+    stats = pool.get_stats()
+    requests_num = stats.get('requests_num', 0)
+    requests_wait_ms = stats.get('requests_wait_ms', 0)
+
+    return {
+        **stats,
+        'requests_wait_avg_ms': (
+            round(requests_wait_ms / requests_num, 3) if requests_num else 0.0
+        ),
+    }
+
+
+def get_all_pool_stats():
+    """
+    Get connection pool statistics for every configured database alias.
+
+    Returns:
+        dict: Process ID of the worker and the pool statistics per alias.
+    """
+    return {
+        'pid': os.getpid(),
+        'databases': {alias: get_pool_stats(alias) for alias in connections},
+    }
@@ -0,0 +1,150 @@
+import hashlib
+import json
+from pathlib import Path
+
+import orjson
+import yaml
+from django.conf import settings
+from drf_yasg.codecs import OpenAPICodecJson, yaml_sane_dump
+
+from config.yasg import docs_info_v1, docs_schema_view_v1
+
+SCHEMA_FORMATS = ('json', 'yaml')
+
+# The schema and its renderings per format, kept for the lifetime of the process
+_schemas = {}
+
+
+def generate_schema():
+    """
+    Generate the OpenAPI schema by introspecting the API views.
+
+    The schema is generated without a request, host and schemes are taken from
+    the DEFAULT_API_URL swagger setting.
+
+    Returns:
+        dict: The schema as plain data.
+    """
+    generator = docs_schema_view_v1.generator_class(docs_info_v1)
+    schema = generator.get_schema(request=None, public=True)
+    return json.loads(OpenAPICodecJson(validators=[]).encode(schema))
+
+
+def load_schema_file(path: str | Path):
+    """
+    Load a schema file written by the generate_schema command.
+
+    Args:
+        path (str | Path): Path to the YAML or JSON schema file.
+
+    Returns:
+        dict: The schema as plain data.
+    """
+    with open(path, 'rb') as file:
+        return yaml.safe_load(file)
+
+
+def render_schema(schema: dict, schema_format: str) -> bytes:
+    """
+    Render the schema.
+
+    Args:
+        schema (dict): The schema as plain data.
+        schema_format (str): 'json' or 'yaml'.
+
+    Returns:
+        bytes: The rendered schema.
+    """
+    if schema_format == 'yaml':
+        return yaml_sane_dump(schema, binary=True)
+    return orjson.dumps(schema)
+
+
+def get_schema(schema_format: str):
+    """
+    Get the rendered schema, loading or generating it on the first call in the
+    process.
+
+    The schema is read from the file in the DOCS_SCHEMA_FILE setting if the
+    file exists, otherwise it is generated.
+
+    Args:
+        schema_format (str): 'json' or 'yaml'.
+
+    Returns:
+        tuple[bytes, str]: The rendered schema and its ETag.
+    """
+    if 'schema' not in _schemas:
+        if settings.DOCS_SCHEMA_FILE and Path(settings.DOCS_SCHEMA_FILE).exists():
+            _schemas['schema'] = load_schema_file(settings.DOCS_SCHEMA_FILE)
+        else:
+            _schemas['schema'] = generate_schema()
+
+    if schema_format not in _schemas:
+        content = render_schema(_schemas['schema'], schema_format)
+        _schemas[schema_format] = (
+            content,
+            f'"{hashlib.sha256(content).hexdigest()}"',
+        )
+
+    return _schemas[schema_format]
+
+
+def clear_schema_cache():
+    """
+    Drop the schemas cached by the process, so they are loaded again.
+    """
+    _schemas.clear()
+
+
+def _get_operations(schema: dict):
+    operations = {}
+    for path, path_item in (schema.get('paths') or {}).items():
+        for method, operation in path_item.items():
+            # Path items hold common path parameters besides the operations
+            if method == 'parameters':
+                operations[f'{path} parameters'] = operation
+            else:
+                operations[f'{method.upper()} {path}'] = operation
+    return operations
+
+
+def _diff_keys(label: str, old: dict, new: dict):
+    changes = []
+    for key in new.keys() - old.keys():
+        changes.append(f'Added {label} {key}')
+    for key in old.keys() - new.keys():
+        changes.append(f'Removed {label} {key}')
+    for key in old.keys() & new.keys():
+        if old[key] != new[key]:
+            changes.append(f'Changed {label} {key}')
+    return changes
+
+
+def diff_schema(old: dict, new: dict):
+    """
+    Describe the differences between two schemas.
+
+    Operations and definitions are compared one by one, other top-level
+    fields as a whole.
+
+    Args:
+        old (dict): The current schema, e.g. loaded from the schema file.
+        new (dict): The generated schema.
+
+    Returns:
+        list[str]: Sorted descriptions of the changes, empty if the schemas
+            are equal.
+    """
+    changes = _diff_keys('operation', _get_operations(old), _get_operations(new))
+    changes += _diff_keys(
+        'definition', old.get('definitions') or {}, new.get('definitions') or {}
+    )
+
+    fields = old.keys() | new.keys()
+    changes += [
+        f'Changed field {field}'
+        for field in fields - {'paths', 'definitions'}
+        if old.get(field) != new.get(field)
+    ]
+    return sorted(changes)
@@ -0,0 +1,164 @@
+import os
+import time
+
+from django.db import connections
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework.serializers import Serializer
+
+# Warm-up timings and first request latency of the current worker process
+_worker = {}
+
+
+def _get_worker():
+    # Workers are forked from the master, which may have recorded state too
+    if _worker.get('pid') != os.getpid():
+        _worker.clear()
+        _worker.update(
+            pid=os.getpid(),
+            started_at=time.time(),
+            warmup_ms=None,
+            first_request_ms=None,
+            first_request_path=None,
+            requests=0,
+        )
+    return _worker
+
+
+def get_view_classes(patterns=None):
+    """
+    Get the view classes of all URL patterns, including nested ones.
+
+    Args:
+        patterns (list, optional): URL patterns to walk, defaults to the
+            patterns of the root URLconf.
+
+    Returns:
+        list[type]: View classes in URL pattern order, without duplicates.
+    """
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+
+    view_classes = []
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            candidates = get_view_classes(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            view_class = getattr(pattern.callback, 'cls', None) or getattr(
+                pattern.callback, 'view_class', None
+            )
+            candidates = [view_class] if view_class else []
+        else:
+            candidates = []
+
+        view_classes += [view for view in candidates if view not in view_classes]
+
+    return view_classes
+
+
+def open_database_connections():
+    """
+    Open a connection to every configured database.
+    """
+    for alias in connections:
+        connections[alias].ensure_connection()
+
+
+def resolve_url_patterns():
+    """
+    Import all URLconfs and views and build the URL lookups of the resolver.
+
+    Returns:
+        int: The number of view classes.
+    """
+    resolver = get_resolver()
+    # Builds the reverse lookups and compiles the patterns of all resolvers
+    resolver.reverse_dict  # noqa: B018
+    return len(get_view_classes(resolver.url_patterns))
+
+
+def prime_reference_cache():
+    """
+    Build the reference bundle and load the reference name <-> ID maps.
+    """
+    from apps.reference.registry import get_reference_ids
+    from apps.reference.services.bundle import get_reference_bundle
+
+    get_reference_bundle()
+    get_reference_ids()
+
+
+def instantiate_serializers():
+    """
+    Build the fields of every serializer class used by the views.
+
+    Serializer fields are constructed lazily on first access, the first
+    construction also runs the model introspection of model serializers.
+
+    Returns:
+        int: The number of serializer classes.
+    """
+    serializer_classes = set()
+    for view_class in get_view_classes():
+        for name in dir(view_class):
+            if not name.endswith('serializer_class'):
+                continue
+            value = getattr(view_class, name)
+            if isinstance(value, type) and issubclass(value, Serializer):
+                serializer_classes.add(value)
+
+    for serializer_class in serializer_classes:
+        serializer_class().fields  # noqa: B018
+
+    return len(serializer_classes)
+
+
+def warm_up():
+    """
+    Pay the cold costs of a fresh worker process before it serves requests.
+
+    Returns:
+        dict: Milliseconds spent in every warm-up step and in total.
+    """
+    timings = {}
+    started = time.perf_counter()
+
+    for step in (
+        open_database_connections,
+        resolve_url_patterns,
+        prime_reference_cache,
+        instantiate_serializers,
+    ):
+        step_started = time.perf_counter()
+        step()
+        timings[step.__name__] = round((time.perf_counter() - step_started) * 1000, 3)
+
+    timings['total'] = round((time.perf_counter() - started) * 1000, 3)
+    _get_worker()['warmup_ms'] = timings
+    return timings
+
+
+def record_request(path: str, duration: float):
+    """
+    Count a request served by the worker, keeping the latency of the first one.
+
+    Args:
+        path (str): The request path.
+        duration (float): Seconds spent serving the request.
+    """
+    worker = _get_worker()
+    if worker['first_request_ms'] is None:
+        worker['first_request_ms'] = round(duration * 1000, 3)
+        worker['first_request_path'] = path
+    worker['requests'] += 1
+
+
+def get_worker_stats():
+    """
+    Get warm-up and first request statistics of the current worker process.
+
+    Returns:
+        dict: Process ID, start time, warm-up timings (None if the worker was
+            not warmed up), first request latency and path, and the number
+            of requests served.
+    """
+    return dict(_get_worker())
@@ -0,0 +1,104 @@
+"""
+Startup profiling of the Django application.
+
+Run as a script (python -X importtime -m apps.core.startup) in a fresh
+interpreter, it boots the application the way a worker process does and prints
+the time spent in each phase as JSON. The per-module import times are written
+to stderr by the interpreter and parsed with parse_import_times.
+"""
+
+import json
+import re
+import time
+
+IMPORT_TIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def parse_import_times(lines):
+    """
+    Parse the output of python -X importtime.
+
+    Args:
+        lines: Lines written to stderr by the interpreter.
+
+    Returns:
+        list[dict]: Imported modules in import order with their 'module' name,
+            'self' and 'cumulative' import time in seconds and nesting 'depth'.
+    """
+    imports = []
+    for line in lines:
+        match = IMPORT_TIME_RE.match(line.rstrip('\n'))
+        if match:
+            imports.append(
+                {
+                    'module': match[4],
+                    'self': int(match[1]) / 1_000_000,
+                    'cumulative': int(match[2]) / 1_000_000,
+                    'depth': len(match[3]) // 2,
+                }
+            )
+    return imports
+
+
+def profile_setup():
+    """
+    Boot the application and time the phases of the startup.
+
+    Must run in a fresh interpreter, before Django is set up.
+
+    Returns:
+        dict: Seconds spent in 'django.setup', of it in the 'ready' hook of
+            each app by label, in populating the 'url_resolver' and in
+            loading the 'middleware', and the 'total' since the call.
+    """
+    started = time.perf_counter()
+
+    import django
+    from django.apps import AppConfig
+
+    ready_times = {}
+    create = AppConfig.create.__func__
+
+    def create_timed(cls, entry):
+        app_config = create(cls, entry)
+        ready = app_config.ready
+
+        def ready_timed():
+            ready_started = time.perf_counter()
+            ready()
+            ready_times[app_config.label] = time.perf_counter() - ready_started
+
+        app_config.ready = ready_timed
+        return app_config
+
+    AppConfig.create = classmethod(create_timed)
+    try:
+        setup_started = time.perf_counter()
+        django.setup(set_prefix=False)
+        setup_time = time.perf_counter() - setup_started
+    finally:
+        AppConfig.create = classmethod(create)
+
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.urls import get_resolver
+
+    resolver_started = time.perf_counter()
+    # Imports the URLconf and the views, then builds the reverse lookups
+    get_resolver().reverse_dict  # noqa: B018
+    resolver_time = time.perf_counter() - resolver_started
+
+    middleware_started = time.perf_counter()
+    WSGIHandler()
+    middleware_time = time.perf_counter() - middleware_started
+
+    return {
+        'django.setup': setup_time,
+        'ready': ready_times,
+        'url_resolver': resolver_time,
+        'middleware': middleware_time,
+        'total': time.perf_counter() - started,
+    }
+
+
+if __name__ == '__main__':
+    print(json.dumps(profile_setup()))
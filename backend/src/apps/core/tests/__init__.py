@@ -0,0 +1,7 @@
+from apps.core.tests.test_commands import *
+from apps.core.tests.test_db import *
+from apps.core.tests.test_middleware import *
+from apps.core.tests.test_renderers import *
+from apps.core.tests.test_services import *
+from apps.core.tests.test_throttling import *
+from apps.core.tests.test_views import *
@@ -0,0 +1,2 @@
+from apps.core.tests.test_commands.test_generate_schema import *
+from apps.core.tests.test_commands.test_profile_startup import *
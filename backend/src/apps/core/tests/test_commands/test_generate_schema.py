@@ -0,0 +1,51 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+import orjson
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+from apps.core.services.schema import generate_schema, render_schema
+
+
+class GenerateSchemaCommandTests(SimpleTestCase):
+    """Test suite for the generate_schema management command."""
+
+    def setUp(self):
+        """Set up a temporary schema file path."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / 'v1.yaml'
+
+    def test_generate_and_check(self):
+        """Test that a written schema file passes the check."""
+        call_command('generate_schema', output=str(self.path), stdout=StringIO())
+
+        self.assertTrue(self.path.exists())
+        call_command(
+            'generate_schema', output=str(self.path), check=True, stdout=StringIO()
+        )
+
+    def test_check_reports_drift(self):
+        """Test that the check fails and lists changes of an outdated file."""
+        schema = generate_schema()
+        del schema['paths']['/transactions/']
+        self.path.write_bytes(render_schema(schema, 'yaml'))
+
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command(
+                'generate_schema', output=str(self.path), check=True, stdout=out
+            )
+
+        self.assertIn('Added operation GET /transactions/', out.getvalue())
+
+    def test_json_output(self):
+        """Test that a .json schema file is written as JSON."""
+        path = self.path.with_suffix('.json')
+
+        call_command('generate_schema', output=str(path), stdout=StringIO())
+
+        self.assertEqual(orjson.loads(path.read_bytes()), generate_schema())
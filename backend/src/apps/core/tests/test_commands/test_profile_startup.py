@@ -0,0 +1,50 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+from apps.core.startup import parse_import_times
+
+
+class ProfileStartupCommandTests(SimpleTestCase):
+    """Test suite for the profile_startup management command."""
+
+    def test_parse_import_times(self):
+        """Test that python -X importtime output is parsed in seconds."""
+        lines = [
+            'import time: self [us] | cumulative | imported package',
+            'import time:       250 |        250 |   yaml.error',
+            'import time:      1500 |       1750 | yaml',
+            'Traceback (most recent call last):',
+        ]
+
+        self.assertEqual(
+            parse_import_times(lines),
+            [
+                {
+                    'module': 'yaml.error',
+                    'self': 0.00025,
+                    'cumulative': 0.00025,
+                    'depth': 1,
+                },
+                {'module': 'yaml', 'self': 0.0015, 'cumulative': 0.00175, 'depth': 0},
+            ],
+        )
+
+    def test_profile_startup(self):
+        """Test that the startup phases and the slowest imports are reported."""
+        out = StringIO()
+
+        call_command('profile_startup', top=5, prefix='apps.', stdout=out)
+
+        output = out.getvalue()
+        self.assertIn('django.setup()', output)
+        self.assertIn('URL resolver', output)
+        self.assertIn('Slowest imports (cumulative)', output)
+        self.assertIn('apps.reference', output)
+
+    def test_invalid_top(self):
+        """Test that a non-positive --top is rejected."""
+        with self.assertRaises(CommandError):
+            call_command('profile_startup', top=0)
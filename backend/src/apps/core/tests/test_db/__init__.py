@@ -0,0 +1,2 @@
+from apps.core.tests.test_db.test_prepared import *
+from apps.core.tests.test_db.test_routers import *
@@ -0,0 +1,71 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import SimpleTestCase
+
+from apps.core.db.prepared import (
+    _execute_prepared,
+    prepare_statements,
+    prepared_statements,
+    supports_prepared_statements,
+)
+
+
+class RecordingView:
+    """View stub that records the execute wrappers of its queries."""
+
+    @prepare_statements
+    def get(self, request):
+        return list(connection.execute_wrappers)
+
+
+class PreparedStatementsTests(SimpleTestCase):
+    """Test suite for preparing hot queries."""
+
+    def enable(self, threshold=5):
+        return mock.patch.dict(
+            connection.settings_dict['OPTIONS'],
+            {'server_side_binding': True, 'prepare_threshold': threshold},
+        )
+
+    def test_supports_prepared_statements(self):
+        """Test that preparing requires server-side binding and a threshold."""
+        with mock.patch.dict(connection.settings_dict['OPTIONS'], clear=True):
+            self.assertFalse(supports_prepared_statements(connection))
+        with self.enable(threshold=None):
+            self.assertFalse(supports_prepared_statements(connection))
+        with self.enable():
+            self.assertTrue(supports_prepared_statements(connection))
+
+    def test_disabled_is_noop(self):
+        """Test that queries are executed as usual without prepared statements."""
+        with mock.patch.dict(connection.settings_dict['OPTIONS'], clear=True):
+            self.assertEqual(RecordingView().get(None), [])
+
+    def test_enabled_wraps_queries(self):
+        """Test that the decorator prepares the queries of the view."""
+        with self.enable():
+            self.assertEqual(RecordingView().get(None), [_execute_prepared])
+        self.assertEqual(connection.execute_wrappers, [])
+
+    def test_execute_prepared(self):
+        """Test that only single statements with parameters are prepared."""
+        execute = mock.Mock()
+        context = {'connection': connection, 'cursor': mock.Mock()}
+
+        with mock.patch.object(connection, 'validate_no_broken_transaction'):
+            _execute_prepared(execute, 'SELECT %s', (1,), False, context)
+        context['cursor'].cursor.execute.assert_called_once_with(
+            'SELECT %s', (1,), prepare=True
+        )
+        execute.assert_not_called()
+
+        _execute_prepared(execute, 'SELECT 1; SELECT 2', None, False, context)
+        _execute_prepared(execute, 'INSERT %s', [(1,), (2,)], True, context)
+        self.assertEqual(execute.call_count, 2)
+
+    def test_context_manager_restores_wrappers(self):
+        """Test that the wrappers are removed after the context."""
+        with self.enable(), prepared_statements():
+            self.assertIn(_execute_prepared, connection.execute_wrappers)
+        self.assertNotIn(_execute_prepared, connection.execute_wrappers)
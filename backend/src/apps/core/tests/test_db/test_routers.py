@@ -0,0 +1,146 @@
+from unittest import skipUnless
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.core.db.routers import (
+    PrimaryReplicaRouter,
+    is_primary_sticky,
+    mark_primary_sticky,
+    read_from_replica,
+    use_replica,
+)
+from apps.transactions.models import Transaction
+from apps.transactions.tests.factories import TransactionFactory
+from apps.users.tests.factories import UserFactory
+
+
+class RecordingView:
+    """View stub that records the database chosen for reads."""
+
+    @read_from_replica
+    def get(self, request):
+        return PrimaryReplicaRouter().db_for_read(Transaction)
+
+
+class FakeRequest:
+    def __init__(self, user):
+        self.user = user
+
+
+@override_settings(REPLICA_DATABASE_ALIAS='replica', REPLICA_STICKY_SECONDS=5)
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    """Test suite for the primary/replica database router."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.router = PrimaryReplicaRouter()
+        self.user = UserFactory.build(id=42)
+
+    def test_reads_go_to_primary_by_default(self):
+        """Test that reads outside the replica context use the primary."""
+        self.assertEqual(self.router.db_for_read(Transaction), DEFAULT_DB_ALIAS)
+
+    def test_reads_go_to_replica_in_context(self):
+        """Test that reads inside the replica context use the replica."""
+        with use_replica():
+            self.assertEqual(self.router.db_for_read(Transaction), 'replica')
+        self.assertEqual(self.router.db_for_read(Transaction), DEFAULT_DB_ALIAS)
+
+    def test_writes_always_go_to_primary(self):
+        """Test that writes use the primary even inside the replica context."""
+        with use_replica():
+            self.assertEqual(self.router.db_for_write(Transaction), DEFAULT_DB_ALIAS)
+
+    def test_migrations_only_on_primary(self):
+        """Test that migrations are applied to the primary only."""
+        self.assertTrue(self.router.allow_migrate(DEFAULT_DB_ALIAS, 'transactions'))
+        self.assertFalse(self.router.allow_migrate('replica', 'transactions'))
+
+    @override_settings(REPLICA_DATABASE_ALIAS=None)
+    def test_replica_context_without_replica(self):
+        """Test that the primary is used when no replica is configured."""
+        with use_replica():
+            self.assertEqual(self.router.db_for_read(Transaction), DEFAULT_DB_ALIAS)
+
+    def test_decorated_view_reads_from_replica(self):
+        """Test that decorated view methods read from the replica."""
+        self.assertEqual(RecordingView().get(FakeRequest(self.user)), 'replica')
+
+    def test_decorated_view_for_anonymous_user(self):
+        """Test that anonymous requests read from the replica."""
+        self.assertEqual(RecordingView().get(FakeRequest(AnonymousUser())), 'replica')
+
+    def test_decorated_view_sticks_to_primary_after_write(self):
+        """Test that reads stay on the primary after the user's write."""
+        mark_primary_sticky(self.user.pk)
+
+        self.assertTrue(is_primary_sticky(self.user.pk))
+        self.assertEqual(RecordingView().get(FakeRequest(self.user)), DEFAULT_DB_ALIAS)
+
+    def test_stickiness_is_per_user(self):
+        """Test that another user's write does not pin reads to the primary."""
+        mark_primary_sticky(self.user.pk + 1)
+
+        self.assertFalse(is_primary_sticky(self.user.pk))
+        self.assertEqual(RecordingView().get(FakeRequest(self.user)), 'replica')
+
+
+@skipUnless('replica' in connections, 'Replica database is not configured')
+@override_settings(REPLICA_DATABASE_ALIAS='replica')
+class ReplicaReadIntegrationTests(APITransactionTestCase):
+    """
+    Integration tests with a real replica alias.
+
+    Run with DOCKER_POSTGRES_REPLICA_HOST set; the replica is a test mirror
+    of the primary database, so committed rows are visible through it.
+    """
+
+    databases = {'default', 'replica'} if 'replica' in connections else {'default'}
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.transaction = TransactionFactory(user=self.user)
+        self.url = reverse('transaction-list-create')
+
+    def test_list_reads_from_replica(self):
+        """Test that the transaction list is read from the replica."""
+        with CaptureQueriesContext(connections['replica']) as replica_queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['id'], self.transaction.id)
+        self.assertTrue(replica_queries.captured_queries)
+
+    def test_list_reads_from_primary_after_write(self):
+        """Test that the transaction list is read from the primary after a write."""
+        mark_primary_sticky(self.user.pk)
+
+        with CaptureQueriesContext(connections['replica']) as replica_queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(replica_queries.captured_queries)
+
+    def test_user_detail_reads_from_primary(self):
+        """Test that the authenticated user is loaded from the primary."""
+        self.client.force_authenticate(user=None)
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+        with CaptureQueriesContext(connections['replica']) as replica_queries:
+            response = self.client.get(reverse('user-detail'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(replica_queries.captured_queries)
@@ -0,0 +1,3 @@
+from apps.core.tests.test_middleware.test_compression import *
+from apps.core.tests.test_middleware.test_profiling import *
+from apps.core.tests.test_middleware.test_replica import *
@@ -0,0 +1,128 @@
+import gzip
+import json
+
+import brotli
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.core.middleware.compression import CompressionMiddleware, choose_encoding
+from apps.transactions.tests.factories import TransactionFactory
+from apps.users.tests.factories import UserFactory
+
+PAYLOAD = json.dumps([{'status_name': 'Completed'}] * 200).encode()
+
+
+@override_settings(COMPRESSION_MIN_SIZE=1024)
+class CompressionMiddlewareTests(SimpleTestCase):
+    """Test suite for the response compression middleware."""
+
+    def get_response(self, response, accept_encoding='gzip, br'):
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CompressionMiddleware(lambda _: response)(request)
+
+    def test_choose_encoding(self):
+        """Test negotiation of the encoding from Accept-Encoding."""
+        self.assertEqual(choose_encoding('gzip, deflate, br'), 'br')
+        self.assertEqual(choose_encoding('gzip'), 'gzip')
+        self.assertEqual(choose_encoding('br;q=0.5, gzip;q=0.8'), 'gzip')
+        self.assertEqual(choose_encoding('*'), 'br')
+        self.assertEqual(choose_encoding('*, br;q=0'), 'gzip')
+        self.assertIsNone(choose_encoding('identity'))
+        self.assertIsNone(choose_encoding(''))
+
+    def test_compresses_json_with_brotli(self):
+        """Test that JSON responses are compressed with the preferred encoding."""
+        response = self.get_response(
+            HttpResponse(PAYLOAD, content_type='application/json')
+        )
+
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(brotli.decompress(response.content), PAYLOAD)
+        self.assertEqual(response['Content-Length'], str(len(response.content)))
+        self.assertLess(len(response.content), len(PAYLOAD) / 10)
+
+    def test_compresses_json_with_gzip(self):
+        """Test that gzip is used when the client does not accept brotli."""
+        response = self.get_response(
+            HttpResponse(PAYLOAD, content_type='application/json'), 'gzip'
+        )
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), PAYLOAD)
+
+    def test_weakens_strong_etag(self):
+        """Test that a strong ETag becomes weak for the compressed body."""
+        original = HttpResponse(PAYLOAD, content_type='application/json')
+        original['ETag'] = '"abc"'
+
+        response = self.get_response(original)
+
+        self.assertEqual(response['ETag'], 'W/"abc"')
+
+    def test_skips_small_responses(self):
+        """Test that responses below the size threshold are not compressed."""
+        response = self.get_response(
+            HttpResponse(b'{"id": 1}', content_type='application/json')
+        )
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_skips_other_content_types(self):
+        """Test that non-API content types are not compressed."""
+        response = self.get_response(HttpResponse(PAYLOAD, content_type='image/png'))
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertFalse(response.has_header('Vary'))
+
+    def test_skips_without_accepted_encoding(self):
+        """Test that the response is not compressed if the client does not ask."""
+        response = self.get_response(
+            HttpResponse(PAYLOAD, content_type='application/json'), ''
+        )
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+
+    def test_compresses_streaming_response_per_chunk(self):
+        """Test that every chunk of a streamed response is flushed."""
+        chunks = [b'[', PAYLOAD, b',', PAYLOAD, b']']
+
+        for encoding, decompress in (
+            ('br', brotli.decompress),
+            ('gzip', gzip.decompress),
+        ):
+            response = self.get_response(
+                StreamingHttpResponse(iter(chunks), content_type='application/json'),
+                encoding,
+            )
+            compressed = list(response.streaming_content)
+
+            self.assertEqual(response['Content-Encoding'], encoding)
+            self.assertFalse(response.has_header('Content-Length'))
+            self.assertGreaterEqual(len([c for c in compressed if c]), len(chunks))
+            self.assertEqual(decompress(b''.join(compressed)), b''.join(chunks))
+
+
+class CompressionIntegrationTests(APITestCase):
+    """Test suite for compression of API responses."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        for _ in range(30):
+            TransactionFactory(user=self.user)
+
+    def test_transaction_list_is_compressed(self):
+        """Test that the transaction list is sent compressed."""
+        response = self.client.get(
+            reverse('transaction-list-create'), HTTP_ACCEPT_ENCODING='br'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(len(json.loads(brotli.decompress(response.content))), 30)
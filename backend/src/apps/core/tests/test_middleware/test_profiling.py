@@ -0,0 +1,86 @@
+import os
+import pstats
+import tempfile
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.core.middleware.profiling import PROFILE_FILE_HEADER
+from apps.transactions.tests.factories import TransactionFactory
+from apps.users.tests.factories import UserFactory
+
+
+class ProfilingMiddlewareTests(APITestCase):
+    """Test suite for the on-demand request profiler."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.profile_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.profile_dir.cleanup)
+        override = override_settings(
+            PROFILING_DIR=self.profile_dir.name, PROFILING_SAMPLE_RATE=0
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.staff = UserFactory(is_staff=True)
+        self.url = reverse('transaction-list-create')
+        TransactionFactory(user=self.staff)
+
+    def get(self, mode, user=None):
+        user = user or self.staff
+        return self.client.get(
+            self.url,
+            HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}',
+            HTTP_X_PROFILE=mode,
+        )
+
+    def read_profile(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        name = response[PROFILE_FILE_HEADER]
+        self.assertEqual(os.listdir(self.profile_dir.name), [name])
+        return os.path.join(self.profile_dir.name, name)
+
+    def test_cprofile(self):
+        """Test that a pstats file of the request is written."""
+        path = self.read_profile(self.get('cprofile'))
+
+        self.assertTrue(path.endswith('.prof'))
+        self.assertIn('-cprofile-get-v1-transactions-', path)
+        self.assertTrue(pstats.Stats(path).total_calls)
+
+    def test_tracemalloc(self):
+        """Test that the allocations of the request are reported."""
+        with open(self.read_profile(self.get('tracemalloc'))) as file:
+            self.assertTrue(file.read().startswith('Peak traced memory:'))
+
+    def test_sql(self):
+        """Test that the queries of the request are logged with timings."""
+        with open(self.read_profile(self.get('SQL'))) as file:
+            report = file.read()
+
+        self.assertRegex(report, r'^\d+ queries in [\d.]+ ms')
+        self.assertIn('-- #1 default', report)
+        self.assertIn('transactions_transaction', report)
+
+    def test_not_profiled_for_other_users(self):
+        """Test that only staff users may profile requests."""
+        user = UserFactory()
+
+        for response in (self.get('cprofile', user), self.get('unknown')):
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn(PROFILE_FILE_HEADER, response)
+        self.assertEqual(os.listdir(self.profile_dir.name), [])
+
+    @override_settings(PROFILING_SAMPLE_RATE=1, PROFILING_SAMPLE_MODE='sql')
+    def test_sampled_requests(self):
+        """Test that sampled requests are profiled without telling the client."""
+        with self.assertLogs('apps.core.middleware.profiling', 'INFO'):
+            response = self.client.get(self.url)
+
+        self.assertNotIn(PROFILE_FILE_HEADER, response)
+        [name] = os.listdir(self.profile_dir.name)
+        self.assertTrue(name.endswith('.sql'))
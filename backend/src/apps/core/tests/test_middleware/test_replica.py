@@ -0,0 +1,60 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.core.db.routers import is_primary_sticky
+from apps.reference.tests.factories import (
+    CategoryFactory,
+    StatusFactory,
+    TransactionTypeFactory,
+)
+from apps.transactions.tests.factories import TransactionFactory
+from apps.users.tests.factories import UserFactory
+
+
+class PrimaryStickyMiddlewareTests(APITestCase):
+    """Test suite for the read-after-write primary stickiness middleware."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.status = StatusFactory()
+        self.transaction_type = TransactionTypeFactory()
+        self.category = CategoryFactory(transaction_type=self.transaction_type)
+
+    def test_successful_write_marks_user_sticky(self):
+        """Test that a successful write pins the user's reads to the primary."""
+        data = {
+            'status_id': self.status.id,
+            'transaction_type_id': self.transaction_type.id,
+            'category_id': self.category.id,
+            'amount': '10.00',
+        }
+
+        response = self.client.post(
+            reverse('transaction-list-create'), data, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(is_primary_sticky(self.user.pk))
+
+    def test_failed_write_does_not_mark_user_sticky(self):
+        """Test that a rejected write does not pin reads to the primary."""
+        response = self.client.post(
+            reverse('transaction-list-create'), {}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(is_primary_sticky(self.user.pk))
+
+    def test_read_does_not_mark_user_sticky(self):
+        """Test that reads do not pin the user to the primary."""
+        TransactionFactory(user=self.user)
+
+        response = self.client.get(reverse('transaction-list-create'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(is_primary_sticky(self.user.pk))
@@ -0,0 +1,2 @@
+from apps.core.tests.test_renderers.test_json import *
+from apps.core.tests.test_renderers.test_msgpack import *
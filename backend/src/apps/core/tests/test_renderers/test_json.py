@@ -0,0 +1,72 @@
+import uuid
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from io import BytesIO
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.parsers import ORJSONParser
+from apps.core.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """Test suite for the orjson renderer."""
+
+    def assertRendersLikeJSONRenderer(self, data):
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_renders_like_json_renderer(self):
+        """Test that the output is byte-identical to DRF's JSONRenderer."""
+        self.assertRendersLikeJSONRenderer(
+            {
+                'id': 1,
+                'amount': '10.50',
+                'comment': 'Кофе',
+                'items': [None, True, 1.5],
+                'created_at': datetime(2025, 6, 1, 12, 30, 15, 123, UTC),
+                'date': date(2025, 6, 1),
+                'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            }
+        )
+
+    def test_renders_decimal_as_today(self):
+        """Test that Decimal values are serialized like DRF's encoder does."""
+        self.assertRendersLikeJSONRenderer({'amount': Decimal('10.50')})
+        self.assertEqual(
+            ORJSONRenderer().render({'amount': Decimal('10.50')}), b'{"amount":10.5}'
+        )
+
+    def test_renders_types_unsupported_by_orjson(self):
+        """Test that types unknown to orjson fall back to DRF's encoder."""
+        self.assertRendersLikeJSONRenderer(
+            {'label': gettext_lazy('Amount'), 'period': timedelta(minutes=1)}
+        )
+
+    def test_renders_none_as_empty(self):
+        """Test that empty data renders an empty body."""
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_renders_indented(self):
+        """Test that the indent media type parameter pretty-prints the output."""
+        content = ORJSONRenderer().render({'id': 1}, 'application/json; indent=4')
+
+        self.assertEqual(content, b'{\n  "id": 1\n}')
+
+
+class ORJSONParserTests(SimpleTestCase):
+    """Test suite for the orjson parser."""
+
+    def test_parses_json(self):
+        """Test that a JSON body is parsed."""
+        data = ORJSONParser().parse(BytesIO(b'{"amount": "10.50", "ids": [1, 2]}'))
+
+        self.assertEqual(data, {'amount': '10.50', 'ids': [1, 2]})
+
+    def test_rejects_invalid_json(self):
+        """Test that invalid JSON raises a parse error."""
+        for content in (b'{"amount":', b'{"amount": NaN}'):
+            with self.assertRaises(ParseError):
+                ORJSONParser().parse(BytesIO(content))
@@ -0,0 +1,60 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+from io import BytesIO
+
+import msgpack
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+
+from apps.core.parsers import MessagePackParser
+from apps.core.renderers import MessagePackRenderer
+
+
+class MessagePackRendererTests(SimpleTestCase):
+    """Test suite for the MessagePack renderer."""
+
+    def test_renders_msgpack(self):
+        """Test that data is serialized to MessagePack."""
+        content = MessagePackRenderer().render(
+            {
+                'id': 1,
+                'amount': Decimal('10.50'),
+                'created_at': datetime(2025, 6, 1, 12, 30, tzinfo=UTC),
+                'comment': None,
+            }
+        )
+
+        self.assertEqual(
+            msgpack.unpackb(content),
+            {
+                'id': 1,
+                'amount': '10.50',
+                'created_at': '2025-06-01T12:30:00Z',
+                'comment': None,
+            },
+        )
+
+    def test_renders_none_as_empty(self):
+        """Test that empty data renders an empty body."""
+        self.assertEqual(MessagePackRenderer().render(None), b'')
+
+
+class MessagePackParserTests(SimpleTestCase):
+    """Test suite for the MessagePack parser."""
+
+    def test_parses_msgpack(self):
+        """Test that a MessagePack body is parsed."""
+        content = msgpack.packb({'amount': '10.50', 'ids': [1, 2]})
+
+        self.assertEqual(
+            MessagePackParser().parse(BytesIO(content)),
+            {'amount': '10.50', 'ids': [1, 2]},
+        )
+
+    def test_rejects_invalid_msgpack(self):
+        """Test that an invalid body raises a parse error."""
+        with self.assertRaises(ParseError):
+            MessagePackParser().parse(BytesIO(b'\xc1'))
+
+        with self.assertRaises(ParseError):
+            MessagePackParser().parse(BytesIO(msgpack.packb([1, 2])[:1]))
@@ -0,0 +1,3 @@
+from apps.core.tests.test_services.test_database import *
+from apps.core.tests.test_services.test_schema import *
+from apps.core.tests.test_services.test_warmup import *
@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from django.db import connections
+from django.test import TestCase
+
+from apps.core.services.database import get_all_pool_stats, get_pool_stats
+
+
+class DatabasePoolStatsServiceTests(TestCase):
+    """Test suite for database pool statistics services."""
+
+    def test_get_pool_stats_without_pool(self):
+        """Test that pool statistics are None when pooling is disabled."""
+        with patch.object(
+            type(connections['default']), 'pool', new_callable=PropertyMock
+        ) as pool:
+            pool.return_value = None
+            self.assertIsNone(get_pool_stats('default'))
+
+    def test_get_pool_stats_with_pool(self):
+        """Test that pool statistics include the average wait time."""
+        fake_pool = MagicMock()
+        fake_pool.get_stats.return_value = {
+            'pool_min': 2,
+            'pool_max': 10,
+            'requests_num': 4,
+            'requests_wait_ms': 10,
+        }
+
+        with patch.object(
+            type(connections['default']), 'pool', new_callable=PropertyMock
+        ) as pool:
+            pool.return_value = fake_pool
+            stats = get_pool_stats('default')
+
+        self.assertEqual(stats['pool_max'], 10)
+        self.assertEqual(stats['requests_wait_avg_ms'], 2.5)
+
+    def test_get_pool_stats_without_requests(self):
+        """Test that the average wait time is zero before any requests."""
+        fake_pool = MagicMock()
+        fake_pool.get_stats.return_value = {'pool_min': 2, 'pool_max': 10}
+
+        with patch.object(
+            type(connections['default']), 'pool', new_callable=PropertyMock
+        ) as pool:
+            pool.return_value = fake_pool
+            stats = get_pool_stats('default')
+
+        self.assertEqual(stats['requests_wait_avg_ms'], 0.0)
+
+    def test_get_all_pool_stats(self):
+        """Test that statistics are reported for every database alias."""
+        stats = get_all_pool_stats()
+
+        self.assertIn('pid', stats)
+        self.assertEqual(set(stats['databases']), set(connections))
@@ -0,0 +1,89 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.services import schema as schema_services
+from apps.core.services.schema import (
+    clear_schema_cache,
+    diff_schema,
+    generate_schema,
+    get_schema,
+    render_schema,
+)
+
+
+class SchemaServiceTests(SimpleTestCase):
+    """Test suite for the precomputed OpenAPI schema services."""
+
+    def setUp(self):
+        """Start every test with an empty schema cache."""
+        clear_schema_cache()
+        self.addCleanup(clear_schema_cache)
+
+    def test_generate_schema(self):
+        """Test that the generated schema documents the API without a request."""
+        schema = generate_schema()
+
+        self.assertEqual(schema['info']['title'], 'Money Flow API')
+        self.assertEqual(schema['basePath'], '/v1')
+        self.assertIn('/transactions/', schema['paths'])
+
+    @override_settings(DOCS_SCHEMA_FILE=None)
+    def test_get_schema_generates_once(self):
+        """Test that the schema is generated once for all formats."""
+        with patch.object(
+            schema_services, 'generate_schema', return_value={'swagger': '2.0'}
+        ) as generate:
+            content, etag = get_schema('json')
+            self.assertEqual(get_schema('json'), (content, etag))
+            yaml_content, yaml_etag = get_schema('yaml')
+
+        generate.assert_called_once()
+        self.assertEqual(orjson.loads(content), {'swagger': '2.0'})
+        self.assertEqual(yaml_content, b"swagger: '2.0'\n")
+        self.assertNotEqual(etag, yaml_etag)
+
+    def test_get_schema_from_file(self):
+        """Test that the schema is read from the schema file instead of generated."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'v1.yaml'
+            path.write_bytes(render_schema({'swagger': '2.0', 'paths': {}}, 'yaml'))
+
+            with (
+                override_settings(DOCS_SCHEMA_FILE=str(path)),
+                patch.object(schema_services, 'generate_schema') as generate,
+            ):
+                content, _ = get_schema('json')
+
+        generate.assert_not_called()
+        self.assertEqual(orjson.loads(content), {'swagger': '2.0', 'paths': {}})
+
+    def test_diff_schema(self):
+        """Test that changed operations, definitions and fields are reported."""
+        old = {
+            'host': 'api.localhost',
+            'paths': {'/a/': {'get': {'summary': 'A'}, 'parameters': []}},
+            'definitions': {'A': {'type': 'object'}},
+        }
+        new = {
+            'host': 'api.example.com',
+            'paths': {
+                '/a/': {'get': {'summary': 'Changed'}, 'parameters': []},
+                '/b/': {'post': {'summary': 'B'}},
+            },
+            'definitions': {},
+        }
+
+        self.assertEqual(
+            diff_schema(old, new),
+            [
+                'Added operation POST /b/',
+                'Changed field host',
+                'Changed operation GET /a/',
+                'Removed definition A',
+            ],
+        )
+        self.assertEqual(diff_schema(new, new), [])
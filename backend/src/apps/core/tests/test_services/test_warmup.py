@@ -0,0 +1,76 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.core.services import warmup
+from apps.core.services.warmup import (
+    get_view_classes,
+    get_worker_stats,
+    instantiate_serializers,
+    record_request,
+    warm_up,
+)
+from apps.reference.registry import clear_reference_ids
+from apps.reference.views.bundle import ReferenceBundleView
+from apps.transactions.views import TransactionListCreateView
+
+
+class WarmupServiceTests(TestCase):
+    """Test suite for the worker warm-up services."""
+
+    def setUp(self):
+        """Start every test with fresh worker statistics and caches."""
+        cache.clear()
+        warmup._worker.clear()
+        self.addCleanup(warmup._worker.clear)
+        self.addCleanup(clear_reference_ids)
+
+    def test_get_view_classes(self):
+        """Test that view classes of nested URL patterns are collected once."""
+        view_classes = get_view_classes()
+
+        self.assertIn(ReferenceBundleView, view_classes)
+        self.assertIn(TransactionListCreateView, view_classes)
+        self.assertEqual(len(view_classes), len(set(view_classes)))
+
+    def test_instantiate_serializers(self):
+        """Test that the serializer classes of the views are instantiated."""
+        self.assertGreater(instantiate_serializers(), 10)
+
+    def test_warm_up(self):
+        """Test that every step is timed and recorded for the worker."""
+        timings = warm_up()
+
+        self.assertEqual(
+            list(timings),
+            [
+                'open_database_connections',
+                'resolve_url_patterns',
+                'prime_reference_cache',
+                'instantiate_serializers',
+                'total',
+            ],
+        )
+        self.assertEqual(get_worker_stats()['warmup_ms'], timings)
+
+    def test_record_request(self):
+        """Test that only the first request latency is kept."""
+        record_request('/v1/reference/', 0.0125)
+        record_request('/v1/transactions/', 0.002)
+
+        stats = get_worker_stats()
+        self.assertEqual(stats['first_request_ms'], 12.5)
+        self.assertEqual(stats['first_request_path'], '/v1/reference/')
+        self.assertEqual(stats['requests'], 2)
+
+    def test_forked_worker_starts_fresh(self):
+        """Test that statistics inherited from another process are reset."""
+        record_request('/v1/reference/', 0.0125)
+
+        with patch.object(warmup.os, 'getpid', return_value=-1):
+            stats = get_worker_stats()
+
+        self.assertEqual(stats['pid'], -1)
+        self.assertIsNone(stats['first_request_ms'])
+        self.assertEqual(stats['requests'], 0)
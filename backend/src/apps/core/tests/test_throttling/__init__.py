@@ -0,0 +1 @@
+from apps.core.tests.test_throttling.test_token_bucket import *
@@ -0,0 +1,167 @@
+import os
+import tempfile
+
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.core.throttling import TokenBucketStore, get_token_bucket_store, parse_rate
+from apps.users.models import User
+from apps.users.tests.factories import UserFactory
+
+
+class TokenBucketStoreTests(SimpleTestCase):
+    """Test suite for the shared memory token bucket store."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'buckets')
+        self.store = TokenBucketStore(self.path, 64)
+
+    def test_parse_rate(self):
+        """Test parsing of '<requests>/<period>' rates."""
+        self.assertEqual(parse_rate('10/min'), (10, 60))
+        self.assertEqual(parse_rate('5/hour'), (5, 3600))
+        self.assertEqual(parse_rate('1/s'), (1, 1))
+
+    def test_consume_until_empty(self):
+        """Test that a bucket allows bursts up to its capacity."""
+        results = [self.store.consume('key', 3, 1.0, now=100) for _ in range(4)]
+
+        self.assertEqual([allowed for allowed, _ in results], [True] * 3 + [False])
+        self.assertAlmostEqual(results[-1][1], 1.0)
+
+    def test_consume_refills(self):
+        """Test that tokens are added at the refill rate up to the capacity."""
+        for _ in range(2):
+            self.store.consume('key', 2, 0.5, now=100)
+
+        self.assertFalse(self.store.consume('key', 2, 0.5, now=101)[0])
+        self.assertTrue(self.store.consume('key', 2, 0.5, now=102)[0])
+        # A long pause does not exceed the capacity
+        results = [self.store.consume('key', 2, 0.5, now=1000) for _ in range(3)]
+        self.assertEqual([allowed for allowed, _ in results], [True, True, False])
+
+    def test_keys_are_independent(self):
+        """Test that every key has its own bucket."""
+        self.store.consume('a', 1, 1.0, now=100)
+
+        self.assertFalse(self.store.consume('a', 1, 1.0, now=100)[0])
+        self.assertTrue(self.store.consume('b', 1, 1.0, now=100)[0])
+
+    def test_full_table_replaces_oldest_bucket(self):
+        """Test that more keys than slots replace the least recent buckets."""
+        for index in range(200):
+            self.store.consume(f'key-{index}', 1, 1.0, now=index)
+
+        self.assertTrue(self.store.consume('key-0', 1, 1.0, now=200)[0])
+        self.assertFalse(self.store.consume('key-0', 1, 1.0, now=200)[0])
+
+    def test_buckets_shared_between_processes(self):
+        """Test that a forked worker and its parent see the same buckets."""
+        with override_settings(THROTTLE_STORE_PATH=self.path, THROTTLE_STORE_SLOTS=64):
+            get_token_bucket_store().consume('shared', 2, 0.001)
+
+            pid = os.fork()
+            if pid == 0:
+                try:
+                    get_token_bucket_store().consume('shared', 2, 0.001)
+                finally:
+                    os._exit(0)
+            os.waitpid(pid, 0)
+
+            self.assertFalse(get_token_bucket_store().consume('shared', 2, 0.001)[0])
+
+    def test_clear(self):
+        """Test that clearing the store refills all buckets."""
+        self.store.consume('key', 1, 1.0, now=100)
+        self.store.clear()
+
+        self.assertTrue(self.store.consume('key', 1, 1.0, now=100)[0])
+
+
+class ThrottledViewsTests(APITestCase):
+    """Test suite for the throttled login and transaction endpoints."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        rates = {'login': '2/min', 'transaction_create': '1/min'}
+        override = override_settings(
+            THROTTLE_ENABLED=True,
+            THROTTLE_STORE_PATH=os.path.join(directory.name, 'buckets'),
+            REST_FRAMEWORK={
+                **settings.REST_FRAMEWORK,
+                'DEFAULT_THROTTLE_RATES': rates,
+            },
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.login_url = reverse('user-login')
+        self.password = 'S3cret-password'
+        self.user = User.objects.create_user(
+            email='throttled@example.com', password=self.password
+        )
+
+    def login(self, email, password='wrong', ip='10.0.0.1', **headers):
+        return self.client.post(
+            self.login_url,
+            {'email': email, 'password': password},
+            format='json',
+            REMOTE_ADDR=ip,
+            **headers,
+        )
+
+    def test_login_throttled_by_ip(self):
+        """Test that bursts of logins from one IP are throttled."""
+        self.assertEqual(self.login('a@example.com').status_code, 401)
+        self.assertEqual(self.login('b@example.com').status_code, 401)
+
+        response = self.login(self.user.email, self.password)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn(int(response['Retry-After']), range(1, 31))
+
+    def test_login_throttled_by_ip_behind_proxy(self):
+        """Test that spoofed X-Forwarded-For addresses share the client bucket."""
+        # The proxy appends the address of the client to the header it received
+        for spoofed in ['1.1.1.1', '2.2.2.2', '3.3.3.3']:
+            response = self.login(
+                f'{spoofed}@example.com',
+                ip='172.18.0.2',
+                HTTP_X_FORWARDED_FOR=f'{spoofed}, 10.0.0.1',
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        response = self.login(
+            'other@example.com', ip='172.18.0.2', HTTP_X_FORWARDED_FOR='10.0.0.2'
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_login_throttled_by_email(self):
+        """Test that guessing the password of one email from many IPs is throttled."""
+        for ip in ['10.0.0.1', '10.0.0.2']:
+            self.assertEqual(self.login(self.user.email, ip=ip).status_code, 401)
+
+        response = self.login(self.user.email, self.password, ip='10.0.0.3')
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        response = self.login('other@example.com', ip='10.0.0.4')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_transaction_create_throttled_per_user(self):
+        """Test that only transaction creation is throttled, per user."""
+        url = reverse('transaction-list-create')
+        self.client.force_authenticate(user=UserFactory())
+
+        self.assertEqual(self.client.post(url, {}, format='json').status_code, 400)
+        self.assertEqual(self.client.post(url, {}, format='json').status_code, 429)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=UserFactory())
+        self.assertEqual(self.client.post(url, {}, format='json').status_code, 400)
@@ -0,0 +1,2 @@
+from apps.core.tests.test_views.test_docs_views import *
+from apps.core.tests.test_views.test_metrics_views import *
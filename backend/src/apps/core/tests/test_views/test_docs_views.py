@@ -0,0 +1,53 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.core.services.schema import clear_schema_cache
+
+
+@override_settings(DOCS_SCHEMA_FILE=None)
+class DocsSchemaViewTests(APITestCase):
+    """Test suite for the API documentation endpoints."""
+
+    def setUp(self):
+        """Start every test with an empty schema cache."""
+        clear_schema_cache()
+        self.addCleanup(clear_schema_cache)
+        self.url = reverse('docs-ui-v1')
+
+    def test_get_openapi_schema(self):
+        """Test that the schema is served with an ETag."""
+        response = self.client.get(self.url, {'format': 'openapi'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response['Content-Type'], 'application/openapi+json; charset=utf-8'
+        )
+        self.assertIn('/transactions/', response.json()['paths'])
+        self.assertTrue(response.has_header('ETag'))
+
+    def test_not_modified(self):
+        """Test that a matching If-None-Match gets 304 without a body."""
+        etag = self.client.get(self.url, {'format': 'openapi'})['ETag']
+
+        response = self.client.get(
+            self.url, {'format': 'openapi'}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+    def test_get_yaml_schema(self):
+        """Test that the YAML document is served from the format suffix route."""
+        response = self.client.get(reverse('docs-file-v1', kwargs={'format': '.yaml'}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.content.startswith(b'swagger:'))
+
+    def test_get_ui(self):
+        """Test that the Swagger UI page is still rendered."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/html; charset=utf-8')
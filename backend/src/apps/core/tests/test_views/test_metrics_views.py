@@ -0,0 +1,69 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.users.tests.factories import UserFactory
+
+
+class DatabasePoolMetricsViewTests(APITestCase):
+    """Test suite for the database pool metrics endpoint."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.url = reverse('metrics-db-pool')
+        self.admin = UserFactory(is_staff=True)
+        self.user = UserFactory()
+
+    def test_admin_can_get_pool_metrics(self):
+        """Test that admin users receive pool statistics."""
+        self.client.force_authenticate(user=self.admin)
+        self.client.get(self.url)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('pid', response.data)
+        self.assertIn('default', response.data['databases'])
+
+    def test_regular_user_forbidden(self):
+        """Test that regular users cannot access pool statistics."""
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_unauthenticated_access(self):
+        """Test that unauthenticated requests are rejected."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class WorkerMetricsViewTests(APITestCase):
+    """Test suite for the worker metrics endpoint."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.url = reverse('metrics-worker')
+        self.admin = UserFactory(is_staff=True)
+
+    def test_admin_can_get_worker_metrics(self):
+        """Test that the first request of the worker has been recorded."""
+        self.client.force_authenticate(user=self.admin)
+        self.client.get(self.url)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('pid', response.data)
+        self.assertIsNotNone(response.data['first_request_ms'])
+        self.assertGreaterEqual(response.data['requests'], 1)
+
+    def test_regular_user_forbidden(self):
+        """Test that regular users cannot access worker metrics."""
+        self.client.force_authenticate(user=UserFactory())
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
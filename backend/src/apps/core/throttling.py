@@ -0,0 +1,242 @@
+"""
+Token bucket throttling shared between the worker processes of a host.
+
+The buckets live in a memory-mapped file (in /dev/shm by default), so every
+gunicorn worker sees the same buckets and a check costs a file lock and a few
+struct reads instead of a cache round trip.
+"""
+
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import time
+
+from django.conf import settings
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+# Stores opened by the current process, reopened after a fork: a lock taken
+# on a file descriptor inherited from the master would not exclude siblings
+_stores = {}
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate: str):
+    """
+    Parse a throttle rate like '10/min'.
+
+    Args:
+        rate (str): '<requests>/<period>', the period starts with s, m, h or d.
+
+    Returns:
+        tuple[int, int]: The number of requests and the period in seconds.
+    """
+    requests, period = rate.split('/')
+    return int(requests), PERIODS[period[0]]
+
+
+class TokenBucketStore:
+    """
+    Fixed-size hash table of token buckets in a shared memory-mapped file.
+
+    Every slot holds the 64-bit hash of a key, the tokens left and the time of
+    the last update. A key is looked up in a few slots from its hash; when
+    all of them are taken, the least recently updated bucket is replaced,
+    which lets that key start over with a full bucket.
+    """
+
+    SLOT = struct.Struct('=Qdd')
+    PROBES = 8
+
+    def __init__(self, path: str, slots: int):
+        self.path = path
+        self.slots = slots
+        size = self.SLOT.size * slots
+
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self.fd).st_size < size:
+                os.ftruncate(self.fd, size)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        self.map = mmap.mmap(self.fd, size)
+
+    def consume(self, key: str, capacity: int, refill_rate: float, now: float = None):
+        """
+        Take a token from the bucket of a key.
+
+        Args:
+            key (str): The bucket key.
+            capacity (int): The maximum number of tokens, a new bucket is full.
+            refill_rate (float): Tokens added per second.
+            now (float, optional): The current time, defaults to time.time().
+
+        Returns:
+            tuple[bool, float]: Whether a token was taken and the seconds
+                until the next token is available.
+        """
+        now = time.time() if now is None else now
+        key_hash = int.from_bytes(
+            hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little'
+        )
+        # Zero marks empty slots
+        key_hash = key_hash or 1
+        first = key_hash % self.slots
+
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            slot = None
+            tokens = float(capacity)
+            oldest = None
+            for probe in range(self.PROBES):
+                index = (first + probe) % self.slots
+                slot_hash, slot_tokens, updated_at = self.SLOT.unpack_from(
+                    self.map, index * self.SLOT.size
+                )
+                if slot_hash == key_hash:
+                    slot = index
+                    tokens = min(
+                        capacity, slot_tokens + (now - updated_at) * refill_rate
+                    )
+                    break
+                if slot_hash == 0:
+                    oldest = (index, float('-inf'))
+                elif oldest is None or updated_at < oldest[1]:
+                    oldest = (index, updated_at)
+            if slot is None:
+                slot = oldest[0]
+
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self.SLOT.pack_into(self.map, slot * self.SLOT.size, key_hash, tokens, now)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+        wait = 0.0 if tokens >= 1 else (1 - tokens) / refill_rate
+        return allowed, wait
+
+    def clear(self):
+        """
+        Drop all buckets.
+        """
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            self.map[:] = bytes(len(self.map))
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+
+def get_token_bucket_store():
+    """
+    Get the token bucket store configured by the THROTTLE_STORE_* settings.
+
+    Returns:
+        TokenBucketStore: The store, opened once per process.
+    """
+    key = (os.getpid(), settings.THROTTLE_STORE_PATH, settings.THROTTLE_STORE_SLOTS)
+    if key not in _stores:
+        _stores[key] = TokenBucketStore(
+            settings.THROTTLE_STORE_PATH, settings.THROTTLE_STORE_SLOTS
+        )
+    return _stores[key]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Throttles requests with token buckets shared between worker processes.
+
+    The rate of the scope is read from DEFAULT_THROTTLE_RATES in the
+    '<requests>/<period>' format of SimpleRateThrottle: the bucket holds up
+    to <requests> tokens and refills at <requests> per <period>, allowing
+    short bursts. A request takes a token from the bucket of every key
+    returned by get_keys and is throttled if any of them is empty.
+    """
+
+    scope = None
+    # Methods that are throttled, None throttles all of them
+    methods = None
+
+    def __init__(self):
+        self.wait_time = None
+
+    def get_keys(self, request, view):
+        """
+        Get the keys of the buckets a request takes tokens from.
+
+        Returns:
+            list[str]: The bucket keys, the client IP by default.
+        """
+        return [f'ip:{self.get_ident(request)}']
+
+    def allow_request(self, request, view):
+        if not settings.THROTTLE_ENABLED:
+            return True
+        if self.methods is not None and request.method not in self.methods:
+            return True
+
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+        if rate is None:
+            return True
+        capacity, duration = parse_rate(rate)
+
+        store = get_token_bucket_store()
+        for key in self.get_keys(request, view):
+            allowed, wait = store.consume(
+                f'{self.scope}:{key}', capacity, capacity / duration
+            )
+            if not allowed:
+                self.wait_time = wait
+                return False
+        return True
+
+    def wait(self):
+        return self.wait_time
+
+
+class LoginThrottle(TokenBucketThrottle):
+    """
+    Throttles logins by client IP and by the email tried.
+    """
+
+    scope = 'login'
+
+    def get_keys(self, request, view):
+        keys = super().get_keys(request, view)
+        email = request.data.get('email') if hasattr(request.data, 'get') else None
+        if isinstance(email, str) and email:
+            keys.append(f'email:{email.strip().lower()}')
+        return keys
+
+
+class RegisterThrottle(LoginThrottle):
+    """
+    Throttles registrations by client IP and by the email registered.
+    """
+
+    scope = 'register'
+
+
+class UserWriteThrottle(TokenBucketThrottle):
+    """
+    Throttles writes by the authenticated user, or the client IP.
+    """
+
+    methods = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+    def get_keys(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return [f'user:{request.user.pk}']
+        return super().get_keys(request, view)
+
+
+class TransactionCreateThrottle(UserWriteThrottle):
+    scope = 'transaction_create'
+
+
+class BulkThrottle(UserWriteThrottle):
+    scope = 'bulk'
@@ -0,0 +1 @@
+from apps.core.urls.base import *
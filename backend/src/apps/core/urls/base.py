@@ -0,0 +1,7 @@
+from apps.core.urls.metrics import metrics_patterns
+
+__all__ = ['urlpatterns']
+
+urlpatterns = [
+    *metrics_patterns,
+]
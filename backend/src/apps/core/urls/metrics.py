@@ -0,0 +1,24 @@
+from django.urls import include, path
+
+from apps.core.views.metrics import DatabasePoolMetricsView, WorkerMetricsView
+
+metrics_patterns = [
+    path(
+        'metrics/',
+        include(
+            [
+                path(
+                    'db-pool/',
+                    DatabasePoolMetricsView.as_view(),
+                    name='metrics-db-pool',
+                ),
+                path(
+                    'worker/',
+                    WorkerMetricsView.as_view(),
+                    name='metrics-worker',
+                ),
+            ]
+        ),
+        name='metrics',
+    )
+]
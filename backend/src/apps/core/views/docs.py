@@ -0,0 +1,35 @@
+from functools import cache
+
+from django.views.decorators.csrf import csrf_exempt
+
+
+@cache
+def get_docs_view(ui: bool):
+    """
+    Build the docs view on the first docs request.
+
+    The drf_yasg views, schema generators and codecs are imported here rather
+    than with the URLconf, so they stay off the worker boot path.
+
+    Args:
+        ui (bool): Whether the view renders the Swagger UI page besides the
+            schema documents.
+
+    Returns:
+        callable: The docs view.
+    """
+    from apps.core.views.schema import DocsSchemaView
+
+    if ui:
+        return DocsSchemaView.with_ui('swagger', cache_timeout=0)
+    return DocsSchemaView.without_ui(cache_timeout=0)
+
+
+@csrf_exempt
+def docs_ui_view(request, *args, **kwargs):
+    return get_docs_view(ui=True)(request, *args, **kwargs)
+
+
+@csrf_exempt
+def docs_file_view(request, *args, **kwargs):
+    return get_docs_view(ui=False)(request, *args, **kwargs)
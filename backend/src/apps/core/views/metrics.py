@@ -0,0 +1,96 @@
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from apps.core.services.database import get_all_pool_stats
+from apps.core.services.warmup import get_worker_stats
+
+
+class DatabasePoolMetricsView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_summary='Get database pool metrics',
+        operation_description='Returns connection pool statistics (pool size, '
+        'wait time, timeouts) of the worker process that served the request. '
+        'Requires admin privileges.',
+        security=[{'Bearer': []}],
+        responses={
+            200: openapi.Response(
+                description='Pool statistics per database alias',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'pid': openapi.Schema(type=openapi.TYPE_INTEGER),
+                        'databases': openapi.Schema(
+                            type=openapi.TYPE_OBJECT,
+                            example={
+                                'default': {
+                                    'pool_min': 2,
+                                    'pool_max': 10,
+                                    'pool_size': 4,
+                                    'pool_available': 3,
+                                    'requests_num': 1520,
+                                    'requests_wait_ms': 310,
+                                    'requests_wait_avg_ms': 0.204,
+                                }
+                            },
+                        ),
+                    },
+                ),
+            ),
+            401: openapi.Response(
+                description='Authentication credentials not provided'
+            ),
+            403: openapi.Response(description='Admin privileges required'),
+        },
+    )
+    def get(self, request: Request):
+        return Response(get_all_pool_stats(), status=status.HTTP_200_OK)
+
+
+class WorkerMetricsView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_summary='Get worker metrics',
+        operation_description='Returns warm-up timings, the latency of the first '
+        'request and the number of requests of the worker process that served '
+        'the request. Requires admin privileges.',
+        security=[{'Bearer': []}],
+        responses={
+            200: openapi.Response(
+                description='Statistics of the worker process',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    example={
+                        'pid': 42,
+                        'started_at': 1750000000.0,
+                        'warmup_ms': {
+                            'open_database_connections': 4.1,
+                            'resolve_url_patterns': 0.2,
+                            'prime_reference_cache': 6.3,
+                            'instantiate_serializers': 2.5,
+                            'total': 13.1,
+                        },
+                        'first_request_ms': 8.7,
+                        'first_request_path': '/v1/transactions/',
+                        'requests': 1520,
+                    },
+                ),
+            ),
+            401: openapi.Response(
+                description='Authentication credentials not provided'
+            ),
+            403: openapi.Response(description='Admin privileges required'),
+        },
+    )
+    def get(self, request: Request):
+        return Response(get_worker_stats(), status=status.HTTP_200_OK)
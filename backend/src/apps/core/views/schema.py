@@ -0,0 +1,40 @@
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from rest_framework.request import Request
+
+from apps.core.services.schema import get_schema
+from config.yasg import docs_schema_view_v1
+
+# Formats of the spec renderers and the schema format each of them serves
+SPEC_FORMATS = {'openapi': 'json', 'json': 'json', 'yaml': 'yaml'}
+
+
+class DocsSchemaView(docs_schema_view_v1):
+    """
+    Schema view serving the schema precomputed once per process.
+
+    The Swagger UI page is rendered by drf_yasg, the schema documents are
+    served from get_schema as static bytes with an ETag.
+    """
+
+    def get(self, request: Request, version='', format=None):
+        renderer = request.accepted_renderer
+        # The docs.json and docs.yaml routes use renderers with a '.' prefixed
+        # format
+        renderer_format = renderer.format.removeprefix('.')
+        if renderer_format not in SPEC_FORMATS:
+            return super().get(request, version, format)
+
+        content, etag = get_schema(SPEC_FORMATS[renderer_format])
+
+        if_none_match = request.headers.get('If-None-Match', '')
+        if etag in if_none_match or if_none_match == '*':
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(
+                content, content_type=f'{renderer.media_type}; charset=utf-8'
+            )
+
+        response['ETag'] = etag
+        patch_cache_control(response, no_cache=True)
+        return response
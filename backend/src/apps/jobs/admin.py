@@ -0,0 +1,23 @@
+from django.contrib import admin
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = (
+        'id',
+        'name',
+        'status',
+        'priority',
+        'attempts',
+        'progress',
+        'run_at',
+        'started_at',
+        'finished_at',
+        'worker',
+    )
+    list_filter = ('status', 'name')
+    search_fields = ('name', 'error')
+    ordering = ('-created_at',)
+    readonly_fields = ('created_at', 'started_at', 'finished_at', 'worker')
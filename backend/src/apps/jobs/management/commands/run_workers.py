@@ -0,0 +1,140 @@
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.jobs.models import Job
+from apps.jobs.process import setup_worker_process
+from apps.jobs.services import (
+    claim_jobs,
+    fail_job,
+    requeue_lost_jobs,
+    run_job,
+)
+
+
+class Command(BaseCommand):
+    help = 'Runs queued background jobs in a pool of worker processes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            dest='concurrency',
+            default=settings.JOBS_CONCURRENCY,
+            help='Number of jobs run at once, 0 runs jobs one by one in this process',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            dest='poll_interval',
+            default=settings.JOBS_POLL_INTERVAL,
+            help='Seconds between polls of the queue when no job is due',
+        )
+        parser.add_argument(
+            '--max-jobs-per-process',
+            type=int,
+            dest='max_jobs_per_process',
+            default=100,
+            help='Replace a worker process after it has run this many jobs',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            dest='once',
+            default=False,
+            help='Exit once no job is due instead of polling',
+        )
+
+    def handle(self, *args, **options):
+        concurrency = options['concurrency']
+        if concurrency < 0:
+            raise CommandError('--concurrency must not be negative')
+        if options['max_jobs_per_process'] < 1:
+            raise CommandError('--max-jobs-per-process must be positive')
+
+        self.worker = f'{socket.gethostname()}:{os.getpid()}'
+        self.poll_interval = options['poll_interval']
+        self.once = options['once']
+        self.stopping = False
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, self.stop)
+
+        self.stdout.write(f'Worker {self.worker} started')
+        if concurrency == 0:
+            count = self.run_inline()
+        else:
+            # Job processes set up Django from scratch instead of inheriting
+            # the connections of this process
+            with ProcessPoolExecutor(
+                max_workers=concurrency,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=setup_worker_process,
+                max_tasks_per_child=options['max_jobs_per_process'],
+            ) as executor:
+                count = self.run_pool(executor, concurrency)
+        self.stdout.write(self.style.SUCCESS(f'Worker stopped after {count} jobs'))
+
+    def stop(self, signum, frame):
+        self.stdout.write('Stopping, waiting for running jobs to finish...')
+        self.stopping = True
+
+    def run_inline(self):
+        count = 0
+        while not self.stopping:
+            requeue_lost_jobs()
+            job_ids = claim_jobs(1, self.worker)
+            if not job_ids:
+                if self.once:
+                    break
+                time.sleep(self.poll_interval)
+                continue
+            self.report(job_ids[0], run_job(job_ids[0]))
+            count += 1
+        return count
+
+    def run_pool(self, executor, concurrency):
+        running = {}
+        count = 0
+        while running or not self.stopping:
+            free = concurrency - len(running)
+            if free and not self.stopping:
+                requeue_lost_jobs()
+                for job_id in claim_jobs(free, self.worker):
+                    running[executor.submit(run_job, job_id)] = job_id
+
+            if not running:
+                if self.once:
+                    break
+                time.sleep(self.poll_interval)
+                continue
+
+            done, _ = wait(
+                running, timeout=self.poll_interval, return_when=FIRST_COMPLETED
+            )
+            broken = False
+            for future in done:
+                job_id = running.pop(future)
+                try:
+                    status = future.result()
+                except BrokenProcessPool as error:
+                    # A job process died, e.g. killed for running out of memory
+                    status = fail_job(job_id, f'The job process died: {error}')
+                    broken = True
+                except Exception as error:
+                    status = fail_job(job_id, f'The job process failed: {error!r}')
+                self.report(job_id, status)
+                count += 1
+            if broken:
+                raise CommandError('A job process died, the worker must be restarted')
+        return count
+
+    def report(self, job_id, status):
+        style = self.style.SUCCESS if status == Job.SUCCEEDED else self.style.WARNING
+        self.stdout.write(style(f'Job #{job_id} {status}'))
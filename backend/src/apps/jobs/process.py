@@ -0,0 +1,19 @@
+"""
+Set up of the job processes started by run_workers.
+
+Spawned processes import this module before Django is set up, so it must not
+import models at module level.
+"""
+
+import signal
+
+import django
+
+
+def setup_worker_process():
+    """
+    Set up Django in a job process started by run_workers.
+    """
+    # Shutdown is coordinated by the parent, which lets running jobs finish
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    django.setup()
@@ -0,0 +1,69 @@
+"""
+Registry of the functions run by background jobs.
+
+Apps register their job functions in a jobs module, which is imported when the
+jobs app is ready:
+
+    @job('transactions.archive', concurrency=1)
+    def archive(job, older_than_days=None):
+        ...
+
+A job function is called with the Job and the keyword arguments of its
+payload, and its return value is stored as the result of the job.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+
+_jobs = {}
+
+
+def job(name: str, *, max_attempts: int = None, concurrency: int = None):
+    """
+    Register a job function.
+
+    Args:
+        name (str): The name jobs are enqueued with.
+        max_attempts (int, optional): Attempts before a job fails for good,
+            defaults to the JOBS_MAX_ATTEMPTS setting.
+        concurrency (int, optional): Maximum number of jobs of this name
+            running at once across all workers, unlimited by default.
+
+    Raises:
+        ImproperlyConfigured: If the name is already registered.
+    """
+
+    def decorator(func):
+        if name in _jobs:
+            raise ImproperlyConfigured(f'Job "{name}" is already registered')
+        _jobs[name] = {
+            'func': func,
+            'max_attempts': max_attempts,
+            'concurrency': concurrency,
+        }
+        return func
+
+    return decorator
+
+
+def get_job(name: str):
+    """
+    Get a registered job function with its options.
+
+    Args:
+        name (str): The registered name.
+
+    Returns:
+        dict | None: The 'func', 'max_attempts' and 'concurrency' of the job,
+            None if no job of this name is registered.
+    """
+    return _jobs.get(name)
+
+
+def get_jobs():
+    """
+    Get all registered jobs.
+
+    Returns:
+        dict: Options of every registered job by name.
+    """
+    return dict(_jobs)
@@ -0,0 +1,223 @@
+import traceback
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from apps.jobs.models import Job
+from apps.jobs.registry import get_job, get_jobs
+
+# Key of the advisory lock serializing claims of jobs with a concurrency limit
+CLAIM_LOCK_KEY = 0x6A6F6273
+
+
+def enqueue(
+    name: str,
+    payload: dict = None,
+    *,
+    priority: int = 0,
+    run_at: datetime = None,
+    max_attempts: int = None,
+):
+    """
+    Queue a job to be run by the workers.
+
+    Args:
+        name (str): The registered name of the job.
+        payload (dict, optional): JSON-serializable keyword arguments of the
+            job function.
+        priority (int): Jobs with a higher priority are claimed first.
+        run_at (datetime, optional): Do not run the job before this moment,
+            defaults to now.
+        max_attempts (int, optional): Attempts before the job fails for good,
+            defaults to the option of the job or the JOBS_MAX_ATTEMPTS setting.
+
+    Returns:
+        Job: The queued job.
+
+    Raises:
+        ValueError: If no job of this name is registered.
+    """
+    options = get_job(name)
+    if options is None:
+        raise ValueError(f'Unknown job: {name}')
+
+    return Job.objects.create(
+        name=name,
+        payload=payload or {},
+        priority=priority,
+        run_at=run_at or timezone.now(),
+        max_attempts=max_attempts
+        or options['max_attempts']
+        or settings.JOBS_MAX_ATTEMPTS,
+    )
+
+
+def claim_jobs(limit: int, worker: str = ''):
+    """
+    Claim queued jobs that are due, marking them as running.
+
+    Jobs are selected with FOR UPDATE SKIP LOCKED, so concurrent workers claim
+    different jobs without waiting for each other. Jobs of a name that is
+    running at its concurrency limit are left queued; while jobs with a limit
+    are registered, claims are serialized by an advisory lock, so running
+    jobs claimed concurrently are counted.
+
+    Args:
+        limit (int): Maximum number of jobs to claim.
+        worker (str): Identifies the claiming worker in the job.
+
+    Returns:
+        list[int]: IDs of the claimed jobs, in the order to run them.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        free = {
+            name: options['concurrency']
+            for name, options in get_jobs().items()
+            if options['concurrency'] is not None
+        }
+        if free:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_advisory_xact_lock(%s)', [CLAIM_LOCK_KEY])
+        running = (
+            Job.objects.filter(status=Job.RUNNING, name__in=free)
+            .values_list('name')
+            .annotate(count=Count('id'))
+        )
+        for name, count in running:
+            free[name] -= count
+
+        candidates = (
+            Job.objects.filter(status=Job.QUEUED, run_at__lte=now)
+            .exclude(name__in=[name for name, slots in free.items() if slots <= 0])
+            .order_by('-priority', 'run_at', 'id')
+            .select_for_update(skip_locked=True)
+            .values_list('id', 'name')[:limit]
+        )
+
+        job_ids = []
+        for job_id, name in candidates:
+            if name in free:
+                if free[name] <= 0:
+                    continue
+                free[name] -= 1
+            job_ids.append(job_id)
+
+        Job.objects.filter(id__in=job_ids).update(
+            status=Job.RUNNING,
+            attempts=F('attempts') + 1,
+            progress=0,
+            worker=worker,
+            started_at=now,
+            finished_at=None,
+        )
+
+    return job_ids
+
+
+def run_job(job_id: int):
+    """
+    Run a claimed job and record its outcome.
+
+    Args:
+        job_id (int): The ID of a job claimed by claim_jobs.
+
+    Returns:
+        str: The status of the job afterwards.
+    """
+    job = Job.objects.get(id=job_id)
+    options = get_job(job.name)
+    if options is None:
+        return fail_job(job_id, f'Unknown job: {job.name}', retry=False)
+
+    try:
+        result = options['func'](job, **job.payload)
+    except Exception:
+        return fail_job(job_id, traceback.format_exc(), attempt=job.attempts)
+
+    # A job considered lost may have been claimed again, the result of an
+    # earlier attempt is dropped
+    finished = Job.objects.filter(
+        id=job_id, status=Job.RUNNING, attempts=job.attempts
+    ).update(
+        status=Job.SUCCEEDED,
+        progress=100,
+        result=result,
+        error='',
+        finished_at=timezone.now(),
+    )
+    if not finished:
+        return Job.objects.values_list('status', flat=True).get(id=job_id)
+    return Job.SUCCEEDED
+
+
+def fail_job(job_id: int, error: str, retry: bool = True, attempt: int = None):
+    """
+    Record a failed attempt of a job, queueing it again if attempts are left.
+
+    Retries are delayed by JOBS_RETRY_DELAY seconds, doubled on every attempt.
+
+    Args:
+        job_id (int): The ID of the job.
+        error (str): The error of the attempt.
+        retry (bool): Whether the job may be retried.
+        attempt (int, optional): The attempt that failed, an attempt other
+            than the current one is ignored.
+
+    Returns:
+        str: The status of the job afterwards.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        job = Job.objects.select_for_update().get(id=job_id)
+        if job.status != Job.RUNNING or attempt not in (None, job.attempts):
+            # Finished meanwhile, e.g. by a worker considered lost
+            return job.status
+        job.error = error
+        job.finished_at = now
+        if retry and job.attempts < job.max_attempts:
+            job.status = Job.QUEUED
+            job.run_at = now + timedelta(
+                seconds=settings.JOBS_RETRY_DELAY * 2 ** (job.attempts - 1)
+            )
+        else:
+            job.status = Job.FAILED
+        job.save(update_fields=['status', 'error', 'finished_at', 'run_at'])
+    return job.status
+
+
+def report_progress(job: Job, progress: int):
+    """
+    Record the progress of a running job.
+
+    Args:
+        job (Job): The job passed to the job function.
+        progress (int): Percentage of the work done.
+    """
+    job.progress = max(0, min(100, int(progress)))
+    Job.objects.filter(id=job.id).update(progress=job.progress)
+
+
+def requeue_lost_jobs(timeout: int = None):
+    """
+    Fail or retry running jobs whose worker did not finish them in time.
+
+    Args:
+        timeout (int, optional): Seconds after which a running job is lost,
+            defaults to the JOBS_LEASE_TIMEOUT setting.
+
+    Returns:
+        int: The number of lost jobs.
+    """
+    cutoff = timezone.now() - timedelta(seconds=timeout or settings.JOBS_LEASE_TIMEOUT)
+    lost = list(
+        Job.objects.filter(status=Job.RUNNING, started_at__lt=cutoff).values_list(
+            'id', 'attempts'
+        )
+    )
+    for job_id, attempt in lost:
+        fail_job(job_id, 'The worker running the job was lost', attempt=attempt)
+    return len(lost)
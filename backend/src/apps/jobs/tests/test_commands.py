@@ -0,0 +1,46 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from apps.jobs import registry
+from apps.jobs.models import Job
+from apps.jobs.registry import job
+from apps.jobs.services import enqueue
+
+
+class RunWorkersCommandTests(TestCase):
+    """Test suite for the run_workers command."""
+
+    def setUp(self):
+        patcher = mock.patch.dict(registry._jobs, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        @job('tests.echo')
+        def echo(job, value):
+            return value
+
+    def test_run_once_inline(self):
+        """Test that due jobs are run until the queue is empty."""
+        jobs = [enqueue('tests.echo', {'value': index}) for index in range(3)]
+        out = StringIO()
+
+        call_command('run_workers', '--concurrency=0', '--once', stdout=out)
+
+        self.assertIn('stopped after 3 jobs', out.getvalue())
+        self.assertEqual(
+            list(
+                Job.objects.filter(id__in=[queued.id for queued in jobs])
+                .order_by('id')
+                .values_list('status', 'result')
+            ),
+            [(Job.SUCCEEDED, index) for index in range(3)],
+        )
+
+    def test_invalid_concurrency(self):
+        """Test that a negative concurrency is rejected."""
+        with self.assertRaises(CommandError):
+            call_command('run_workers', '--concurrency=-1', stdout=StringIO())
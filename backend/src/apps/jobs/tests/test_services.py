@@ -0,0 +1,238 @@
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from apps.jobs import registry
+from apps.jobs.models import Job
+from apps.jobs.registry import job
+from apps.jobs.services import (
+    claim_jobs,
+    enqueue,
+    fail_job,
+    report_progress,
+    requeue_lost_jobs,
+    run_job,
+)
+
+
+class JobsTestMixin:
+    def setUp(self):
+        patcher = mock.patch.dict(registry._jobs, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        @job('tests.add')
+        def add(job, a=0, b=0):
+            report_progress(job, 50)
+            return a + b
+
+        @job('tests.fail', max_attempts=2)
+        def fail(job):
+            raise RuntimeError('boom')
+
+        @job('tests.single', concurrency=1)
+        def single(job):
+            return None
+
+
+class JobServicesTests(JobsTestMixin, TestCase):
+    """Test suite for enqueueing, claiming and running jobs."""
+
+    def test_enqueue_unknown_job(self):
+        """Test that only registered jobs are queued."""
+        with self.assertRaises(ValueError):
+            enqueue('tests.unknown')
+
+    def test_duplicate_registration(self):
+        """Test that a job name is registered only once."""
+        with self.assertRaises(ImproperlyConfigured):
+            job('tests.add')(lambda job: None)
+
+    def test_claim_order(self):
+        """Test that due jobs are claimed by priority, then by age."""
+        low = enqueue('tests.add', {'a': 1, 'b': 2})
+        high = enqueue('tests.add', {'a': 1, 'b': 2}, priority=10)
+        enqueue('tests.add', run_at=timezone.now() + timedelta(hours=1))
+
+        self.assertEqual(claim_jobs(5, 'worker'), [high.id, low.id])
+
+        high.refresh_from_db()
+        self.assertEqual(high.status, Job.RUNNING)
+        self.assertEqual(high.attempts, 1)
+        self.assertEqual(high.worker, 'worker')
+        self.assertIsNotNone(high.started_at)
+
+    def test_claim_concurrency_limit(self):
+        """Test that jobs over the concurrency limit of their name stay queued."""
+        first, second = enqueue('tests.single'), enqueue('tests.single')
+        other = enqueue('tests.add')
+
+        self.assertEqual(claim_jobs(5), [first.id, other.id])
+        self.assertEqual(claim_jobs(5), [])
+
+        run_job(first.id)
+        self.assertEqual(claim_jobs(5), [second.id])
+
+    def test_run_job(self):
+        """Test that a successful job records its result and timings."""
+        queued = enqueue('tests.add', {'a': 2, 'b': 3})
+        claim_jobs(1)
+
+        self.assertEqual(run_job(queued.id), Job.SUCCEEDED)
+
+        queued.refresh_from_db()
+        self.assertEqual(queued.result, 5)
+        self.assertEqual(queued.progress, 100)
+        self.assertIsNotNone(queued.duration)
+
+    def test_progress(self):
+        """Test that the progress of a job is stored while it runs."""
+        queued = enqueue('tests.add')
+        claim_jobs(1)
+
+        report_progress(queued, 150)
+
+        queued.refresh_from_db()
+        self.assertEqual(queued.progress, 100)
+
+    @override_settings(JOBS_RETRY_DELAY=10)
+    def test_retry_with_backoff(self):
+        """Test that failed jobs are retried later until no attempts are left."""
+        queued = enqueue('tests.fail')
+        claim_jobs(1)
+
+        before = timezone.now()
+        self.assertEqual(run_job(queued.id), Job.QUEUED)
+        queued.refresh_from_db()
+        self.assertIn('boom', queued.error)
+        self.assertGreaterEqual(queued.run_at, before + timedelta(seconds=10))
+        self.assertEqual(claim_jobs(1), [])
+
+        Job.objects.filter(id=queued.id).update(run_at=timezone.now())
+        claim_jobs(1)
+        self.assertEqual(run_job(queued.id), Job.FAILED)
+        queued.refresh_from_db()
+        self.assertEqual(queued.attempts, 2)
+
+    def test_fail_finished_job(self):
+        """Test that failing a job that is not running leaves it alone."""
+        queued = enqueue('tests.add')
+        claim_jobs(1)
+        run_job(queued.id)
+
+        self.assertEqual(fail_job(queued.id, 'late'), Job.SUCCEEDED)
+
+    def test_requeue_lost_jobs(self):
+        """Test that jobs running longer than the lease are retried."""
+        lost = enqueue('tests.add')
+        running = enqueue('tests.add')
+        claim_jobs(2)
+        Job.objects.filter(id=lost.id).update(
+            started_at=timezone.now() - timedelta(hours=2)
+        )
+
+        self.assertEqual(requeue_lost_jobs(timeout=3600), 1)
+
+        lost.refresh_from_db()
+        running.refresh_from_db()
+        self.assertEqual(lost.status, Job.QUEUED)
+        self.assertEqual(running.status, Job.RUNNING)
+
+    def test_lost_attempt_does_not_finish_job(self):
+        """Test that an attempt requeued as lost does not finish the next one."""
+
+        @job('tests.slow', max_attempts=2)
+        def slow(job):
+            # The lease runs out and another worker claims the job again
+            Job.objects.filter(id=job.id).update(
+                started_at=timezone.now() - timedelta(hours=2)
+            )
+            requeue_lost_jobs(timeout=3600)
+            Job.objects.filter(id=job.id).update(run_at=timezone.now())
+            self.assertEqual(claim_jobs(1, 'other'), [job.id])
+            return 'stale'
+
+        queued = enqueue('tests.slow')
+        claim_jobs(1, 'worker')
+
+        self.assertEqual(run_job(queued.id), Job.RUNNING)
+
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, Job.RUNNING)
+        self.assertEqual((queued.attempts, queued.worker), (2, 'other'))
+        self.assertIsNone(queued.result)
+        self.assertEqual(fail_job(queued.id, 'stale', attempt=1), Job.RUNNING)
+
+
+class JobClaimLockingTests(JobsTestMixin, TransactionTestCase):
+    """Test suite for claiming jobs concurrently."""
+
+    def test_claim_skips_locked_jobs(self):
+        """Test that jobs locked by another worker are skipped without waiting."""
+        locked = enqueue('tests.add')
+        free = enqueue('tests.add')
+        acquired, release = threading.Event(), threading.Event()
+
+        def hold_lock():
+            try:
+                with transaction.atomic():
+                    Job.objects.select_for_update().get(id=locked.id)
+                    acquired.set()
+                    release.wait(5)
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        try:
+            self.assertTrue(acquired.wait(5))
+            self.assertEqual(claim_jobs(2), [free.id])
+        finally:
+            release.set()
+            thread.join()
+
+        self.assertEqual(claim_jobs(2), [locked.id])
+
+    def test_claim_concurrency_limit_concurrently(self):
+        """Test that concurrent claims do not exceed the concurrency limit."""
+        first, second = enqueue('tests.single'), enqueue('tests.single')
+        acquired, release = threading.Event(), threading.Event()
+        claimed = {}
+
+        def claim_and_wait():
+            try:
+                with transaction.atomic():
+                    claimed['holder'] = claim_jobs(1)
+                    acquired.set()
+                    release.wait(5)
+            finally:
+                connection.close()
+
+        def claim():
+            try:
+                claimed['other'] = claim_jobs(1)
+            finally:
+                connection.close()
+
+        holder = threading.Thread(target=claim_and_wait)
+        other = threading.Thread(target=claim)
+        holder.start()
+        try:
+            self.assertTrue(acquired.wait(5))
+            other.start()
+            # The other claim waits for the claiming transaction
+            other.join(0.2)
+            self.assertTrue(other.is_alive())
+        finally:
+            release.set()
+            holder.join()
+            other.join()
+
+        self.assertEqual(claimed, {'holder': [first.id], 'other': []})
+        second.refresh_from_db()
+        self.assertEqual(second.status, Job.QUEUED)
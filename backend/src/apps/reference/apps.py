@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TransactionReferencesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.reference'
+
+    def ready(self):
+        from apps.reference import signals  # noqa: F401
@@ -1,153 +1,92 @@
 from django.core.management.base import BaseCommand
-from django.db import transaction
 
-from apps.reference.enums import (
-    CategoryEnum,
-    StatusEnum,
-    SubcategoryEnum,
-    TransactionTypeEnum,
-)
-from apps.reference.models import Category, Status, Subcategory, TransactionType
+from apps.reference.services.sync import sync_reference_data
+
+LABELS = {
+    'transaction_types': 'transaction types',
+    'statuses': 'statuses',
+    'categories': 'categories',
+    'subcategories': 'subcategories',
+}
 
 
 class Command(BaseCommand):
-    help = 'Clears and loads reference data from enumerations'
+    help = 'Synchronizes reference data with enumerations'
 
     def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            dest='dry_run',
+            default=False,
+            help='Only report the changes, do not apply them',
+        )
+        parser.add_argument(
+            '--prune',
+            action='store_true',
+            dest='prune',
+            default=False,
+            help='Delete reference data not defined in enumerations '
+            'unless it is used by transactions',
+        )
         parser.add_argument(
             '--no-clear',
             action='store_true',
             dest='no_clear',
             default=False,
-            help='Do not clear existing data before loading',
+            help='Deprecated, has no effect: reference data is no longer cleared',
         )
 
     def handle(self, *args, **options):
-        no_clear = options['no_clear']
+        dry_run = options['dry_run']
+        prune = options['prune']
 
-        if not no_clear:
-            self.clear_reference_data()
-            self.stdout.write(self.style.SUCCESS('Reference data cleared'))
-
-        @transaction.atomic
-        def load_all_reference_data(self):
-            self.load_transaction_types()
-            self.load_categories()
-            self.load_subcategories()
-            self.load_statuses()
-
-        load_all_reference_data(self)
-
-        self.stdout.write(self.style.SUCCESS('Reference data loaded successfully'))
-
-    def clear_reference_data(self):
-        self.stdout.write('Clearing existing reference data...')
-        Subcategory.objects.all().delete()
-        Category.objects.all().delete()
-        TransactionType.objects.all().delete()
-        Status.objects.all().delete()
-
-    def load_transaction_types(self):
-        self.stdout.write('Loading transaction types...')
-        transaction_types = []
-        for transaction_type_value in TransactionTypeEnum.values():
-            transaction_types.append(TransactionType(name=transaction_type_value))
-
-        if transaction_types:
-            TransactionType.objects.bulk_create(
-                transaction_types, ignore_conflicts=True
-            )
+        if options['no_clear']:
             self.stdout.write(
-                self.style.SUCCESS(
-                    f'Created {len(transaction_types)} transaction types'
+                self.style.WARNING(
+                    '--no-clear is deprecated and has no effect, '
+                    'reference data is no longer cleared'
                 )
             )
 
-    def load_categories(self):
-        self.stdout.write('Loading categories...')
-        categories = []
+        result = sync_reference_data(dry_run=dry_run, prune=prune)
 
-        for category_enum in CategoryEnum:
-            if category_enum.name == 'MAP':
-                continue
+        for warning in result['warnings']:
+            self.stdout.write(self.style.WARNING(warning))
 
-            transaction_type_enum = CategoryEnum.MAP.value.get(category_enum.value)
-            try:
-                if not transaction_type_enum:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f'No transaction type mapping found for '
-                            f'{category_enum.value}'
-                        )
-                    )
-                    continue
+        self.write_diff(result['diff'], dry_run, prune)
 
-                transaction_type = TransactionType.objects.get(
-                    name=transaction_type_enum.value
-                )
+        for name in result['kept']:
+            self.stdout.write(self.style.WARNING(f'{name} is in use, not deleted'))
 
-                categories.append(
-                    Category(
-                        name=category_enum.value, transaction_type=transaction_type
-                    )
-                )
-            except TransactionType.DoesNotExist:
+        if result['changed']:
+            self.stdout.write(self.style.SUCCESS('Reference data synchronized'))
+        elif dry_run:
+            self.stdout.write(self.style.SUCCESS('Dry run, no changes applied'))
+        else:
+            self.stdout.write(self.style.SUCCESS('Reference data is up to date'))
+
+    def write_diff(self, diff, dry_run, prune):
+        for key, changes in diff.items():
+            label = LABELS[key]
+            if changes['create']:
+                verb = 'Would create' if dry_run else 'Created'
                 self.stdout.write(
-                    self.style.WARNING(
-                        f'Transaction type {transaction_type_enum.value} not found for '
-                        f'{category_enum.value}'
-                    )
+                    f'{verb} {len(changes["create"])} {label}: '
+                    f'{", ".join(changes["create"])}'
                 )
-
-        if categories:
-            Category.objects.bulk_create(categories, ignore_conflicts=True)
-            self.stdout.write(
-                self.style.SUCCESS(f'Created {len(categories)} categories')
-            )
-
-    def load_subcategories(self):
-        self.stdout.write('Loading subcategories...')
-        subcategories = []
-
-        for subcategory_enum in SubcategoryEnum:
-            if subcategory_enum.name == 'MAP':
-                continue
-
-            category_enum = SubcategoryEnum.MAP.value.get(subcategory_enum.value)
-            try:
-                if not category_enum:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f'No category mapping found for {subcategory_enum.value}'
-                        )
-                    )
-                    continue
-
-                category = Category.objects.get(name=category_enum.value)
-
-                subcategories.append(
-                    Subcategory(name=subcategory_enum.value, category=category)
+            if changes['update']:
+                verb = 'Would move' if dry_run else 'Moved'
+                self.stdout.write(
+                    f'{verb} {len(changes["update"])} {label}: '
+                    f'{", ".join(name for _, name, _ in changes["update"])}'
                 )
-            except Category.DoesNotExist:
+            if changes['delete']:
+                if not prune:
+                    verb = 'Not defined in enumerations'
+                else:
+                    verb = 'Would delete' if dry_run else 'Deleted'
                 self.stdout.write(
-                    self.style.WARNING(
-                        f'Category {category_enum.value} not found for '
-                        f'{subcategory_enum.value}'
-                    )
+                    f'{verb} {len(changes["delete"])} {label}: '
+                    f'{", ".join(changes["delete"])}'
                 )
-
-        if subcategories:
-            Subcategory.objects.bulk_create(subcategories, ignore_conflicts=True)
-            self.stdout.write(
-                self.style.SUCCESS(f'Created {len(subcategories)} subcategories')
-            )
-
-    def load_statuses(self):
-        self.stdout.write('Loading statuses...')
-        statuses = []
-        for status_value in StatusEnum.values():
-            statuses.append(Status(name=status_value))
-
-        if statuses:
-            Status.objects.bulk_create(statuses, ignore_conflicts=True)
-            self.stdout.write(self.style.SUCCESS(f'Created {len(statuses)} statuses'))
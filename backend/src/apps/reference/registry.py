@@ -0,0 +1,184 @@
+"""
+Registry of the reference taxonomy defined by the enumerations.
+
+The enumerations are compiled once at import into frozen lookup tables:
+names of every reference model, name -> enum member maps, child -> parent
+maps and the inverted parent -> children indexes. Name <-> ID maps of the
+rows stored in the database are loaded on first use and reloaded when
+reference data changes.
+"""
+
+from types import MappingProxyType
+
+from apps.reference.enums import (
+    CategoryEnum,
+    StatusEnum,
+    SubcategoryEnum,
+    TransactionTypeEnum,
+)
+from apps.reference.models import Category, Status, Subcategory, TransactionType
+
+REFERENCE_ENUMS = MappingProxyType(
+    {
+        'transaction_types': TransactionTypeEnum,
+        'statuses': StatusEnum,
+        'categories': CategoryEnum,
+        'subcategories': SubcategoryEnum,
+    }
+)
+
+REFERENCE_MODELS = MappingProxyType(
+    {
+        'transaction_types': TransactionType,
+        'statuses': Status,
+        'categories': Category,
+        'subcategories': Subcategory,
+    }
+)
+
+
+def _compile_members(enum):
+    return MappingProxyType(
+        {member.value: member for member in enum if member.name != 'MAP'}
+    )
+
+
+def _compile_parents(enum):
+    return MappingProxyType(
+        {name: parent.value for name, parent in enum.MAP.value.items()}
+    )
+
+
+def _compile_children(parents, parent_names):
+    children = {name: [] for name in parent_names}
+    for name, parent in parents.items():
+        children.setdefault(parent, []).append(name)
+    return MappingProxyType({name: tuple(names) for name, names in children.items()})
+
+
+# name -> enum member, in definition order
+MEMBERS = MappingProxyType(
+    {key: _compile_members(enum) for key, enum in REFERENCE_ENUMS.items()}
+)
+
+TRANSACTION_TYPE_NAMES = tuple(MEMBERS['transaction_types'])
+STATUS_NAMES = tuple(MEMBERS['statuses'])
+CATEGORY_NAMES = tuple(MEMBERS['categories'])
+SUBCATEGORY_NAMES = tuple(MEMBERS['subcategories'])
+
+# child name -> parent name, as mapped by the MAP member of the enumeration
+CATEGORY_TRANSACTION_TYPES = _compile_parents(CategoryEnum)
+SUBCATEGORY_CATEGORIES = _compile_parents(SubcategoryEnum)
+
+# parent name -> child names
+TRANSACTION_TYPE_CATEGORIES = _compile_children(
+    CATEGORY_TRANSACTION_TYPES, TRANSACTION_TYPE_NAMES
+)
+CATEGORY_SUBCATEGORIES = _compile_children(SUBCATEGORY_CATEGORIES, CATEGORY_NAMES)
+
+# Foreign keys of the child reference models to their parents
+PARENT_FIELDS = MappingProxyType(
+    {'categories': 'transaction_type_id', 'subcategories': 'category_id'}
+)
+
+_ids = {'version': None, 'ids': None, 'names': None, 'parents': None}
+
+
+def is_defined(key: str, name: str) -> bool:
+    """
+    Check whether a name is defined in the enumeration of a reference model.
+
+    Args:
+        key (str): 'transaction_types', 'statuses', 'categories' or
+            'subcategories'.
+        name (str): The name to check.
+
+    Returns:
+        bool: True if the enumeration defines the name.
+    """
+    return name in MEMBERS[key]
+
+
+def get_reference_ids():
+    """
+    Get the IDs of the reference rows stored in the database by name.
+
+    The maps are loaded on first use and reloaded after reference data has
+    changed, which is tracked by the reference bundle version.
+
+    Returns:
+        Mapping[str, Mapping[str, int]]: Name -> ID per reference model.
+            A category or subcategory name stored under several parents maps
+            to the row with the highest ID.
+    """
+    _load_ids()
+    return _ids['ids']
+
+
+def get_reference_names():
+    """
+    Get the names of the reference rows stored in the database by ID.
+
+    Returns:
+        Mapping[str, Mapping[int, str]]: ID -> name per reference model.
+    """
+    _load_ids()
+    return _ids['names']
+
+
+def get_reference_parent_ids():
+    """
+    Get the parent IDs of the category and subcategory rows by ID.
+
+    Returns:
+        Mapping[str, Mapping[int, int]]: Child ID -> transaction type ID for
+            'categories' and child ID -> category ID for 'subcategories'.
+    """
+    _load_ids()
+    return _ids['parents']
+
+
+def _load_ids():
+    # Imported here, the bundle serializers import the registry
+    from apps.reference.services.bundle import get_reference_bundle_version
+
+    version = get_reference_bundle_version()
+    if _ids['version'] == version:
+        return
+
+    rows = {
+        key: list(
+            model.objects.order_by('id').values_list(
+                'name', 'id', PARENT_FIELDS.get(key, 'id')
+            )
+        )
+        for key, model in REFERENCE_MODELS.items()
+    }
+    _ids['ids'] = MappingProxyType(
+        {
+            key: MappingProxyType({name: row_id for name, row_id, _ in pairs})
+            for key, pairs in rows.items()
+        }
+    )
+    _ids['names'] = MappingProxyType(
+        {
+            key: MappingProxyType({row_id: name for name, row_id, _ in pairs})
+            for key, pairs in rows.items()
+        }
+    )
+    _ids['parents'] = MappingProxyType(
+        {
+            key: MappingProxyType(
+                {row_id: parent_id for _, row_id, parent_id in rows[key]}
+            )
+            for key in PARENT_FIELDS
+        }
+    )
+    _ids['version'] = version
+
+
+def clear_reference_ids():
+    """
+    Drop the loaded name <-> ID maps, so they are reloaded on the next use.
+    """
+    _ids.update(version=None, ids=None, names=None, parents=None)
@@ -0,0 +1,33 @@
+from rest_framework import serializers
+
+from apps.reference.serializers.category import CategoryDetailSerializer
+from apps.reference.serializers.status import StatusDetailSerializer
+from apps.reference.serializers.subcategory import SubcategoryDetailSerializer
+from apps.reference.serializers.transaction_type import (
+    TransactionTypeDetailSerializer,
+)
+
+
+class ReferenceTreeSubcategorySerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+
+
+class ReferenceTreeCategorySerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    subcategories = ReferenceTreeSubcategorySerializer(many=True)
+
+
+class ReferenceTreeTransactionTypeSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    categories = ReferenceTreeCategorySerializer(many=True)
+
+
+class ReferenceBundleSerializer(serializers.Serializer):
+    statuses = StatusDetailSerializer(many=True)
+    transaction_types = TransactionTypeDetailSerializer(many=True)
+    categories = CategoryDetailSerializer(many=True)
+    subcategories = SubcategoryDetailSerializer(many=True)
+    tree = ReferenceTreeTransactionTypeSerializer(many=True)
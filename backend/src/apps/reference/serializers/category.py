@@ -2,8 +2,12 @@ from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from rest_framework.validators import UniqueTogetherValidator
 
-from apps.reference.enums.category import CategoryEnum
 from apps.reference.models import Category, TransactionType
+from apps.reference.registry import (
+    CATEGORY_NAMES,
+    CATEGORY_TRANSACTION_TYPES,
+    is_defined,
+)
 
 
 class CategorySerializer(serializers.Serializer):
@@ -23,9 +27,9 @@ class CategorySerializer(serializers.Serializer):
         ]
 
     def validate_name(self, value):
-        if value not in CategoryEnum.values():
+        if not is_defined('categories', value):
             raise serializers.ValidationError(
-                f'Invalid category name. Must be one of: {CategoryEnum.values()}'
+                f'Invalid category name. Must be one of: {list(CATEGORY_NAMES)}'
             )
         return value
 
@@ -35,10 +39,9 @@ class CategorySerializer(serializers.Serializer):
 
         attrs['transaction_type'] = transaction_type
 
-        category_map = CategoryEnum.MAP.value
+        expected_transaction_type_name = CATEGORY_TRANSACTION_TYPES.get(name)
 
-        if name in category_map:
-            expected_transaction_type_name = category_map[name].value
+        if expected_transaction_type_name is not None:
             actual_transaction_type_name = transaction_type.name
 
             if actual_transaction_type_name != expected_transaction_type_name:
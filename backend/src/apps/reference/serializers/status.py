@@ -1,17 +1,17 @@
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 
-from apps.reference.enums.status import StatusEnum
 from apps.reference.models import Status
+from apps.reference.registry import STATUS_NAMES, is_defined
 
 
 class StatusSerializer(serializers.Serializer):
     name = serializers.CharField()
 
     def validate_name(self, value):
-        if value not in StatusEnum.values():
+        if not is_defined('statuses', value):
             raise serializers.ValidationError(
-                f'Invalid status name. Must be one of: {StatusEnum.values()}'
+                f'Invalid status name. Must be one of: {list(STATUS_NAMES)}'
             )
 
         instance_id = self.instance.id if self.instance else None
@@ -2,8 +2,12 @@ from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from rest_framework.validators import UniqueTogetherValidator
 
-from apps.reference.enums.subcategory import SubcategoryEnum
 from apps.reference.models import Category, Subcategory
+from apps.reference.registry import (
+    SUBCATEGORY_CATEGORIES,
+    SUBCATEGORY_NAMES,
+    is_defined,
+)
 
 
 class SubcategorySerializer(serializers.Serializer):
@@ -23,10 +27,9 @@ class SubcategorySerializer(serializers.Serializer):
         ]
 
     def validate_name(self, value):
-        valid_names = SubcategoryEnum.values()
-        if value not in valid_names:
+        if not is_defined('subcategories', value):
             raise ValidationError(
-                f'Invalid subcategory name. Must be one of: {valid_names}'
+                f'Invalid subcategory name. Must be one of: {list(SUBCATEGORY_NAMES)}'
             )
         return value
 
@@ -36,10 +39,9 @@ class SubcategorySerializer(serializers.Serializer):
 
         attrs['category'] = category
 
-        subcategory_map = SubcategoryEnum.MAP.value
+        expected_category_name = SUBCATEGORY_CATEGORIES.get(name)
 
-        if name in subcategory_map:
-            expected_category_name = subcategory_map[name].value
+        if expected_category_name is not None:
             actual_category_name = category.name
 
             if actual_category_name != expected_category_name:
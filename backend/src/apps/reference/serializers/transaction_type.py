@@ -1,8 +1,8 @@
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 
-from apps.reference.enums.transaction_type import TransactionTypeEnum
 from apps.reference.models import TransactionType
+from apps.reference.registry import TRANSACTION_TYPE_NAMES, is_defined
 
 
 class TransactionTypeSerializer(serializers.Serializer):
@@ -10,8 +10,8 @@ class TransactionTypeSerializer(serializers.Serializer):
     id = serializers.IntegerField(required=False, read_only=True)
 
     def validate_name(self, value):
-        if value not in TransactionTypeEnum.values():
-            valid_values = TransactionTypeEnum.values()
+        if not is_defined('transaction_types', value):
+            valid_values = list(TRANSACTION_TYPE_NAMES)
             raise serializers.ValidationError(
                 f'Invalid transaction type name. Must be one of: {valid_values}'
             )
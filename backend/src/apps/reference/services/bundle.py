@@ -0,0 +1,78 @@
+import hashlib
+import uuid
+
+from django.core.cache import cache
+
+from apps.core.renderers import ORJSONRenderer
+from apps.reference.models import Category, Status, Subcategory, TransactionType
+from apps.reference.serializers.bundle import ReferenceBundleSerializer
+
+BUNDLE_VERSION_CACHE_KEY = 'reference:bundle:version'
+BUNDLE_CACHE_KEY = 'reference:bundle:{version}'
+
+
+def build_reference_bundle():
+    """
+    Build all reference data with the transaction type -> category ->
+    subcategory tree.
+
+    Returns:
+        dict: Serialized statuses, transaction types, categories,
+            subcategories and the tree.
+    """
+    transaction_types = TransactionType.objects.prefetch_related(
+        'categories__subcategories'
+    )
+    return ReferenceBundleSerializer(
+        {
+            'statuses': Status.objects.all(),
+            'transaction_types': transaction_types,
+            'categories': Category.objects.select_related('transaction_type'),
+            'subcategories': Subcategory.objects.select_related('category'),
+            'tree': transaction_types,
+        }
+    ).data
+
+
+def get_reference_bundle_version():
+    """
+    Get the current version of the reference bundle.
+
+    Returns:
+        str: The version, changed every time reference data changes.
+    """
+    version = cache.get(BUNDLE_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(BUNDLE_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(BUNDLE_VERSION_CACHE_KEY)
+    return version
+
+
+def get_reference_bundle():
+    """
+    Get the rendered reference bundle, building it on the first request after
+    reference data has changed.
+
+    The bundle is stored under its version, so a bundle built from data read
+    before a change is never served after the change.
+
+    Returns:
+        tuple[bytes, str]: The JSON response body and its ETag. The ETag is
+            weak, so it stays valid for compressed representations.
+    """
+    key = BUNDLE_CACHE_KEY.format(version=get_reference_bundle_version())
+
+    bundle = cache.get(key)
+    if bundle is None:
+        content = ORJSONRenderer().render(build_reference_bundle())
+        bundle = (content, f'W/"{hashlib.sha256(content).hexdigest()}"')
+        cache.set(key, bundle, timeout=None)
+
+    return bundle
+
+
+def invalidate_reference_bundle():
+    """
+    Mark the reference bundle as outdated, so it is rebuilt on the next request.
+    """
+    cache.set(BUNDLE_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
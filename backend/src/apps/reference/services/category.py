@@ -1,9 +1,9 @@
 from django.core.exceptions import ObjectDoesNotExist
 from rest_framework.exceptions import NotFound, ValidationError
 
-from apps.reference.enums import CategoryEnum
 from apps.reference.models import Category
 from apps.reference.models.transaction_type import TransactionType
+from apps.reference.registry import CATEGORY_TRANSACTION_TYPES, is_defined
 
 
 def get_all_categories():
@@ -50,23 +50,13 @@ def create_category(name: str, transaction_type: TransactionType):
         ValidationError: If the category name is invalid or if the transaction type
                         doesn't match the required one for this category.
     """
-    if name not in CategoryEnum.values():
+    if not is_defined('categories', name):
         raise ValidationError(f'Invalid category name: {name}')
 
     if Category.objects.filter(name=name).exists():
         raise ValidationError(f"Category with name '{name}' already exists")
 
-    for cat_enum in CategoryEnum:
-        if cat_enum.value == name:
-            trans_type_enum = CategoryEnum.MAP.value.get(cat_enum)
-            if trans_type_enum and trans_type_enum.value != transaction_type.name:
-                raise ValidationError(
-                    f"Category '{name}' must be associated with "
-                    f"transaction type '{trans_type_enum.value}'"
-                )
-            break
-    else:
-        raise ValidationError(f"Category '{name}' not found in CategoryEnum")
+    _validate_transaction_type(name, transaction_type)
 
     return Category.objects.create(name=name, transaction_type=transaction_type)
 
@@ -94,30 +84,29 @@ def update_category(
     category = get_category_by_id(category_id)
 
     if name is not None:
-        if name not in CategoryEnum.values():
+        if not is_defined('categories', name):
             raise ValidationError(f'Invalid category name: {name}')
         category.name = name
 
     if transaction_type is not None:
-        for cat_enum in CategoryEnum:
-            if cat_enum.value == category.name:
-                trans_type_enum = CategoryEnum.MAP.value.get(cat_enum)
-                if trans_type_enum and trans_type_enum.value != transaction_type.name:
-                    raise ValidationError(
-                        f"Category '{category.name}' must be associated with "
-                        f"transaction type '{trans_type_enum.value}'"
-                    )
-                break
-        else:
-            raise ValidationError(
-                f"Category '{category.name}' not found in CategoryEnum"
-            )
+        _validate_transaction_type(category.name, transaction_type)
         category.transaction_type = transaction_type
 
     category.save()
     return category
 
 
+def _validate_transaction_type(name: str, transaction_type: TransactionType):
+    expected_name = CATEGORY_TRANSACTION_TYPES.get(name)
+    if expected_name is None:
+        raise ValidationError(f"Category '{name}' not found in CategoryEnum")
+    if expected_name != transaction_type.name:
+        raise ValidationError(
+            f"Category '{name}' must be associated with "
+            f"transaction type '{expected_name}'"
+        )
+
+
 def delete_category(category_id: int):
     """
     Delete category.
@@ -1,9 +1,9 @@
 from django.core.exceptions import ObjectDoesNotExist
 from rest_framework.exceptions import NotFound, ValidationError
 
-from apps.reference.enums import SubcategoryEnum
 from apps.reference.models import Subcategory
 from apps.reference.models.category import Category
+from apps.reference.registry import SUBCATEGORY_CATEGORIES, is_defined
 
 
 def get_all_subcategories():
@@ -50,21 +50,13 @@ def create_subcategory(name: str, category: Category):
         ValidationError: If the name is invalid, the category association is incorrect,
                          or a duplicate subcategory already exists.
     """
-    if name not in SubcategoryEnum.values():
+    if not is_defined('subcategories', name):
         raise ValidationError(f'Invalid subcategory name: {name}')
 
     if Subcategory.objects.filter(name=name).exists():
         raise ValidationError(f"Category with name '{name}' already exists")
 
-    for subcat_enum in SubcategoryEnum:
-        if subcat_enum.value == name:
-            cat_enum = SubcategoryEnum.MAP.value.get(subcat_enum)
-            if cat_enum and cat_enum.value != category:
-                raise ValidationError(
-                    f"Subcategory '{name}' must be associated with "
-                    f"category '{cat_enum.value}'"
-                )
-            break
+    _validate_category(name, category)
 
     if Subcategory.objects.filter(name=name, category=category).exists():
         raise ValidationError('Subcategory with this name and category already exists')
@@ -93,26 +85,26 @@ def update_subcategory(
     subcategory = get_subcategory_by_id(subcategory_id)
 
     if name is not None:
-        if name not in SubcategoryEnum.values():
+        if not is_defined('subcategories', name):
             raise ValidationError(f'Invalid subcategory name: {name}')
         subcategory.name = name
 
     if category is not None:
-        for subcat_enum in SubcategoryEnum:
-            if subcat_enum.value == subcategory.name:
-                cat_enum = SubcategoryEnum.MAP.value.get(subcat_enum)
-                if cat_enum and cat_enum.value != category:
-                    raise ValidationError(
-                        f"Subcategory '{subcategory.name}' must be associated with "
-                        f"category '{cat_enum.value}'"
-                    )
-                break
+        _validate_category(subcategory.name, category)
         subcategory.category = category
 
     subcategory.save()
     return subcategory
 
 
+def _validate_category(name: str, category: Category):
+    expected_name = SUBCATEGORY_CATEGORIES.get(name)
+    if expected_name is not None and expected_name != category.name:
+        raise ValidationError(
+            f"Subcategory '{name}' must be associated with category '{expected_name}'"
+        )
+
+
 def delete_subcategory(subcategory_id: int):
     """
     Delete subcategory.
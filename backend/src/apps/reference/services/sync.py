@@ -0,0 +1,253 @@
+from django.db import transaction
+from django.db.models import ProtectedError
+
+from apps.reference.models import Category, Status, Subcategory, TransactionType
+from apps.reference.registry import (
+    CATEGORY_NAMES,
+    CATEGORY_TRANSACTION_TYPES,
+    REFERENCE_MODELS,
+    STATUS_NAMES,
+    SUBCATEGORY_CATEGORIES,
+    SUBCATEGORY_NAMES,
+    TRANSACTION_TYPE_NAMES,
+)
+from apps.reference.services.bundle import invalidate_reference_bundle
+
+
+def get_reference_definitions():
+    """
+    Get reference data defined by the enumerations.
+
+    Categories and subcategories without a mapping to their parent are
+    skipped.
+
+    Returns:
+        tuple[dict, list[str]]: Names of transaction types and statuses, and
+            the parent name of every category and subcategory; and warnings
+            about skipped enumeration members.
+    """
+    warnings = []
+
+    categories = {}
+    for name in CATEGORY_NAMES:
+        transaction_type = CATEGORY_TRANSACTION_TYPES.get(name)
+        if transaction_type is None:
+            warnings.append(f'No transaction type mapping found for {name}')
+            continue
+        categories[name] = transaction_type
+
+    subcategories = {}
+    for name in SUBCATEGORY_NAMES:
+        category = SUBCATEGORY_CATEGORIES.get(name)
+        if category is None:
+            warnings.append(f'No category mapping found for {name}')
+            continue
+        if category not in categories:
+            warnings.append(f'Category {category} not found for {name}')
+            continue
+        subcategories[name] = category
+
+    definitions = {
+        'transaction_types': list(TRANSACTION_TYPE_NAMES),
+        'statuses': list(STATUS_NAMES),
+        'categories': categories,
+        'subcategories': subcategories,
+    }
+    return definitions, warnings
+
+
+def _diff_names(queryset, names: list):
+    existing = set(queryset.values_list('name', flat=True))
+    return {
+        'create': [name for name in names if name not in existing],
+        'update': [],
+        'delete': sorted(existing - set(names)),
+    }
+
+
+def _diff_children(rows: list, parents: dict):
+    """
+    Diff (id, name, parent name) rows against the expected parent of each name.
+
+    A row with an unexpected parent is moved to the expected one, unless the
+    expected row exists too, then it is left for deletion.
+    """
+    matched = {name for _, name, parent in rows if parents.get(name) == parent}
+
+    diff = {'create': [], 'update': [], 'delete': []}
+    moved = set()
+    for row_id, name, parent in rows:
+        if name in matched and parents[name] == parent:
+            continue
+        if name in parents and name not in matched and name not in moved:
+            diff['update'].append((row_id, name, parents[name]))
+            moved.add(name)
+        else:
+            diff['delete'].append(name)
+
+    diff['create'] = [
+        name for name in parents if name not in matched and name not in moved
+    ]
+    diff['delete'].sort()
+    return diff
+
+
+def diff_reference_data(definitions: dict):
+    """
+    Compute the changes needed to bring the database in line with the
+    reference definitions.
+
+    Args:
+        definitions (dict): Reference definitions from get_reference_definitions.
+
+    Returns:
+        dict: Names to 'create', rows to 'update' (moved to another parent)
+            and names to 'delete' (not defined anymore) per reference model.
+    """
+    category_rows = list(
+        Category.objects.values_list('id', 'name', 'transaction_type__name')
+    )
+    subcategory_rows = list(
+        Subcategory.objects.values_list('id', 'name', 'category__name')
+    )
+
+    return {
+        'transaction_types': _diff_names(
+            TransactionType.objects.all(), definitions['transaction_types']
+        ),
+        'statuses': _diff_names(Status.objects.all(), definitions['statuses']),
+        'categories': _diff_children(category_rows, definitions['categories']),
+        'subcategories': _diff_children(subcategory_rows, definitions['subcategories']),
+    }
+
+
+def _apply_diff(diff: dict, definitions: dict, prune: bool):
+    for key, model in (
+        ('transaction_types', TransactionType),
+        ('statuses', Status),
+    ):
+        model.objects.bulk_create(
+            [model(name=name) for name in diff[key]['create']],
+            update_conflicts=True,
+            unique_fields=['name'],
+            update_fields=['name'],
+        )
+
+    transaction_type_ids = dict(TransactionType.objects.values_list('name', 'id'))
+    categories = definitions['categories']
+    Category.objects.bulk_create(
+        [
+            Category(
+                name=name, transaction_type_id=transaction_type_ids[categories[name]]
+            )
+            for name in diff['categories']['create']
+        ],
+        update_conflicts=True,
+        unique_fields=['name', 'transaction_type'],
+        update_fields=['name'],
+    )
+    Category.objects.bulk_update(
+        [
+            Category(id=row_id, transaction_type_id=transaction_type_ids[parent])
+            for row_id, _, parent in diff['categories']['update']
+        ],
+        ['transaction_type'],
+    )
+
+    category_ids = {
+        name: row_id
+        for row_id, name, transaction_type in Category.objects.values_list(
+            'id', 'name', 'transaction_type__name'
+        )
+        if categories.get(name) == transaction_type
+    }
+    subcategories = definitions['subcategories']
+    Subcategory.objects.bulk_create(
+        [
+            Subcategory(name=name, category_id=category_ids[subcategories[name]])
+            for name in diff['subcategories']['create']
+        ],
+        update_conflicts=True,
+        unique_fields=['name', 'category'],
+        update_fields=['name'],
+    )
+    Subcategory.objects.bulk_update(
+        [
+            Subcategory(id=row_id, category_id=category_ids[parent])
+            for row_id, _, parent in diff['subcategories']['update']
+        ],
+        ['category'],
+    )
+
+    kept = []
+    if prune:
+        for key in ('subcategories', 'categories', 'transaction_types', 'statuses'):
+            model = REFERENCE_MODELS[key]
+            for obj in model.objects.filter(name__in=diff[key]['delete']):
+                if _is_defined(key, obj, definitions):
+                    continue
+                try:
+                    with transaction.atomic():
+                        obj.delete()
+                except ProtectedError:
+                    kept.append(f'{model.__name__} {obj.name}')
+
+    return kept
+
+
+def _is_defined(key: str, obj, definitions: dict):
+    if key == 'categories':
+        return definitions[key].get(obj.name) == obj.transaction_type.name
+    if key == 'subcategories':
+        return definitions[key].get(obj.name) == obj.category.name
+    return obj.name in definitions[key]
+
+
+def has_changes(diff: dict, prune: bool = False):
+    """
+    Check whether a diff changes the database.
+
+    Args:
+        diff (dict): The diff from diff_reference_data.
+        prune (bool): Whether rows not defined anymore are deleted.
+
+    Returns:
+        bool: True if applying the diff changes any row.
+    """
+    return any(
+        changes['create'] or changes['update'] or (prune and changes['delete'])
+        for changes in diff.values()
+    )
+
+
+def sync_reference_data(dry_run: bool = False, prune: bool = False):
+    """
+    Synchronize reference data in the database with the enumerations.
+
+    Missing rows are created, categories and subcategories mapped to another
+    parent are moved, existing rows keep their IDs. Rows not defined in the
+    enumerations are deleted only with prune, and only if no transaction uses
+    them. Nothing is written when the database is up to date.
+
+    Args:
+        dry_run (bool): Only compute the changes, do not apply them.
+        prune (bool): Delete rows not defined in the enumerations.
+
+    Returns:
+        dict: The 'diff' per reference model, whether the database was
+            'changed', 'warnings' about skipped enumeration members and rows
+            'kept' because they are in use.
+    """
+    definitions, warnings = get_reference_definitions()
+
+    with transaction.atomic():
+        diff = diff_reference_data(definitions)
+        changed = has_changes(diff, prune) and not dry_run
+
+        kept = []
+        if changed:
+            kept = _apply_diff(diff, definitions, prune)
+            # bulk operations do not send model signals
+            transaction.on_commit(invalidate_reference_bundle)
+
+    return {'diff': diff, 'changed': changed, 'warnings': warnings, 'kept': kept}
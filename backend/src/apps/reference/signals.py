@@ -0,0 +1,15 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from apps.reference.models import Category, Status, Subcategory, TransactionType
+from apps.reference.services.bundle import invalidate_reference_bundle
+
+
+def invalidate_reference_bundle_on_change(sender, **kwargs):
+    # Invalidate after commit, so the rebuilt bundle sees the change
+    transaction.on_commit(invalidate_reference_bundle)
+
+
+for model in (Status, TransactionType, Category, Subcategory):
+    post_save.connect(invalidate_reference_bundle_on_change, sender=model)
+    post_delete.connect(invalidate_reference_bundle_on_change, sender=model)
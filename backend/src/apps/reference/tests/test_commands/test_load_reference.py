@@ -10,6 +10,7 @@ from apps.reference.enums import (
     TransactionTypeEnum,
 )
 from apps.reference.models import Category, Status, Subcategory, TransactionType
+from apps.transactions.tests.factories import TransactionFactory
 
 
 class LoadReferenceCommandTest(TestCase):
@@ -26,35 +27,12 @@ class LoadReferenceCommandTest(TestCase):
         )
         self.status = Status.objects.create(name='Test Status')
 
-    def test_load_reference_with_clear(self):
-        """Test that the command clears existing data and loads new data from enums."""
-        self.assertEqual(TransactionType.objects.count(), 1)
-        self.assertEqual(Category.objects.count(), 1)
-        self.assertEqual(Subcategory.objects.count(), 1)
-        self.assertEqual(Status.objects.count(), 1)
-
+    def call_command(self, *args):
         out = StringIO()
-        call_command('load_reference', stdout=out)
-
-        output = out.getvalue()
-        self.assertIn('Reference data cleared', output)
-        self.assertIn('Reference data loaded successfully', output)
-
-        self.assertEqual(
-            TransactionType.objects.count(),
-            len([t for t in TransactionTypeEnum if t.name != 'MAP']),
-        )
-        self.assertEqual(
-            Category.objects.count(), len([c for c in CategoryEnum if c.name != 'MAP'])
-        )
-        self.assertEqual(
-            Subcategory.objects.count(),
-            len([s for s in SubcategoryEnum if s.name != 'MAP']),
-        )
-        self.assertEqual(
-            Status.objects.count(), len([s for s in StatusEnum if s.name != 'MAP'])
-        )
+        call_command('load_reference', *args, stdout=out)
+        return out.getvalue()
 
+    def assertReferenceLoaded(self):
         for enum_value in TransactionTypeEnum.values():
             self.assertTrue(
                 TransactionType.objects.filter(name=enum_value).exists(),
@@ -63,13 +41,19 @@ class LoadReferenceCommandTest(TestCase):
 
         for enum_value in CategoryEnum.values():
             self.assertTrue(
-                Category.objects.filter(name=enum_value).exists(),
+                Category.objects.filter(
+                    name=enum_value,
+                    transaction_type__name=CategoryEnum.MAP.value[enum_value].value,
+                ).exists(),
                 f"Category '{enum_value}' was not loaded",
             )
 
         for enum_value in SubcategoryEnum.values():
             self.assertTrue(
-                Subcategory.objects.filter(name=enum_value).exists(),
+                Subcategory.objects.filter(
+                    name=enum_value,
+                    category__name=SubcategoryEnum.MAP.value[enum_value].value,
+                ).exists(),
                 f"Subcategory '{enum_value}' was not loaded",
             )
 
@@ -79,38 +63,81 @@ class LoadReferenceCommandTest(TestCase):
                 f"Status '{enum_value}' was not loaded",
             )
 
-    def test_load_reference_without_clear(self):
-        """
-        Test that the command loads data without clearing when --no-clear is specified.
-        """
-        initial_transaction_type_count = TransactionType.objects.count()
-        initial_category_count = Category.objects.count()
-        initial_subcategory_count = Subcategory.objects.count()
-        initial_status_count = Status.objects.count()
+    def test_load_reference(self):
+        """Test that the command loads data from enums and keeps other data."""
+        output = self.call_command()
 
-        out = StringIO()
-        call_command('load_reference', no_clear=True, stdout=out)
+        self.assertIn(f'Created {len(StatusEnum.values())} statuses', output)
+        self.assertIn('Not defined in enumerations 1 statuses: Test Status', output)
+        self.assertIn('Reference data synchronized', output)
+        self.assertReferenceLoaded()
+        self.assertTrue(Status.objects.filter(id=self.status.id).exists())
+        self.assertTrue(Subcategory.objects.filter(id=self.subcategory.id).exists())
 
-        output = out.getvalue()
-        self.assertNotIn('Reference data cleared', output)
-        self.assertIn('Reference data loaded successfully', output)
+    def test_load_reference_is_idempotent(self):
+        """Test that a repeated run does not write anything."""
+        self.call_command()
+        ids = set(Category.objects.values_list('id', flat=True))
 
-        self.assertTrue(
-            TransactionType.objects.filter(id=self.transaction_type.id).exists()
-        )
-        self.assertTrue(Category.objects.filter(id=self.category.id).exists())
-        self.assertTrue(Subcategory.objects.filter(id=self.subcategory.id).exists())
+        # Four reads, a savepoint and its release
+        with self.assertNumQueries(6):
+            output = self.call_command()
+
+        self.assertIn('Reference data is up to date', output)
+        self.assertEqual(set(Category.objects.values_list('id', flat=True)), ids)
+
+    def test_load_reference_no_clear(self):
+        """Test that the deprecated --no-clear option only warns."""
+        output = self.call_command('--no-clear')
+
+        self.assertIn('--no-clear is deprecated and has no effect', output)
+        self.assertIn('Reference data synchronized', output)
+        self.assertReferenceLoaded()
         self.assertTrue(Status.objects.filter(id=self.status.id).exists())
 
-        self.assertGreaterEqual(
-            TransactionType.objects.count(), initial_transaction_type_count
+    def test_load_reference_dry_run(self):
+        """Test that a dry run reports the changes without applying them."""
+        output = self.call_command('--dry-run')
+
+        self.assertIn(
+            f'Would create {len(TransactionTypeEnum.values())} transaction types',
+            output,
         )
-        self.assertGreaterEqual(Category.objects.count(), initial_category_count)
-        self.assertGreaterEqual(Subcategory.objects.count(), initial_subcategory_count)
-        self.assertGreaterEqual(Status.objects.count(), initial_status_count)
+        self.assertIn('Dry run, no changes applied', output)
+        self.assertEqual(TransactionType.objects.count(), 1)
+        self.assertEqual(Status.objects.count(), 1)
 
-        for enum_value in TransactionTypeEnum.values():
-            self.assertTrue(
-                TransactionType.objects.filter(name=enum_value).exists(),
-                f"Transaction Type '{enum_value}' was not loaded",
-            )
+    def test_load_reference_moves_category(self):
+        """Test that a category mapped to another transaction type is moved."""
+        self.call_command()
+        salary = Category.objects.get(name=CategoryEnum.SALARY.value)
+        salary.transaction_type = TransactionType.objects.get(
+            name=TransactionTypeEnum.EXPENSE.value
+        )
+        salary.save()
+
+        output = self.call_command()
+
+        self.assertIn('Moved 1 categories: Salary', output)
+        salary.refresh_from_db()
+        self.assertEqual(salary.transaction_type.name, TransactionTypeEnum.INCOME.value)
+        self.assertEqual(Category.objects.filter(name=salary.name).count(), 1)
+
+    def test_load_reference_prune(self):
+        """Test that pruning deletes data not defined in enums unless it is used."""
+        self.call_command()
+        TransactionFactory(
+            status=self.status,
+            transaction_type=self.transaction_type,
+            category=self.category,
+            subcategory=None,
+        )
+
+        output = self.call_command('--prune')
+
+        self.assertIn('Deleted 1 subcategories: Test Subcategory', output)
+        self.assertFalse(Subcategory.objects.filter(id=self.subcategory.id).exists())
+        self.assertIn('Category Test Category is in use, not deleted', output)
+        self.assertIn('Status Test Status is in use, not deleted', output)
+        self.assertTrue(Category.objects.filter(id=self.category.id).exists())
+        self.assertReferenceLoaded()
@@ -0,0 +1,93 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.reference import registry
+from apps.reference.enums import CategoryEnum, SubcategoryEnum, TransactionTypeEnum
+from apps.reference.services.bundle import invalidate_reference_bundle
+from apps.reference.tests.factories import CategoryFactory, TransactionTypeFactory
+
+
+class ReferenceRegistryTests(TestCase):
+    """Test suite for the compiled reference taxonomy registry."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        registry.clear_reference_ids()
+        self.transaction_type = TransactionTypeFactory(
+            name=TransactionTypeEnum.EXPENSE.value
+        )
+        self.category = CategoryFactory(
+            name=CategoryEnum.MARKETING.value, transaction_type=self.transaction_type
+        )
+
+    def tearDown(self):
+        """Drop the maps loaded from the rolled back test data."""
+        registry.clear_reference_ids()
+
+    def test_names_follow_enumerations(self):
+        """Test that the names match the enumeration values in their order."""
+        self.assertEqual(list(registry.CATEGORY_NAMES), CategoryEnum.values())
+        self.assertEqual(list(registry.SUBCATEGORY_NAMES), SubcategoryEnum.values())
+        self.assertIs(
+            registry.MEMBERS['categories']['Marketing'], CategoryEnum.MARKETING
+        )
+
+    def test_is_defined(self):
+        """Test that only enumeration values are defined, MAP excluded."""
+        self.assertTrue(registry.is_defined('subcategories', 'VPS'))
+        self.assertFalse(registry.is_defined('subcategories', 'Unknown'))
+        self.assertFalse(registry.is_defined('categories', 'MAP'))
+
+    def test_parent_and_children_indexes(self):
+        """Test that the parent maps and the inverted indexes agree."""
+        self.assertEqual(registry.CATEGORY_TRANSACTION_TYPES['Salary'], 'Income')
+        self.assertEqual(registry.SUBCATEGORY_CATEGORIES['Avito'], 'Marketing')
+        self.assertEqual(
+            registry.TRANSACTION_TYPE_CATEGORIES['Expense'],
+            ('Infrastructure', 'Marketing'),
+        )
+        self.assertEqual(
+            registry.CATEGORY_SUBCATEGORIES['Marketing'], ('Farpost', 'Avito')
+        )
+        self.assertEqual(registry.CATEGORY_SUBCATEGORIES['Salary'], ())
+
+    def test_maps_are_frozen(self):
+        """Test that the compiled maps cannot be modified."""
+        with self.assertRaises(TypeError):
+            registry.SUBCATEGORY_CATEGORIES['VPS'] = 'Marketing'
+
+    def test_reference_ids_are_loaded_once(self):
+        """Test that the name <-> ID maps are loaded once and then reused."""
+        ids = registry.get_reference_ids()
+
+        self.assertEqual(ids['categories'], {'Marketing': self.category.id})
+        self.assertEqual(
+            registry.get_reference_names()['transaction_types'],
+            {self.transaction_type.id: 'Expense'},
+        )
+        with self.assertNumQueries(0):
+            registry.get_reference_ids()
+
+    def test_reference_ids_reload_after_invalidation(self):
+        """Test that the name <-> ID maps are reloaded after reference data changes."""
+        registry.get_reference_ids()
+
+        category = CategoryFactory(
+            name=CategoryEnum.INFRASTRUCTURE.value,
+            transaction_type=self.transaction_type,
+        )
+        invalidate_reference_bundle()
+
+        with self.assertNumQueries(4):
+            ids = registry.get_reference_ids()
+        self.assertEqual(ids['categories']['Infrastructure'], category.id)
+
+    def test_reference_parent_ids(self):
+        """Test that categories and subcategories map to their parent IDs."""
+        parents = registry.get_reference_parent_ids()
+
+        self.assertEqual(
+            parents['categories'], {self.category.id: self.transaction_type.id}
+        )
+        self.assertEqual(parents['subcategories'], {})
@@ -0,0 +1,93 @@
+import orjson
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.reference.enums import StatusEnum
+from apps.reference.services.bundle import (
+    build_reference_bundle,
+    get_reference_bundle,
+    invalidate_reference_bundle,
+)
+from apps.reference.tests.factories import (
+    CategoryFactory,
+    StatusFactory,
+    SubcategoryFactory,
+    TransactionTypeFactory,
+)
+
+
+class ReferenceBundleServiceTests(TestCase):
+    """Test suite for the bundled reference data services."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.status = StatusFactory(name=StatusEnum.BUSINESS.value)
+        self.transaction_type = TransactionTypeFactory()
+        self.category = CategoryFactory(transaction_type=self.transaction_type)
+        self.subcategory = SubcategoryFactory(category=self.category)
+
+    def test_build_reference_bundle(self):
+        """Test that the bundle contains all reference data and the tree."""
+        with self.assertNumQueries(6):
+            bundle = build_reference_bundle()
+
+        self.assertEqual(
+            bundle['statuses'], [{'id': self.status.id, 'name': self.status.name}]
+        )
+        self.assertEqual(
+            bundle['categories'][0]['transaction_type_id'], self.transaction_type.id
+        )
+        self.assertEqual(bundle['subcategories'][0]['category_id'], self.category.id)
+        self.assertEqual(
+            bundle['tree'],
+            [
+                {
+                    'id': self.transaction_type.id,
+                    'name': self.transaction_type.name,
+                    'categories': [
+                        {
+                            'id': self.category.id,
+                            'name': self.category.name,
+                            'subcategories': [
+                                {
+                                    'id': self.subcategory.id,
+                                    'name': self.subcategory.name,
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ],
+        )
+
+    def test_get_reference_bundle_is_cached(self):
+        """Test that the rendered bundle is reused until invalidated."""
+        content, etag = get_reference_bundle()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_reference_bundle(), (content, etag))
+
+        self.assertEqual(orjson.loads(content)['statuses'][0]['id'], self.status.id)
+        self.assertTrue(etag.startswith('W/"'))
+
+    def test_change_invalidates_reference_bundle(self):
+        """Test that changing reference data rebuilds the bundle."""
+        _, etag = get_reference_bundle()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            new_status = StatusFactory(name=StatusEnum.PERSONAL.value)
+
+        content, new_etag = get_reference_bundle()
+        self.assertNotEqual(new_etag, etag)
+        self.assertIn(
+            new_status.id, [s['id'] for s in orjson.loads(content)['statuses']]
+        )
+
+    def test_invalidate_reference_bundle(self):
+        """Test that explicit invalidation rebuilds the bundle."""
+        get_reference_bundle()
+        invalidate_reference_bundle()
+
+        with self.assertNumQueries(6):
+            get_reference_bundle()
@@ -0,0 +1,55 @@
+from django.test import TestCase
+
+from apps.reference.enums import CategoryEnum, StatusEnum, TransactionTypeEnum
+from apps.reference.models import Category, Status, TransactionType
+from apps.reference.services.sync import (
+    diff_reference_data,
+    get_reference_definitions,
+    has_changes,
+    sync_reference_data,
+)
+
+
+class ReferenceSyncServiceTests(TestCase):
+    """Test suite for reference data sync services."""
+
+    def test_get_reference_definitions(self):
+        """Test that definitions map every category to its transaction type."""
+        definitions, warnings = get_reference_definitions()
+
+        self.assertEqual(warnings, [])
+        self.assertEqual(definitions['statuses'], StatusEnum.values())
+        self.assertEqual(
+            definitions['categories'][CategoryEnum.SALARY.value],
+            TransactionTypeEnum.INCOME.value,
+        )
+
+    def test_diff_reference_data(self):
+        """Test that the diff contains missing, moved and undefined rows."""
+        Status.objects.create(name=StatusEnum.TAX.value)
+        Status.objects.create(name='Archived')
+        expense = TransactionType.objects.create(name=TransactionTypeEnum.EXPENSE.value)
+        salary = Category.objects.create(
+            name=CategoryEnum.SALARY.value, transaction_type=expense
+        )
+        definitions, _ = get_reference_definitions()
+
+        diff = diff_reference_data(definitions)
+
+        self.assertNotIn(StatusEnum.TAX.value, diff['statuses']['create'])
+        self.assertIn(StatusEnum.BUSINESS.value, diff['statuses']['create'])
+        self.assertEqual(diff['statuses']['delete'], ['Archived'])
+        self.assertEqual(
+            diff['categories']['update'],
+            [(salary.id, salary.name, TransactionTypeEnum.INCOME.value)],
+        )
+        self.assertTrue(has_changes(diff))
+
+    def test_sync_reference_data(self):
+        """Test that after a sync the diff is empty."""
+        result = sync_reference_data()
+        definitions, _ = get_reference_definitions()
+
+        self.assertTrue(result['changed'])
+        self.assertFalse(has_changes(diff_reference_data(definitions), prune=True))
+        self.assertFalse(sync_reference_data()['changed'])
@@ -0,0 +1,64 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.reference.enums import StatusEnum
+from apps.reference.tests.factories import (
+    CategoryFactory,
+    StatusFactory,
+    SubcategoryFactory,
+)
+
+
+@override_settings(REFERENCE_BUNDLE_MAX_AGE=3600)
+class ReferenceBundleViewsTests(APITestCase):
+    """Test suite for the bundled reference data view."""
+
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.url = reverse('reference-bundle')
+        self.status_obj = StatusFactory(name=StatusEnum.BUSINESS.value)
+        self.subcategory = SubcategoryFactory(category=CategoryFactory())
+
+    def test_get_reference_bundle(self):
+        """Test retrieving all reference data in one response."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response['Cache-Control'], 'public, max-age=3600')
+        self.assertTrue(response['ETag'].startswith('W/"'))
+
+        data = response.json()
+        self.assertEqual(data['statuses'][0]['id'], self.status_obj.id)
+        self.assertEqual(data['subcategories'][0]['id'], self.subcategory.id)
+        self.assertEqual(
+            data['tree'][0]['categories'][0]['subcategories'][0]['id'],
+            self.subcategory.id,
+        )
+
+    def test_get_reference_bundle_not_modified(self):
+        """Test that a matching If-None-Match returns 304."""
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_get_reference_bundle_modified(self):
+        """Test that a stale If-None-Match returns the new bundle."""
+        etag = self.client.get(self.url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            StatusFactory(name=StatusEnum.PERSONAL.value)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(len(response.json()['statuses']), 2)
@@ -1,3 +1,4 @@
+from apps.reference.urls.bundle import bundle_patterns
 from apps.reference.urls.category import category_patterns
 from apps.reference.urls.status import status_patterns
 from apps.reference.urls.subcategories import subcategory_patterns
@@ -6,6 +7,7 @@ from apps.reference.urls.transaction_type import transaction_type_patterns
 __all__ = ['urlpatterns']
 
 urlpatterns = [
+    *bundle_patterns,
     *status_patterns,
     *category_patterns,
     *transaction_type_patterns,
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from apps.reference.views.bundle import ReferenceBundleView
+
+bundle_patterns = [
+    path('reference/', ReferenceBundleView.as_view(), name='reference-bundle'),
+]
@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework.permissions import AllowAny
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from apps.reference.serializers.bundle import ReferenceBundleSerializer
+from apps.reference.services.bundle import get_reference_bundle
+
+
+class ReferenceBundleView(APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    out_serializer_class = ReferenceBundleSerializer
+
+    @swagger_auto_schema(
+        operation_summary='Get all reference data',
+        operation_description='Returns statuses, transaction types, categories '
+        'and subcategories with the transaction type -> category -> subcategory '
+        'tree in one response. The response carries an ETag and may be cached; '
+        'send `If-None-Match` to revalidate it.',
+        security=[],
+        responses={
+            200: out_serializer_class,
+            304: openapi.Response(description='Reference data not modified'),
+        },
+    )
+    def get(self, request: Request):
+        content, etag = get_reference_bundle()
+
+        if_none_match = request.headers.get('If-None-Match', '')
+        if etag.removeprefix('W/') in if_none_match or if_none_match == '*':
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type='application/json')
+
+        response['ETag'] = etag
+        patch_cache_control(
+            response, public=True, max_age=settings.REFERENCE_BUNDLE_MAX_AGE
+        )
+        return response
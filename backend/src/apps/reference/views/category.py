@@ -7,6 +7,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.db.routers import read_from_replica
 from apps.reference.serializers.category import (
     CategoryDetailSerializer,
     CategorySerializer,
@@ -38,6 +39,7 @@ class CategoryListCreateView(APIView):
         security=[],
         responses={200: out_serializer_class(many=True)},
     )
+    @read_from_replica
     def get(self, request: Request):
         categories = get_all_categories()
         serializer = self.out_serializer_class(categories, many=True)
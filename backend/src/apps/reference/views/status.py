@@ -7,6 +7,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.db.routers import read_from_replica
 from apps.reference.serializers.status import (
     StatusDetailSerializer,
     StatusSerializer,
@@ -37,6 +38,7 @@ class StatusListCreateView(APIView):
         security=[],
         responses={200: out_serializer_class(many=True)},
     )
+    @read_from_replica
     def get(self, request: Request):
         statuses = get_all_statuses()
         serializer = self.out_serializer_class(statuses, many=True)
@@ -1,10 +1,14 @@
 from django.contrib import admin
+from django.db import transaction as db_transaction
+
+from apps.core.admin import KeysetPaginationMixin
+from apps.users.models import User
 
 from .models import Transaction
 
 
 @admin.register(Transaction)
-class TransactionAdmin(admin.ModelAdmin):
+class TransactionAdmin(KeysetPaginationMixin, admin.ModelAdmin):
     list_display = (
         'id',
         'user',
@@ -16,6 +20,14 @@ class TransactionAdmin(admin.ModelAdmin):
         'created_at',
         'updated_at',
     )
+    list_select_related = (
+        'user',
+        'status',
+        'transaction_type',
+        'category',
+        'subcategory',
+    )
+    # The reference tables are small, their filter choices are cheap to list
     list_filter = (
         'status',
         'transaction_type',
@@ -27,4 +39,53 @@ class TransactionAdmin(admin.ModelAdmin):
         'user__email',
         'comment',
     )
-    ordering = ('-created_at',)
+    search_help_text = 'The exact email of a user, or a part of the comment.'
+    autocomplete_fields = ('user',)
+    # Paged with the transaction_created_id_idx index
+    ordering = ('-created_at', '-id')
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Search by the email of the user or by a part of the comment.
+
+        An email is looked up in the users table first, so transactions are
+        read with the user index instead of joining every row, and comments
+        are matched with the trigram index.
+        """
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        if '@' in search_term:
+            users = User.objects.filter(email__iexact=search_term)
+            return queryset.filter(user__in=users), False
+        return queryset.filter(comment__icontains=search_term), False
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        self.refresh_users({obj.user_id, form.initial.get('user', obj.user_id)})
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        self.refresh_users({obj.user_id})
+
+    def delete_queryset(self, request, queryset):
+        user_ids = set(queryset.values_list('user_id', flat=True).distinct())
+        super().delete_queryset(request, queryset)
+        self.refresh_users(user_ids)
+
+    def refresh_users(self, user_ids):
+        """
+        Recompute the ledger stats and drop the cached running balances of
+        users once the change is committed, the admin bypasses the services
+        that keep them up to date.
+        """
+        # Imported here, the reports are not needed to load the admin
+        from apps.transactions.reports import invalidate_balance
+        from apps.transactions.stats import reconcile_ledger_stats
+
+        def refresh():
+            reconcile_ledger_stats(sorted(user_ids))
+            for user_id in user_ids:
+                invalidate_balance(user_id)
+
+        db_transaction.on_commit(refresh)
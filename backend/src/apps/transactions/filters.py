@@ -0,0 +1,253 @@
+"""
+Declarative filters of transaction queries.
+
+FILTERS declares every filterable field with its lookups. Query parameters
+are parsed against it once into TransactionFilters, which holds a single Q
+object for the queryset and the created_at range for the archive and the
+reports:
+
+    created_at__gte, __gt, __lte, __lt, __exact
+        An ISO 8601 datetime, or a date (YYYY-MM-DD or DATE_INPUT_FORMATS)
+        meaning the whole day. All bounds are combined into one half-open
+        [start, end) range of timestamps the index can seek to.
+    amount__gte, __gt, __lte, __lt, __exact
+        A decimal amount, zero included.
+    status, transaction_type, category, subcategory (and their __in)
+        Reference IDs. Several IDs, comma-separated or repeated, match any of
+        them.
+
+Any bound may be left out. Unknown lookups of these fields, other lookups
+with '__' and invalid values raise a ValidationError rather than being
+ignored.
+"""
+
+from datetime import date, datetime, time, timedelta
+from types import MappingProxyType
+
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import ISO_8601, api_settings
+
+# Maximum number of IDs matched by one reference filter
+MAX_IN_VALUES = 100
+
+# Timestamps are stored with microsecond precision
+_RESOLUTION = timedelta(microseconds=1)
+
+RANGE_LOOKUPS = ('exact', 'gte', 'gt', 'lte', 'lt')
+IN_LOOKUPS = ('exact', 'in')
+
+# Filterable field -> (kind, supported lookups)
+FILTERS = MappingProxyType(
+    {
+        'created_at': ('datetime', RANGE_LOOKUPS),
+        'amount': ('decimal', RANGE_LOOKUPS),
+        'status': ('reference', IN_LOOKUPS),
+        'transaction_type': ('reference', IN_LOOKUPS),
+        'category': ('reference', IN_LOOKUPS),
+        'subcategory': ('reference', IN_LOOKUPS),
+    }
+)
+
+_amount_field = serializers.DecimalField(max_digits=15, decimal_places=2)
+_reference_field = serializers.IntegerField(min_value=1)
+
+
+class TransactionFilters:
+    """
+    Parsed transaction filters.
+
+    Attributes:
+        q (Q): The conditions of all filters.
+        start (datetime | None): The inclusive lower created_at bound.
+        end (datetime | None): The exclusive upper created_at bound.
+    """
+
+    def __init__(self, q: Q = None, start: datetime = None, end: datetime = None):
+        self.q = q or Q()
+        self.start = start
+        self.end = end
+
+    def __bool__(self):
+        return bool(self.q)
+
+    def apply(self, queryset):
+        """
+        Filter a transaction or archived transaction queryset.
+        """
+        return queryset.filter(self.q) if self.q else queryset
+
+    def reaches(self, cutoff: datetime):
+        """
+        Check whether the created_at range selects transactions before a moment.
+
+        Without created_at filters no range is selected.
+        """
+        if self.start is None:
+            return self.end is not None
+        return self.start < cutoff
+
+    def includes(self, moment: datetime):
+        """
+        Check whether a moment lies within the created_at range.
+        """
+        return (self.start is None or self.start <= moment) and (
+            self.end is None or moment < self.end
+        )
+
+
+def _parse_date(value):
+    if isinstance(value, datetime):
+        return None
+    if isinstance(value, date):
+        return value
+    field = serializers.DateField(
+        input_formats=[ISO_8601, *api_settings.DATE_INPUT_FORMATS]
+    )
+    try:
+        return field.to_internal_value(value)
+    except ValidationError:
+        return None
+
+
+def _parse_created_at(lookup: str, value, tz):
+    """
+    Get the [start, end) range of a created_at filter.
+    """
+    day = _parse_date(value)
+    if day is not None:
+        if day == date.max:
+            raise ValidationError(f'Enter a date before {date.max.isoformat()}.')
+        start = timezone.make_aware(datetime.combine(day, time.min), tz)
+        end = timezone.make_aware(
+            datetime.combine(day + timedelta(days=1), time.min), tz
+        )
+    elif isinstance(value, datetime):
+        start = value if timezone.is_aware(value) else timezone.make_aware(value, tz)
+        end = start + _RESOLUTION
+    else:
+        field = serializers.DateTimeField(input_formats=[ISO_8601], default_timezone=tz)
+        try:
+            start = field.to_internal_value(value)
+        except ValidationError as error:
+            raise ValidationError(
+                'Enter an ISO 8601 datetime or a date as YYYY-MM-DD or '
+                f'{", ".join(api_settings.DATE_INPUT_FORMATS)}.'
+            ) from error
+        end = start + _RESOLUTION
+
+    return {
+        'exact': (start, end),
+        'gte': (start, None),
+        'gt': (end, None),
+        'lte': (None, end),
+        'lt': (None, start),
+    }[lookup]
+
+
+def _values(value):
+    values = []
+    for raw in value if isinstance(value, list | tuple) else [value]:
+        if isinstance(raw, str):
+            values.extend(item.strip() for item in raw.split(',') if item.strip())
+        elif raw is not None:
+            values.append(raw)
+    return values
+
+
+def _get_params(params):
+    # A QueryDict holds every value of a repeated parameter
+    if hasattr(params, 'getlist'):
+        return {key: params.getlist(key) for key in params}
+    return dict(params)
+
+
+def _parse_filter(param: str, value, tz):
+    """
+    Parse one filter parameter into a condition or a created_at range.
+
+    Returns:
+        tuple: The Q condition, or None for created_at, and the (start, end)
+            bounds of created_at, or None for other fields.
+    """
+    field, _, lookup = param.partition('__')
+    kind, lookups = FILTERS[field]
+    lookup = lookup or 'exact'
+    if lookup not in lookups:
+        raise ValidationError(f'Unsupported lookup, use one of: {", ".join(lookups)}.')
+
+    values = _values(value)
+    if not values:
+        raise ValidationError('This filter requires a value.')
+
+    if kind == 'reference':
+        ids = sorted({_reference_field.to_internal_value(item) for item in values})
+        if len(ids) > MAX_IN_VALUES:
+            raise ValidationError(
+                f'Ensure there are no more than {MAX_IN_VALUES} values.'
+            )
+        if len(ids) == 1:
+            return Q(**{field: ids[0]}), None
+        return Q(**{f'{field}__in': ids}), None
+
+    if len(values) > 1:
+        raise ValidationError('Only one value is allowed.')
+    if kind == 'decimal':
+        amount = _amount_field.to_internal_value(values[0])
+        return Q(**{f'{field}__{lookup}': amount}), None
+    return None, _parse_created_at(lookup, values[0], tz)
+
+
+def parse_filters(params, tz=None):
+    """
+    Parse transaction filters from query parameters.
+
+    Parameters that are not filters, e.g. 'ordering', are ignored.
+
+    Args:
+        params (QueryDict | dict): The query parameters; values may be lists.
+        tz (tzinfo, optional): The time zone days of date filters start in,
+            defaults to the current time zone.
+
+    Returns:
+        TransactionFilters: The parsed filters.
+
+    Raises:
+        ValidationError: If a filter is not supported or its value is invalid,
+            with the errors by parameter.
+    """
+    tz = tz or timezone.get_current_timezone()
+    q = Q()
+    starts, ends = [], []
+    errors = {}
+
+    for param, value in _get_params(params).items():
+        field, _, lookup = param.partition('__')
+        if field not in FILTERS:
+            if lookup:
+                errors[param] = ['Unsupported filter.']
+            continue
+        try:
+            condition, bounds = _parse_filter(param, value, tz)
+        except ValidationError as error:
+            errors[param] = error.detail
+            continue
+        if condition is not None:
+            q &= condition
+        else:
+            starts.append(bounds[0])
+            ends.append(bounds[1])
+
+    if errors:
+        raise ValidationError(errors)
+
+    # created_at is compiled to a single seekable range
+    start = max((bound for bound in starts if bound is not None), default=None)
+    end = min((bound for bound in ends if bound is not None), default=None)
+    if start is not None:
+        q &= Q(created_at__gte=start)
+    if end is not None:
+        q &= Q(created_at__lt=end)
+    return TransactionFilters(q, start, end)
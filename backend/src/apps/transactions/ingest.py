@@ -0,0 +1,212 @@
+"""
+Write-behind ingestion of transactions.
+
+Validated rows are appended to a buffer of the worker process and answered
+with a ticket. A background thread of the worker commits the buffer with
+bulk_create when it holds TRANSACTIONS_INGEST_BATCH_SIZE rows or every
+TRANSACTIONS_INGEST_FLUSH_INTERVAL_MS milliseconds, and records the outcome
+of every ticket in the cache, where clients poll it.
+
+Rows are held in memory until they are flushed: rows of a worker that is
+killed before its next flush are lost and their tickets stay 'queued'.
+"""
+
+import atexit
+import logging
+import os
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+from django.db import transaction as db_transaction
+
+from apps.transactions.models import Transaction
+from apps.transactions.stats import record_created
+from apps.users.models import User
+
+logger = logging.getLogger(__name__)
+
+INGEST_TICKET_CACHE_KEY = 'transactions:ingest:{ticket}'
+
+QUEUED = 'queued'
+COMMITTED = 'committed'
+FAILED = 'failed'
+
+# Buffer and flusher thread of the current worker process
+_buffer = {}
+
+
+def _get_buffer():
+    # Workers are forked from the master, which must not share its buffer
+    if _buffer.get('pid') != os.getpid():
+        _buffer.clear()
+        _buffer.update(
+            pid=os.getpid(),
+            lock=threading.Lock(),
+            rows=[],
+            wakeup=threading.Event(),
+            flusher=None,
+        )
+    return _buffer
+
+
+def _set_ticket(ticket: str, user_id: int, status: str, count: int, error=None):
+    cache.set(
+        INGEST_TICKET_CACHE_KEY.format(ticket=ticket),
+        {'user_id': user_id, 'status': status, 'count': count, 'error': error},
+        timeout=settings.TRANSACTIONS_INGEST_TICKET_TIMEOUT,
+    )
+
+
+def get_ticket(ticket: str, user: User):
+    """
+    Get the status of an ingest ticket.
+
+    Args:
+        ticket (str): The ticket returned by enqueue_transactions.
+        user (User): The user polling the ticket.
+
+    Returns:
+        dict | None: The 'status' ('queued', 'committed' or 'failed'), the
+            'count' of transactions and the 'error' of a failed flush, or None
+            if the ticket does not exist, expired or belongs to another user.
+    """
+    data = cache.get(INGEST_TICKET_CACHE_KEY.format(ticket=ticket))
+    if data is None or data['user_id'] != user.pk:
+        return None
+    return {key: data[key] for key in ('status', 'count', 'error')}
+
+
+def enqueue_transactions(rows: list, user: User):
+    """
+    Buffer validated transactions to be created by the flusher thread.
+
+    Args:
+        rows (list[dict]): Transaction fields with reference IDs, as validated
+            by TransactionIngestSerializer.
+        user (User): The owner of the transactions.
+
+    Returns:
+        str: The ticket to poll the status of the transactions with.
+    """
+    ticket = uuid.uuid4().hex
+    _set_ticket(ticket, user.pk, QUEUED, len(rows))
+
+    buffer = _get_buffer()
+    with buffer['lock']:
+        buffer['rows'].extend(
+            (ticket, Transaction(user_id=user.pk, **row)) for row in rows
+        )
+        full = len(buffer['rows']) >= settings.TRANSACTIONS_INGEST_BATCH_SIZE
+        if buffer['flusher'] is None:
+            _start_flusher(buffer)
+
+    if full:
+        buffer['wakeup'].set()
+    return ticket
+
+
+def _create_transactions(transactions: list):
+    created = Transaction.objects.bulk_create(
+        transactions, batch_size=settings.TRANSACTIONS_INGEST_BATCH_SIZE
+    )
+    record_created(created)
+
+
+def flush_transactions():
+    """
+    Create the buffered transactions of the worker in one database transaction.
+
+    If the batch fails, the tickets are created again one by one in
+    savepoints, so only the tickets that fail on their own are marked failed.
+
+    Returns:
+        int: The number of transactions created.
+    """
+    buffer = _get_buffer()
+    with buffer['lock']:
+        rows, buffer['rows'] = buffer['rows'], []
+    if not rows:
+        return 0
+
+    tickets = {}
+    for ticket, transaction in rows:
+        tickets.setdefault(ticket, []).append(transaction)
+
+    try:
+        with db_transaction.atomic():
+            _create_transactions([transaction for _, transaction in rows])
+    except DatabaseError:
+        logger.exception('Failed to flush %d ingested transactions', len(rows))
+        return _flush_tickets(tickets)
+
+    for ticket, transactions in tickets.items():
+        _set_ticket(ticket, transactions[0].user_id, COMMITTED, len(transactions))
+    return len(rows)
+
+
+def _flush_tickets(tickets: dict):
+    """
+    Create the transactions of every ticket in a savepoint of its own.
+    """
+    committed = []
+    failed = []
+    try:
+        with db_transaction.atomic():
+            for ticket, transactions in tickets.items():
+                # IDs assigned by the failed batch were rolled back
+                for transaction in transactions:
+                    transaction.pk = None
+                try:
+                    with db_transaction.atomic():
+                        _create_transactions(transactions)
+                except DatabaseError:
+                    logger.exception('Failed to flush the ingest ticket %s', ticket)
+                    failed.append(ticket)
+                else:
+                    committed.append(ticket)
+    except DatabaseError:
+        logger.exception('Failed to flush %d ingest tickets', len(tickets))
+        committed, failed = [], list(tickets)
+
+    # The database error is only logged, it may show rows of other users
+    for ticket in failed:
+        transactions = tickets[ticket]
+        _set_ticket(
+            ticket,
+            transactions[0].user_id,
+            FAILED,
+            len(transactions),
+            'The transactions could not be saved',
+        )
+    for ticket in committed:
+        transactions = tickets[ticket]
+        _set_ticket(ticket, transactions[0].user_id, COMMITTED, len(transactions))
+    return sum(len(tickets[ticket]) for ticket in committed)
+
+
+def _start_flusher(buffer: dict):
+    buffer['flusher'] = threading.Thread(
+        target=_run_flusher, args=(buffer,), name='transactions-ingest', daemon=True
+    )
+    buffer['flusher'].start()
+    # Rows buffered when the worker exits normally are still committed
+    atexit.register(flush_transactions)
+
+
+def _run_flusher(buffer: dict):
+    while True:
+        buffer['wakeup'].wait(settings.TRANSACTIONS_INGEST_FLUSH_INTERVAL_MS / 1000)
+        buffer['wakeup'].clear()
+        with buffer['lock']:
+            pending = bool(buffer['rows'])
+        if not pending:
+            continue
+        try:
+            flush_transactions()
+            # The connection of this thread is reopened by the next flush
+            connections.close_all()
+        except Exception:
+            logger.exception('Transactions ingest flusher failed')
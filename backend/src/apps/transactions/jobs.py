@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.jobs.registry import job
+from apps.jobs.services import report_progress
+from apps.transactions.models import Transaction
+from apps.transactions.services import archive_transactions
+
+
+@job('transactions.archive', concurrency=1)
+def archive(job, older_than_days=None, batch_size=None):
+    """
+    Move transactions older than the archive horizon to the archive table.
+
+    Args:
+        older_than_days (int, optional): Archive transactions created more
+            than this many days ago, defaults to TRANSACTIONS_ARCHIVE_AFTER_DAYS.
+            Lists keep returning archived transactions whatever the horizon.
+        batch_size (int, optional): Number of transactions moved per database
+            transaction, defaults to TRANSACTIONS_ARCHIVE_BATCH_SIZE.
+
+    Returns:
+        dict: The number of archived transactions.
+    """
+    if older_than_days is None:
+        older_than_days = settings.TRANSACTIONS_ARCHIVE_AFTER_DAYS
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    pending = Transaction.objects.filter(created_at__lt=cutoff).count()
+
+    total = 0
+    for archived in archive_transactions(
+        cutoff, batch_size or settings.TRANSACTIONS_ARCHIVE_BATCH_SIZE
+    ):
+        total += archived
+        report_progress(job, total * 100 // max(pending, total))
+    return {'archived': total}
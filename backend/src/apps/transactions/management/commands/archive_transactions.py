@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.transactions.models import Transaction
+from apps.transactions.services import archive_transactions
+
+
+class Command(BaseCommand):
+    help = 'Moves transactions older than the archive horizon to the archive table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days',
+            type=int,
+            dest='older_than_days',
+            default=settings.TRANSACTIONS_ARCHIVE_AFTER_DAYS,
+            help='Archive transactions created more than this many days ago',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            dest='batch_size',
+            default=settings.TRANSACTIONS_ARCHIVE_BATCH_SIZE,
+            help='Number of transactions moved per database transaction',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            dest='dry_run',
+            default=False,
+            help='Only report how many transactions would be archived',
+        )
+
+    def handle(self, *args, **options):
+        older_than_days = options['older_than_days']
+        batch_size = options['batch_size']
+
+        if older_than_days < 0:
+            raise CommandError('--older-than-days must not be negative')
+        if batch_size < 1:
+            raise CommandError('--batch-size must be positive')
+
+        cutoff = timezone.now() - timedelta(days=older_than_days)
+
+        if options['dry_run']:
+            count = Transaction.objects.filter(created_at__lt=cutoff).count()
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'{count} transactions created before {cutoff:%Y-%m-%d} '
+                    'would be archived'
+                )
+            )
+            return
+
+        self.stdout.write(f'Archiving transactions created before {cutoff:%Y-%m-%d}...')
+
+        total = 0
+        for archived in archive_transactions(cutoff, batch_size):
+            total += archived
+            self.stdout.write(f'Archived {total} transactions')
+
+        self.stdout.write(self.style.SUCCESS(f'Archived {total} transactions in total'))
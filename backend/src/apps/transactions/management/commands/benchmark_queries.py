@@ -0,0 +1,155 @@
+import json
+import random
+import statistics
+import time
+from contextlib import contextmanager, nullcontext
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Count
+
+from apps.core.db.prepared import prepared_statements
+from apps.transactions.models import Transaction
+from apps.transactions.services import get_transaction_by_id, get_user_transactions
+from apps.users.models import User
+
+# Connection options of every measured mode, on top of the configured ones
+MODES = {
+    'client-side binding': {},
+    'server-side binding': {'server_side_binding': True},
+    'prepared statements': {'server_side_binding': True, 'prepare_threshold': 5},
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures latency percentiles of the hot transaction queries with and '
+        'without server-side prepared statements'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            dest='email',
+            default=None,
+            help='Email of the user whose transactions are queried, '
+            'defaults to the user with the most transactions',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            dest='iterations',
+            default=2000,
+            help='Number of timed executions per query and mode',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            dest='limit',
+            default=50,
+            help='Number of transactions fetched by the list query',
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        limit = options['limit']
+        if iterations < 1 or limit < 1:
+            raise CommandError('--iterations and --limit must be positive')
+
+        user = self.get_user(options['email'])
+        transaction_ids = list(
+            Transaction.objects.filter(user=user).values_list('id', flat=True)[:1000]
+        )
+
+        queries = {
+            'get_user_transactions': lambda: list(get_user_transactions(user)[:limit]),
+            'get_transaction_by_id': lambda: get_transaction_by_id(
+                random.choice(transaction_ids), user
+            ),
+        }
+
+        self.stdout.write(
+            f'{len(transaction_ids)}+ transactions of {user.email}, '
+            f'{iterations} executions per query'
+        )
+        self.write_planning_times(user, transaction_ids[0], limit)
+
+        self.stdout.write(
+            f'{"query":<24}{"mode":<22}{"p50 ms":>10}{"p99 ms":>10}{"mean ms":>10}'
+        )
+        for name, query in queries.items():
+            for mode, mode_options in MODES.items():
+                with self.use_options(mode_options):
+                    prepared = mode == 'prepared statements'
+                    with prepared_statements() if prepared else nullcontext():
+                        timings = self.measure(query, iterations)
+                self.stdout.write(
+                    f'{name:<24}{mode:<22}'
+                    f'{statistics.median(timings):>10.3f}'
+                    f'{statistics.quantiles(timings, n=100)[98]:>10.3f}'
+                    f'{statistics.fmean(timings):>10.3f}'
+                )
+
+    def get_user(self, email):
+        if email:
+            try:
+                return User.objects.get(email=email)
+            except User.DoesNotExist as error:
+                raise CommandError(f'No user with email {email}') from error
+
+        top = (
+            Transaction.objects.values('user')
+            .annotate(count=Count('id'))
+            .order_by('-count')
+            .first()
+        )
+        if top is None:
+            raise CommandError('There are no transactions to query')
+        return User.objects.get(pk=top['user'])
+
+    def write_planning_times(self, user, transaction_id, limit):
+        """Planning and execution times reported by EXPLAIN ANALYZE."""
+        plans = {
+            'get_user_transactions': get_user_transactions(user)[:limit],
+            'get_transaction_by_id': Transaction.objects.select_related(
+                'status', 'transaction_type', 'category', 'subcategory', 'user'
+            ).filter(id=transaction_id),
+        }
+        for name, queryset in plans.items():
+            plan = json.loads(queryset.explain(format='json', analyze=True))[0]
+            self.stdout.write(
+                f'{name:<24}planning {plan["Planning Time"]:.3f} ms, '
+                f'execution {plan["Execution Time"]:.3f} ms'
+            )
+
+    @contextmanager
+    def use_options(self, mode_options):
+        """Run queries on a new connection with the options of a mode."""
+        original = connections[DEFAULT_DB_ALIAS]
+        options = {
+            key: value
+            for key, value in original.settings_dict['OPTIONS'].items()
+            if key not in ('pool', 'server_side_binding', 'prepare_threshold')
+        }
+        connection = original.__class__(
+            {**original.settings_dict, 'OPTIONS': {**options, **mode_options}},
+            DEFAULT_DB_ALIAS,
+        )
+        connections[DEFAULT_DB_ALIAS] = connection
+        try:
+            yield
+        finally:
+            connection.close()
+            connections[DEFAULT_DB_ALIAS] = original
+
+    def measure(self, query, iterations):
+        # Warm up the connection, caches and prepared statements
+        for _ in range(20):
+            query()
+
+        timings = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            query()
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
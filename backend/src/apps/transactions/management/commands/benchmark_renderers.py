@@ -0,0 +1,93 @@
+import random
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.renderers import MessagePackRenderer, ORJSONRenderer
+from apps.reference.models import Category, Status, Subcategory, TransactionType
+from apps.transactions.models import Transaction
+from apps.transactions.serializers import TransactionListSerializer
+
+RENDERERS = [
+    JSONRenderer,
+    ORJSONRenderer,
+    MessagePackRenderer,
+]
+
+
+class Command(BaseCommand):
+    help = 'Measures render time of the transaction list per 10k rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            dest='rows',
+            default=10000,
+            help='Number of transactions in the rendered list',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            dest='repeat',
+            default=5,
+            help='Number of runs per renderer, the best one is reported',
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        repeat = options['repeat']
+        if rows < 1 or repeat < 1:
+            raise CommandError('--rows and --repeat must be positive')
+
+        data = TransactionListSerializer(self.build_transactions(rows), many=True).data
+        self.stdout.write(f'Rendering {rows} transactions, best of {repeat} runs')
+
+        for renderer_class in RENDERERS:
+            renderer = renderer_class()
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                content = renderer.render(data)
+                timings.append(time.perf_counter() - started)
+
+            per_10k_ms = min(timings) * 1000 * 10000 / rows
+            self.stdout.write(
+                f'{renderer_class.__name__:<24}{per_10k_ms:>10.2f} ms / 10k rows'
+                f'{len(content):>12} bytes'
+            )
+
+    def build_transactions(self, rows: int):
+        """Unsaved transactions with related objects, no database access."""
+        transaction_type = TransactionType(id=1, name='Expense')
+        statuses = [Status(id=1, name='Completed'), Status(id=2, name='Pending')]
+        categories = [
+            Category(id=i, name=f'Category {i}', transaction_type=transaction_type)
+            for i in range(1, 11)
+        ]
+        now = timezone.now()
+
+        transactions = []
+        for i in range(rows):
+            category = random.choice(categories)
+            created_at = now - timedelta(minutes=i)
+            transactions.append(
+                Transaction(
+                    id=i + 1,
+                    status=random.choice(statuses),
+                    transaction_type=transaction_type,
+                    category=category,
+                    subcategory=Subcategory(
+                        id=category.id, name=f'Subcategory {i % 5}', category=category
+                    ),
+                    amount=Decimal(random.randint(100, 1000000)) / 100,
+                    comment='Groceries',
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+            )
+        return transactions
@@ -0,0 +1,67 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.transactions.partitions import (
+    DEFAULT_MONTHS_AHEAD,
+    analyze_partitions,
+    detach_partitions,
+    ensure_partitions,
+)
+
+
+class Command(BaseCommand):
+    help = 'Creates future monthly partitions of transactions and detaches old ones'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            dest='months_ahead',
+            default=DEFAULT_MONTHS_AHEAD,
+            help='Number of months after the current one to create partitions for',
+        )
+        parser.add_argument(
+            '--detach-before',
+            dest='detach_before',
+            default=None,
+            help='Detach partitions of months before this one (YYYY-MM)',
+        )
+        parser.add_argument(
+            '--analyze',
+            action='store_true',
+            dest='analyze',
+            default=False,
+            help='Refresh planner statistics of the partitioned table',
+        )
+
+    def handle(self, *args, **options):
+        months_ahead = options['months_ahead']
+        if months_ahead < 0:
+            raise CommandError('--months-ahead must not be negative')
+
+        before = None
+        if options['detach_before']:
+            try:
+                before = datetime.strptime(options['detach_before'], '%Y-%m').date()
+            except ValueError as e:
+                raise CommandError('--detach-before must be in YYYY-MM format') from e
+
+        self.stdout.write('Creating partitions...')
+        created = ensure_partitions(months_ahead)
+        for name in created:
+            self.stdout.write(f'Created partition {name}')
+        self.stdout.write(self.style.SUCCESS(f'Created {len(created)} partitions'))
+
+        if before:
+            self.stdout.write('Detaching partitions...')
+            detached = detach_partitions(before)
+            for name in detached:
+                self.stdout.write(f'Detached partition {name}')
+            self.stdout.write(
+                self.style.SUCCESS(f'Detached {len(detached)} partitions')
+            )
+
+        if options['analyze']:
+            analyze_partitions()
+            self.stdout.write(self.style.SUCCESS('Partition statistics refreshed'))
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.transactions.stats import reconcile_ledger_stats
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the ledger stats of users from their transactions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            dest='email',
+            default=None,
+            help='Email of the only user to reconcile, defaults to all users',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            dest='batch_size',
+            default=1000,
+            help='Number of users reconciled per database transaction',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be positive')
+
+        users = User.objects.order_by('pk')
+        if options['email']:
+            users = users.filter(email=options['email'])
+            if not users.exists():
+                raise CommandError(f'No user with email {options["email"]}')
+
+        checked = fixed = 0
+        last_id = 0
+        while True:
+            user_ids = list(
+                users.filter(pk__gt=last_id).values_list('pk', flat=True)[:batch_size]
+            )
+            if not user_ids:
+                break
+            last_id = user_ids[-1]
+
+            for user_id in reconcile_ledger_stats(user_ids):
+                self.stdout.write(
+                    self.style.WARNING(f'Fixed the ledger stats of user #{user_id}')
+                )
+                fixed += 1
+            checked += len(user_ids)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Reconciled the ledger stats of {checked} users, {fixed} fixed'
+            )
+        )
@@ -0,0 +1,132 @@
+from datetime import date
+
+from django.db import migrations, models
+
+TABLE = 'transactions_transaction'
+MONTHS_AHEAD = 3
+
+
+def _add_months(value, months):
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _get_table_dependencies(cursor):
+    """Definitions of the secondary indexes and foreign keys of the table."""
+    cursor.execute(
+        """
+        SELECT pg_get_indexdef(indexrelid)
+        FROM pg_index
+        WHERE indrelid = %s::regclass AND NOT indisprimary
+        """,
+        [TABLE],
+    )
+    indexes = [row[0] for row in cursor.fetchall()]
+
+    cursor.execute(
+        """
+        SELECT conname, pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE conrelid = %s::regclass AND contype = 'f'
+        """,
+        [TABLE],
+    )
+    foreign_keys = cursor.fetchall()
+
+    return indexes, foreign_keys
+
+
+def _swap_table(cursor, new_table, primary_key, indexes, foreign_keys):
+    """
+    Copy rows into the new table and put it in place of the old one, keeping
+    the names of the identity sequence, constraints and indexes.
+    """
+    cursor.execute(f'INSERT INTO {new_table} SELECT * FROM {TABLE}')
+    cursor.execute(
+        f"SELECT setval(pg_get_serial_sequence('{new_table}', 'id'), "
+        f'COALESCE((SELECT MAX(id) FROM {new_table}), 0) + 1, false)'
+    )
+    cursor.execute(f'DROP TABLE {TABLE}')
+    cursor.execute(f'ALTER TABLE {new_table} RENAME TO {TABLE}')
+    cursor.execute(f'ALTER SEQUENCE {new_table}_id_seq RENAME TO {TABLE}_id_seq')
+    cursor.execute(
+        f'ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY ({primary_key})'
+    )
+
+    for index in indexes:
+        cursor.execute(index)
+    for name, definition in foreign_keys:
+        cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}')
+
+
+def partition_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    new_table = f'{TABLE}_partitioned'
+
+    with schema_editor.connection.cursor() as cursor:
+        indexes, foreign_keys = _get_table_dependencies(cursor)
+
+        cursor.execute(
+            f'CREATE TABLE {new_table} (LIKE {TABLE} INCLUDING DEFAULTS '
+            'INCLUDING IDENTITY INCLUDING CONSTRAINTS) '
+            'PARTITION BY RANGE (created_at)'
+        )
+
+        cursor.execute(f"SELECT MIN(created_at AT TIME ZONE 'UTC') FROM {TABLE}")
+        oldest = cursor.fetchone()[0]
+        today = date.today()
+        month = _add_months(oldest or today, 0)
+
+        while month <= _add_months(today, MONTHS_AHEAD):
+            next_month = _add_months(month, 1)
+            # DDL takes no bound parameters, the bounds are quoted into the SQL
+            cursor.execute(
+                schema_editor.connection.ops.compose_sql(
+                    f'CREATE TABLE {TABLE}_y{month.year}m{month.month:02d} '
+                    f'PARTITION OF {new_table} FOR VALUES FROM (%s) TO (%s)',
+                    [f'{month} 00:00:00+00', f'{next_month} 00:00:00+00'],
+                )
+            )
+            month = next_month
+
+        cursor.execute(f'CREATE TABLE {TABLE}_default PARTITION OF {new_table} DEFAULT')
+
+        _swap_table(cursor, new_table, 'id, created_at', indexes, foreign_keys)
+
+
+def unpartition_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    new_table = f'{TABLE}_plain'
+
+    with schema_editor.connection.cursor() as cursor:
+        indexes, foreign_keys = _get_table_dependencies(cursor)
+        # Indexes of a partitioned table are recreated on the plain table,
+        # the copies on the partitions are dropped with them.
+        indexes = [index.replace(' ON ONLY ', ' ON ') for index in indexes]
+
+        cursor.execute(
+            f'CREATE TABLE {new_table} (LIKE {TABLE} INCLUDING DEFAULTS '
+            'INCLUDING IDENTITY INCLUDING CONSTRAINTS)'
+        )
+
+        _swap_table(cursor, new_table, 'id', indexes, foreign_keys)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('transactions', '0004_alter_transaction_subcategory'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_table, unpartition_table),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(
+                fields=['user', 'created_at'], name='transaction_user_created_idx'
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.2 on 2026-10-19 09:16
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reference', '0004_remove_category_valid_category_name_and_more'),
+        ('transactions', '0005_partition_transaction_by_month'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TransactionArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('comment', models.CharField(blank=True, max_length=50, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('category', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='archived_transactions', to='reference.category')),
+                ('status', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='archived_transactions', to='reference.status')),
+                ('subcategory', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='archived_transactions', to='reference.subcategory')),
+                ('transaction_type', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='archived_transactions', to='reference.transactiontype')),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='archived_transactions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user', 'created_at'], name='transaction_arch_user_cre_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.2 on 2026-10-19 10:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0006_transactionarchive'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='transaction_user_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'created_at'], include=('id', 'amount'), name='transaction_user_cre_cov_idx'),
+        ),
+    ]
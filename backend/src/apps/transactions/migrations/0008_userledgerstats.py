@@ -0,0 +1,54 @@
+# Generated by Django 5.2.2 on 2026-10-19 10:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Stats of the existing transactions, as recomputed by reconcile_ledger_stats
+BACKFILL_SQL = """
+    INSERT INTO transactions_userledgerstats (
+        user_id, transaction_count, income_total, expense_total,
+        first_created_at, last_created_at
+    )
+    SELECT l.user_id,
+           COUNT(*),
+           COALESCE(SUM(l.amount) FILTER (WHERE tt.name = 'Income'), 0),
+           COALESCE(SUM(l.amount) FILTER (WHERE tt.name = 'Expense'), 0),
+           MIN(l.created_at),
+           MAX(l.created_at)
+    FROM (
+        SELECT user_id, transaction_type_id, amount, created_at
+        FROM transactions_transaction
+        UNION ALL
+        SELECT user_id, transaction_type_id, amount, created_at
+        FROM transactions_transactionarchive
+    ) l
+    JOIN reference_transactiontype tt ON tt.id = l.transaction_type_id
+    GROUP BY l.user_id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0007_transaction_user_created_covering_index'),
+        ('users', '0003_alter_user_email'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserLedgerStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='ledger_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('transaction_count', models.BigIntegerField(default=0)),
+                ('income_total', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('expense_total', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('first_created_at', models.DateTimeField(blank=True, null=True)),
+                ('last_created_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name_plural': 'user ledger stats',
+            },
+        ),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.2 on 2026-10-19 10:34
+
+import logging
+
+from django.conf import settings
+from django.db import migrations, models
+
+logger = logging.getLogger(__name__)
+
+TRIGRAM_INDEX = 'transaction_comment_trgm_idx'
+
+# The expression comment__icontains is compiled to, so the admin search is
+# served by the index
+TRIGRAM_EXPRESSION = 'UPPER(comment::text) gin_trgm_ops'
+
+
+def create_trigram_index(apps, schema_editor):
+    # pg_trgm is part of the standard contrib modules, but some builds of
+    # PostgreSQL ship without it; searches then scan the comments
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+        )
+        if cursor.fetchone() is None:
+            logger.warning(
+                'The pg_trgm extension is not available, %s is not created and '
+                'the admin search of transaction comments scans the table',
+                TRIGRAM_INDEX,
+            )
+            return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {TRIGRAM_INDEX} '
+        f'ON transactions_transaction USING gin ({TRIGRAM_EXPRESSION})'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    schema_editor.execute(f'DROP INDEX IF EXISTS {TRIGRAM_INDEX}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reference', '0004_remove_category_valid_category_name_and_more'),
+        ('transactions', '0008_userledgerstats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['created_at', 'id'], name='transaction_created_id_idx'),
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -41,6 +41,18 @@ class Transaction(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Covers narrow ?fields=id,created_at,amount lists with index-only scans
+            models.Index(
+                fields=['user', 'created_at'],
+                include=['id', 'amount'],
+                name='transaction_user_cre_cov_idx',
+            ),
+            # Pages of the admin changelist
+            models.Index(
+                fields=['created_at', 'id'], name='transaction_created_id_idx'
+            ),
+        ]
 
     def clean(self):
         if (
@@ -60,3 +72,87 @@ class Transaction(models.Model):
             raise ValidationError(
                 'Selected category does not belong to the selected transaction type.'
             )
+
+
+class TransactionArchive(models.Model):
+    """
+    Transactions moved out of the hot table by the archive_transactions command.
+
+    Rows keep the IDs they had in the hot table, and the fields are declared
+    in the same order, so archived rows can be read with a UNION of both
+    tables. Only the (user, created_at) index is kept to make the table compact.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='archived_transactions',
+        db_index=False,
+    )
+    status = models.ForeignKey(
+        Status,
+        on_delete=models.PROTECT,
+        related_name='archived_transactions',
+        db_index=False,
+    )
+    transaction_type = models.ForeignKey(
+        TransactionType,
+        on_delete=models.PROTECT,
+        related_name='archived_transactions',
+        db_index=False,
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.PROTECT,
+        related_name='archived_transactions',
+        db_index=False,
+    )
+    subcategory = models.ForeignKey(
+        Subcategory,
+        on_delete=models.PROTECT,
+        related_name='archived_transactions',
+        null=True,
+        blank=True,
+        db_index=False,
+    )
+    amount = models.DecimalField(max_digits=12, decimal_places=2)
+    comment = models.CharField(max_length=50, blank=True, null=True)
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['user', 'created_at'],
+                name='transaction_arch_user_cre_idx',
+            ),
+        ]
+
+
+class UserLedgerStats(models.Model):
+    """
+    Headline numbers of all transactions of a user, archived ones included.
+
+    Maintained by the transaction services and the ingest flusher, see
+    apps.transactions.stats, so they are read without scanning the
+    transactions. Changes made elsewhere, e.g. in the admin, are fixed by the
+    reconcile_ledger_stats command.
+    """
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='ledger_stats',
+    )
+    transaction_count = models.BigIntegerField(default=0)
+    income_total = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    expense_total = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    first_created_at = models.DateTimeField(null=True, blank=True)
+    last_created_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name_plural = 'user ledger stats'
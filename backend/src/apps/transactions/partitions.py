@@ -0,0 +1,216 @@
+"""
+Monthly range partitions of the transactions table.
+
+The table is partitioned by RANGE (created_at), one partition per calendar
+month (UTC). Rows outside of every monthly partition land in the default
+partition and are moved out when the matching monthly partition is created.
+"""
+
+import re
+from datetime import date
+
+from django.db import connection, transaction
+
+from apps.transactions.models import Transaction
+
+DEFAULT_MONTHS_AHEAD = 3
+
+PARTITIONED_TABLE = Transaction._meta.db_table
+DEFAULT_PARTITION = f'{PARTITIONED_TABLE}_default'
+
+PARTITION_NAME_RE = re.compile(rf'^{PARTITIONED_TABLE}_y(\d{{4}})m(\d{{2}})$')
+
+
+def month_start(value: date) -> date:
+    """
+    Get the first day of the month of a date.
+
+    Args:
+        value (date): Any date (or datetime) within the month.
+
+    Returns:
+        date: The first day of the month.
+    """
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """
+    Shift the first day of a month by a number of months.
+
+    Args:
+        value (date): Any date within the starting month.
+        months (int): The number of months to add, may be negative.
+
+    Returns:
+        date: The first day of the resulting month.
+    """
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def get_partition_name(month: date) -> str:
+    """
+    Get the name of the partition holding a month.
+
+    Args:
+        month (date): Any date within the month.
+
+    Returns:
+        str: The partition table name, e.g. transactions_transaction_y2025m06.
+    """
+    return f'{PARTITIONED_TABLE}_y{month.year}m{month.month:02d}'
+
+
+def get_partitions():
+    """
+    Get the monthly partitions attached to the transactions table.
+
+    Returns:
+        list[tuple[date, str]]: The first day of the month and the partition
+            name, ordered by month. The default partition is not included.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [PARTITIONED_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        match = PARTITION_NAME_RE.match(name)
+        if match:
+            partitions.append((date(int(match[1]), int(match[2]), 1), name))
+
+    return sorted(partitions)
+
+
+@transaction.atomic
+def create_partition(month: date):
+    """
+    Create the partition for a month if it does not exist yet.
+
+    Rows of the month already stored in the default partition are moved
+    into the new partition.
+
+    Args:
+        month (date): Any date within the month.
+
+    Returns:
+        bool: True if the partition was created.
+    """
+    start = month_start(month)
+    end = add_months(start, 1)
+    name = get_partition_name(start)
+
+    if name in {partition for _, partition in get_partitions()}:
+        return False
+
+    bounds = [f'{start.isoformat()} 00:00:00+00', f'{end.isoformat()} 00:00:00+00']
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} '
+            'WHERE created_at >= %s AND created_at < %s)',
+            bounds,
+        )
+        has_default_rows = cursor.fetchone()[0]
+
+        # A new partition cannot overlap rows of the attached default
+        # partition, so the default partition is detached while they move.
+        if has_default_rows:
+            cursor.execute(
+                f'ALTER TABLE {PARTITIONED_TABLE} DETACH PARTITION {DEFAULT_PARTITION}'
+            )
+
+        # DDL takes no bound parameters, the bounds are quoted into the SQL
+        cursor.execute(
+            connection.ops.compose_sql(
+                f'CREATE TABLE {name} PARTITION OF {PARTITIONED_TABLE} '
+                'FOR VALUES FROM (%s) TO (%s)',
+                bounds,
+            )
+        )
+
+        if has_default_rows:
+            cursor.execute(
+                f'WITH moved AS (DELETE FROM {DEFAULT_PARTITION} '
+                'WHERE created_at >= %s AND created_at < %s RETURNING *) '
+                f'INSERT INTO {PARTITIONED_TABLE} SELECT * FROM moved',
+                bounds,
+            )
+            cursor.execute(
+                f'ALTER TABLE {PARTITIONED_TABLE} '
+                f'ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT'
+            )
+
+    return True
+
+
+def ensure_partitions(months_ahead: int = DEFAULT_MONTHS_AHEAD, today: date = None):
+    """
+    Create the partitions of the current month and the following months.
+
+    Args:
+        months_ahead (int): The number of months after the current one.
+        today (date, optional): The current date, defaults to today.
+
+    Returns:
+        list[str]: Names of the created partitions.
+    """
+    current = month_start(today or date.today())
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if create_partition(month):
+            created.append(get_partition_name(month))
+
+    return created
+
+
+@transaction.atomic
+def detach_partitions(before: date):
+    """
+    Detach the partitions of the months before a date.
+
+    Detached partitions stay in the database as standalone tables, so they
+    can be archived (e.g. with pg_dump) and dropped separately.
+
+    Args:
+        before (date): Partitions of months ending on or before the first day
+            of this date's month are detached.
+
+    Returns:
+        list[str]: Names of the detached partitions.
+    """
+    boundary = month_start(before)
+
+    detached = []
+    with connection.cursor() as cursor:
+        for month, name in get_partitions():
+            if month >= boundary:
+                continue
+            cursor.execute(f'ALTER TABLE {PARTITIONED_TABLE} DETACH PARTITION {name}')
+            detached.append(name)
+
+    return detached
+
+
+def analyze_partitions():
+    """
+    Collect planner statistics for the transactions table and its partitions.
+
+    Autovacuum analyzes every partition separately but never the partitioned
+    table itself, so the statistics of the parent have to be refreshed
+    explicitly.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f'ANALYZE {PARTITIONED_TABLE}')
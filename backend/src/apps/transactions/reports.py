@@ -0,0 +1,396 @@
+"""
+Aggregated reports over the transactions of a user.
+
+Reports are computed in the database over both the transactions table and
+the archive, so they never load individual transactions.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, router
+from django.db.models import F
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.reference.enums import TransactionTypeEnum
+from apps.reference.models import TransactionType
+from apps.reference.registry import get_reference_names
+from apps.transactions.filters import TransactionFilters, parse_filters
+from apps.transactions.models import Transaction, TransactionArchive
+from apps.transactions.stats import get_ledger_stats
+from apps.users.models import User
+
+RESOLUTIONS = ('day', 'week', 'month')
+
+# Fields the time series may be grouped by and their reference registry keys
+TIMESERIES_GROUPS = {
+    'transaction_type': 'transaction_types',
+    'category': 'categories',
+    'subcategory': 'subcategories',
+    'status': 'statuses',
+}
+
+BALANCE_VERSION_CACHE_KEY = 'transactions:balance:{user_id}:version'
+BALANCE_CACHE_KEY = 'transactions:balance:{user_id}:{version}:{resolution}:{tz}'
+
+# Transactions of the user from both tables with the amount signed by the
+# transaction type: income is positive, expense is negative
+SIGNED_TRANSACTIONS_SQL = """
+    SELECT t.created_at,
+           CASE tt.name WHEN %(income)s THEN t.amount
+                        WHEN %(expense)s THEN -t.amount
+                        ELSE 0 END AS amount
+    FROM {table} t
+    JOIN {transaction_type_table} tt ON tt.id = t.transaction_type_id
+    WHERE t.user_id = %(user_id)s AND t.created_at >= %(since)s
+"""
+
+BALANCE_SQL = """
+    WITH signed AS (
+        {transactions}
+        UNION ALL
+        {archived_transactions}
+    )
+    SELECT bucket, change, %(opening)s + SUM(change) OVER (ORDER BY bucket)
+    FROM (
+        SELECT date_trunc(%(resolution)s, created_at AT TIME ZONE %(tz)s) AS bucket,
+               SUM(amount) AS change
+        FROM signed
+        GROUP BY bucket
+    ) buckets
+    ORDER BY bucket
+"""
+
+
+# Sums per bucket and series of the filtered transactions, with every bucket
+# between the first and the last one, or the created_at filter bounds, present
+TIMESERIES_SQL = """
+    WITH points AS (
+        SELECT date_trunc(%s, created_at AT TIME ZONE %s) AS bucket,
+               series,
+               SUM(amount) AS total
+        FROM ({transactions}) t
+        GROUP BY 1, 2
+    ),
+    buckets AS (
+        SELECT generate_series(
+            COALESCE(date_trunc(%s, %s::timestamptz AT TIME ZONE %s), MIN(bucket)),
+            COALESCE(date_trunc(%s, %s::timestamptz AT TIME ZONE %s), MAX(bucket)),
+            %s::interval
+        ) AS bucket
+        FROM points
+    )
+    SELECT buckets.bucket, points.series, points.total
+    FROM buckets
+    LEFT JOIN points ON points.bucket = buckets.bucket
+    ORDER BY buckets.bucket, points.series
+"""
+
+
+def get_timezone(name: str = None):
+    """
+    Get a time zone by its IANA name.
+
+    Args:
+        name (str, optional): The time zone name, defaults to the TIME_ZONE
+            setting.
+
+    Returns:
+        ZoneInfo: The time zone.
+
+    Raises:
+        ValidationError: If the time zone does not exist.
+    """
+    try:
+        return ZoneInfo(name or settings.TIME_ZONE)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        raise ValidationError({'tz': f'Unknown time zone: {name}'}) from e
+
+
+def _signed_transactions_sql(model):
+    return SIGNED_TRANSACTIONS_SQL.format(
+        table=model._meta.db_table,
+        transaction_type_table=TransactionType._meta.db_table,
+    )
+
+
+def compute_balance(
+    user: User,
+    resolution: str,
+    tz: ZoneInfo,
+    since: datetime = None,
+    opening: Decimal = Decimal('0'),
+):
+    """
+    Compute the running balance of a user in one query.
+
+    Amounts are summed per bucket and the buckets are accumulated with a
+    window function.
+
+    Args:
+        user (User): The owner of the transactions.
+        resolution (str): 'day', 'week' or 'month'.
+        tz (ZoneInfo): The time zone the buckets start in.
+        since (datetime, optional): Only transactions created since this moment
+            are read, defaults to all transactions.
+        opening (Decimal): The balance before the first transaction read.
+
+    Returns:
+        list[tuple[datetime, Decimal, Decimal]]: The start of every bucket
+            with transactions (naive, in the time zone), the change within
+            the bucket and the balance at its end.
+    """
+    sql = BALANCE_SQL.format(
+        transactions=_signed_transactions_sql(Transaction),
+        archived_transactions=_signed_transactions_sql(TransactionArchive),
+    )
+    params = {
+        'income': TransactionTypeEnum.INCOME.value,
+        'expense': TransactionTypeEnum.EXPENSE.value,
+        'user_id': user.pk,
+        'since': since or datetime.min.replace(tzinfo=ZoneInfo('UTC')),
+        'resolution': resolution,
+        'tz': tz.key,
+        'opening': opening,
+    }
+
+    with connections[router.db_for_read(Transaction)].cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def get_balance_version(user: User):
+    """
+    Get the version of the cached balances of a user.
+
+    Returns:
+        str: The version, changed every time past transactions of the user
+            change.
+    """
+    key = BALANCE_VERSION_CACHE_KEY.format(user_id=user.pk)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_balance(user_id: int):
+    """
+    Drop the cached balances of a user, so they are computed from scratch.
+
+    Args:
+        user_id (int): The ID of the user.
+    """
+    cache.set(
+        BALANCE_VERSION_CACHE_KEY.format(user_id=user_id),
+        uuid.uuid4().hex,
+        timeout=None,
+    )
+
+
+def get_balance(user: User, resolution: str = 'day', tz: ZoneInfo = None):
+    """
+    Get the running balance of a user.
+
+    With TRANSACTIONS_BALANCE_SNAPSHOT_TIMEOUT set, the computed balance is
+    kept as a snapshot and the next call only reads transactions from the
+    last bucket of the snapshot on. New transactions are always created at the
+    current time, changes of past transactions made by the services or in the
+    admin invalidate the snapshot; other writes must call invalidate_balance.
+
+    Args:
+        user (User): The owner of the transactions.
+        resolution (str): 'day', 'week' or 'month'.
+        tz (ZoneInfo, optional): The time zone the buckets start in, defaults
+            to the TIME_ZONE setting.
+
+    Returns:
+        list[tuple[datetime, Decimal, Decimal]]: The buckets as returned by
+            compute_balance.
+
+    Raises:
+        ValidationError: If the resolution is not supported.
+    """
+    if resolution not in RESOLUTIONS:
+        raise ValidationError(
+            {'resolution': f'Must be one of: {", ".join(RESOLUTIONS)}'}
+        )
+    tz = tz or get_timezone()
+
+    timeout = settings.TRANSACTIONS_BALANCE_SNAPSHOT_TIMEOUT
+    if not timeout:
+        return compute_balance(user, resolution, tz)
+
+    key = BALANCE_CACHE_KEY.format(
+        user_id=user.pk,
+        version=get_balance_version(user),
+        resolution=resolution,
+        tz=tz.key,
+    )
+    snapshot = cache.get(key)
+
+    if snapshot:
+        # The last bucket may still grow, so it is computed again
+        last_bucket, last_change, last_balance = snapshot[-1]
+        buckets = snapshot[:-1] + compute_balance(
+            user,
+            resolution,
+            tz,
+            since=timezone.make_aware(last_bucket, tz),
+            opening=last_balance - last_change,
+        )
+    else:
+        buckets = compute_balance(user, resolution, tz)
+
+    cache.set(key, buckets, timeout=timeout)
+    return buckets
+
+
+def _count_buckets(start: datetime, end: datetime, resolution: str, tz: ZoneInfo):
+    """
+    Count the buckets from the one of start to the one of end, weeks may be
+    counted one too many.
+    """
+    first = timezone.localtime(start, tz)
+    last = timezone.localtime(end, tz)
+    if last < first:
+        return 0
+    if resolution == 'month':
+        return (last.year - first.year) * 12 + last.month - first.month + 1
+    days = (last.date() - first.date()).days
+    return days // (7 if resolution == 'week' else 1) + 1
+
+
+def _check_bucket_count(user, start, end, resolution: str, tz: ZoneInfo):
+    """
+    Reject time series of more than TRANSACTIONS_TIMESERIES_MAX_BUCKETS buckets
+    before the database generates them.
+
+    Open ends of the range are bounded by the first and the last transaction
+    of the user.
+    """
+    first, last = start, end
+    if first is None or last is None:
+        stats = get_ledger_stats(user)
+        first = first or stats.first_created_at
+        last = last or stats.last_created_at
+    max_buckets = settings.TRANSACTIONS_TIMESERIES_MAX_BUCKETS
+    if first and last and _count_buckets(first, last, resolution, tz) > max_buckets:
+        raise ValidationError(
+            {
+                'resolution': f'The date range spans more than {max_buckets} '
+                'buckets, narrow it or use longer buckets'
+            }
+        )
+
+
+def compute_timeseries(
+    user: User,
+    resolution: str = 'day',
+    tz: ZoneInfo = None,
+    group_by: str = 'transaction_type',
+    filters: dict = None,
+):
+    """
+    Compute the sums of transaction amounts per time bucket and group.
+
+    Buckets without transactions are filled in by the database, so the
+    result can be charted as is.
+
+    Args:
+        user (User): The owner of the transactions.
+        resolution (str): 'day', 'week' or 'month'.
+        tz (ZoneInfo, optional): The time zone the buckets start in, defaults
+            to the TIME_ZONE setting.
+        group_by (str): The reference field every series is a value of, one
+            of TIMESERIES_GROUPS.
+        filters (TransactionFilters | dict, optional): Parsed filters, or
+            query parameters to parse with parse_filters. The created_at range
+            also bounds the buckets.
+
+    Returns:
+        dict: The 'buckets' start dates and the 'series', each with the 'id'
+            and 'name' of the group and the sum of amounts in every bucket as
+            'values', in the order of the buckets.
+
+    Raises:
+        ValidationError: If the resolution or the group is not supported, a
+            filter is invalid, or the range spans more than
+            TRANSACTIONS_TIMESERIES_MAX_BUCKETS buckets.
+    """
+    # Imported here, the services invalidate the balance of this module
+    from apps.transactions.services import apply_filters, filters_reach_archive
+
+    if resolution not in RESOLUTIONS:
+        raise ValidationError(
+            {'resolution': f'Must be one of: {", ".join(RESOLUTIONS)}'}
+        )
+    if group_by not in TIMESERIES_GROUPS:
+        raise ValidationError(
+            {'group_by': f'Must be one of: {", ".join(TIMESERIES_GROUPS)}'}
+        )
+    tz = tz or get_timezone()
+    if not isinstance(filters, TransactionFilters):
+        # Days of date filters start in the time zone of the buckets
+        filters = parse_filters(filters or {}, tz=tz)
+
+    def rows(model):
+        queryset = apply_filters(model.objects.filter(user=user), filters)
+        return queryset.order_by().values('created_at', 'amount', series=F(group_by))
+
+    queryset = rows(Transaction)
+    if filters_reach_archive(filters, user):
+        queryset = queryset.union(rows(TransactionArchive), all=True)
+    transactions_sql, transactions_params = queryset.query.sql_with_params()
+
+    start = filters.start
+    # The last bucket is the one of the last moment before the exclusive end
+    end = filters.end - timedelta(microseconds=1) if filters.end else None
+
+    _check_bucket_count(user, start, end, resolution, tz)
+
+    params = [
+        resolution,
+        tz.key,
+        *transactions_params,
+        resolution,
+        start,
+        tz.key,
+        resolution,
+        end,
+        tz.key,
+        f'1 {resolution}',
+    ]
+
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(TIMESERIES_SQL.format(transactions=transactions_sql), params)
+        result = cursor.fetchall()
+
+    buckets = []
+    totals = {}
+    for bucket, series, total in result:
+        if not buckets or buckets[-1] != bucket:
+            buckets.append(bucket)
+        if total is not None:
+            totals.setdefault(series, {})[bucket] = total
+
+    names = get_reference_names()[TIMESERIES_GROUPS[group_by]]
+    return {
+        'buckets': [bucket.date() for bucket in buckets],
+        'series': [
+            {
+                'id': series,
+                'name': names.get(series),
+                'values': [values.get(bucket, Decimal('0')) for bucket in buckets],
+            }
+            for series, values in sorted(
+                totals.items(), key=lambda item: (item[0] is None, item[0] or 0)
+            )
+        ],
+    }
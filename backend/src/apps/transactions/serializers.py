@@ -1,7 +1,9 @@
+from django.conf import settings
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
 from apps.reference.models import Category, Status, Subcategory, TransactionType
+from apps.reference.registry import get_reference_names, get_reference_parent_ids
 
 
 class TransactionCreateSerializer(serializers.Serializer):
@@ -116,7 +118,58 @@ class TransactionUpdateSerializer(serializers.Serializer):
         return attrs
 
 
-class TransactionDetailSerializer(serializers.Serializer):
+class SparseFieldsMixin:
+    """
+    Serializer emitting only the fields named by the 'fields' argument.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def parse_fields(cls, value: str):
+        """
+        Parse a comma-separated list of field names.
+
+        Args:
+            value (str): The field names, e.g. 'id,created_at,amount'.
+
+        Returns:
+            tuple[str]: The field names, in the order of the serializer.
+
+        Raises:
+            ValidationError: If a name is not a field of the serializer.
+        """
+        names = {name.strip() for name in value.split(',') if name.strip()}
+        available = cls().fields
+        unknown = sorted(names - set(available))
+        if unknown:
+            raise ValidationError({'fields': [f'Unknown fields: {", ".join(unknown)}']})
+        if not names:
+            raise ValidationError({'fields': ['At least one field is required']})
+        return tuple(name for name in available if name in names)
+
+    def get_model_fields(self):
+        """
+        Get the model field paths read by the emitted fields, for QuerySet.only.
+
+        Returns:
+            tuple[str]: Paths like 'amount' or 'status__name'; the foreign key
+                of a related field is included with it.
+        """
+        paths = []
+        for field in self.fields.values():
+            path = field.source.replace('.', '__')
+            if '__' in path:
+                paths.append(path.split('__')[0])
+            paths.append(path)
+        return tuple(dict.fromkeys(paths))
+
+
+class TransactionDetailSerializer(SparseFieldsMixin, serializers.Serializer):
     id = serializers.IntegerField(read_only=True)
     user_email = serializers.CharField(source='user.email', read_only=True)
     created_at = serializers.DateTimeField(read_only=True)
@@ -137,7 +190,7 @@ class TransactionDetailSerializer(serializers.Serializer):
     comment = serializers.CharField(read_only=True)
 
 
-class TransactionListSerializer(serializers.Serializer):
+class TransactionListSerializer(SparseFieldsMixin, serializers.Serializer):
     id = serializers.IntegerField(read_only=True)
     created_at = serializers.DateTimeField(read_only=True)
     updated_at = serializers.DateTimeField(read_only=True)
@@ -155,3 +208,162 @@ class TransactionListSerializer(serializers.Serializer):
     )
     amount = serializers.DecimalField(max_digits=15, decimal_places=2, read_only=True)
     comment = serializers.CharField(read_only=True)
+
+
+class TransactionCompactListSerializer(serializers.BaseSerializer):
+    """
+    Serializes transaction rows as positional arrays.
+
+    Rows are fetched as tuples of row_fields, so reference names are not
+    joined but looked up in the cached reference maps and returned once per
+    referenced ID.
+    """
+
+    row_fields = (
+        'id',
+        'created_at',
+        'updated_at',
+        'status_id',
+        'transaction_type_id',
+        'category_id',
+        'subcategory_id',
+        'amount',
+        'comment',
+    )
+    # Registry key of the names of each reference ID field
+    reference_fields = {
+        'status_id': 'statuses',
+        'transaction_type_id': 'transaction_types',
+        'category_id': 'categories',
+        'subcategory_id': 'subcategories',
+    }
+
+    datetime_field = serializers.DateTimeField()
+    amount_field = serializers.DecimalField(max_digits=15, decimal_places=2)
+
+    def to_representation(self, instance):
+        names = get_reference_names()
+        references = [
+            (self.row_fields.index(field), key)
+            for field, key in self.reference_fields.items()
+        ]
+        reference = {key: {} for key in self.reference_fields.values()}
+        to_datetime = self.datetime_field.to_representation
+        to_amount = self.amount_field.to_representation
+
+        results = []
+        for row in instance:
+            (row_id, created_at, updated_at, *reference_ids, amount, comment) = row
+            results.append(
+                [
+                    row_id,
+                    to_datetime(created_at),
+                    to_datetime(updated_at),
+                    *reference_ids,
+                    to_amount(amount),
+                    comment,
+                ]
+            )
+            for index, key in references:
+                reference_id = row[index]
+                if reference_id is not None:
+                    reference[key][reference_id] = names[key].get(reference_id)
+
+        return {
+            'fields': list(self.row_fields),
+            'results': results,
+            'reference': reference,
+        }
+
+
+class TransactionBalanceSerializer(serializers.Serializer):
+    bucket = serializers.DateField(read_only=True)
+    # Sums of many amounts may not fit the digits of a single amount
+    change = serializers.DecimalField(max_digits=None, decimal_places=2, read_only=True)
+    balance = serializers.DecimalField(
+        max_digits=None, decimal_places=2, read_only=True
+    )
+
+
+class TransactionSeriesSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True, allow_null=True)
+    name = serializers.CharField(read_only=True, allow_null=True)
+    values = serializers.ListField(
+        child=serializers.DecimalField(max_digits=None, decimal_places=2),
+        read_only=True,
+    )
+
+
+class TransactionTimeseriesSerializer(serializers.Serializer):
+    resolution = serializers.CharField(read_only=True)
+    tz = serializers.CharField(read_only=True)
+    group_by = serializers.CharField(read_only=True)
+    buckets = serializers.ListField(child=serializers.DateField(), read_only=True)
+    series = TransactionSeriesSerializer(many=True, read_only=True)
+
+
+class TransactionIngestRowSerializer(serializers.Serializer):
+    status_id = serializers.IntegerField()
+    transaction_type_id = serializers.IntegerField()
+    category_id = serializers.IntegerField()
+    subcategory_id = serializers.IntegerField(required=False, allow_null=True)
+    amount = serializers.DecimalField(max_digits=12, decimal_places=2)
+    comment = serializers.CharField(required=False, allow_blank=True, max_length=50)
+
+
+class TransactionIngestSerializer(serializers.Serializer):
+    transactions = serializers.ListField(
+        child=TransactionIngestRowSerializer(),
+        min_length=1,
+        max_length=settings.TRANSACTIONS_INGEST_MAX_ROWS,
+    )
+
+    def validate_transactions(self, rows):
+        # Checked against the cached reference IDs, without a query per row
+        names = get_reference_names()
+        parents = get_reference_parent_ids()
+
+        errors = {}
+        for index, row in enumerate(rows):
+            row_errors = {}
+            for field, key in (
+                ('status_id', 'statuses'),
+                ('transaction_type_id', 'transaction_types'),
+                ('category_id', 'categories'),
+                ('subcategory_id', 'subcategories'),
+            ):
+                if row.get(field) is not None and row[field] not in names[key]:
+                    row_errors[field] = (
+                        f'Invalid pk "{row[field]}" - object does not exist.'
+                    )
+            if row_errors:
+                errors[index] = row_errors
+                continue
+
+            subcategory_id = row.get('subcategory_id')
+            if (
+                subcategory_id is not None
+                and parents['subcategories'][subcategory_id] != row['category_id']
+            ):
+                errors[index] = {
+                    'subcategory': 'The selected subcategory does not belong '
+                    'to the selected category.'
+                }
+            elif (
+                parents['categories'][row['category_id']] != row['transaction_type_id']
+            ):
+                errors[index] = {
+                    'category': 'The selected category does not belong '
+                    'to the selected transaction type.'
+                }
+
+        if errors:
+            raise ValidationError(errors)
+        return rows
+
+
+class TransactionIngestTicketSerializer(serializers.Serializer):
+    ticket = serializers.CharField(read_only=True)
+    status = serializers.CharField(read_only=True)
+    count = serializers.IntegerField(read_only=True)
+    error = serializers.CharField(read_only=True, allow_null=True)
@@ -1,31 +1,78 @@
+from datetime import datetime, timedelta
+
+from django.db import transaction as db_transaction
+from django.db.models import Max
 from django.db.models.query import QuerySet
-from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework import status
+from rest_framework.exceptions import (
+    APIException,
+    NotFound,
+    PermissionDenied,
+    ValidationError,
+)
 
 from apps.reference.models import Category, Subcategory
 from apps.reference.models.transaction_type import TransactionType
-from apps.transactions.models import Transaction
+from apps.transactions.filters import TransactionFilters, parse_filters
+from apps.transactions.models import Transaction, TransactionArchive
+from apps.transactions.reports import invalidate_balance
+from apps.transactions.stats import record_created, record_deleted, record_updated
 from apps.users.models import User
 
+ARCHIVE_FIELDS = [field.attname for field in TransactionArchive._meta.concrete_fields]
+
+
+class TransactionArchived(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = 'The transaction is archived and can no longer be changed.'
+    default_code = 'archived'
+
 
-def get_user_transactions(user: User, filters: dict = None, ordering: list = None):
+def get_user_transactions(
+    user: User,
+    filters: dict = None,
+    ordering: list = None,
+    values: tuple = None,
+    only: tuple = None,
+):
     """
     Retrieve transactions for a specific user with optional filtering and ordering.
 
+    Archived transactions are included only when the created_at filters reach
+    into the archived range; the result is then a UNION of both tables and
+    can only be ordered, sliced or counted.
+
     Args:
         user: User object for whom to retrieve transactions
-        filters (dict, optional): Dictionary of filters to apply
+        filters (TransactionFilters | dict, optional): Parsed filters, or
+            query parameters to parse with parse_filters
         ordering (list, optional): List of fields to order by
+        values (tuple, optional): Fields to fetch as tuples instead of model
+            instances, the reference tables are then not joined. A UNION
+            with archived transactions can only be ordered by these fields
+        only (tuple, optional): Fields to load into the model instances, e.g.
+            'amount' or 'status__name'; only the related tables of the given
+            fields are joined
 
     Returns:
         QuerySet: Filtered and ordered transactions queryset
+
+    Raises:
+        ValidationError: If unparsed filters are not supported or invalid
     """
-    queryset = Transaction.objects.filter(user=user).select_related(
-        'status', 'transaction_type', 'category', 'subcategory'
-    )
+    filters = _get_filters(filters)
+    if only:
+        # A UNION with archived transactions is ordered by selected columns
+        only = (*only, *(field.lstrip('-') for field in ordering or ['created_at']))
+    queryset = _get_user_queryset(Transaction, user, values, only)
 
     if filters:
         queryset = apply_filters(queryset, filters)
 
+        if filters_reach_archive(filters, user):
+            archived = _get_user_queryset(TransactionArchive, user, values, only)
+            queryset = queryset.union(apply_filters(archived, filters), all=True)
+
     if ordering:
         queryset = queryset.order_by(*ordering)
     else:
@@ -34,67 +81,176 @@ def get_user_transactions(user: User, filters: dict = None, ordering: list = Non
     return queryset
 
 
-def apply_filters(queryset: QuerySet, filters: dict):
+def _get_user_queryset(model, user: User, values: tuple = None, only: tuple = None):
+    queryset = model.objects.filter(user=user)
+    if values:
+        return queryset.values_list(*values)
+    if only:
+        related = [field.split('__')[0] for field in only if '__' in field]
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset.only(*only)
+    return queryset.select_related(
+        'status', 'transaction_type', 'category', 'subcategory'
+    )
+
+
+def apply_filters(queryset: QuerySet, filters):
     """
     Apply filters to a transaction queryset.
 
     Args:
         queryset: Transaction queryset to filter
-        filters (dict): Dictionary of filters to apply
+        filters (TransactionFilters | dict): Parsed filters, or query
+            parameters to parse with parse_filters
 
     Returns:
         QuerySet: Filtered transactions queryset
+
+    Raises:
+        ValidationError: If unparsed filters are not supported or invalid
     """
-    filter_handlers = {
-        'created_at__gte': lambda q, v: q.filter(created_at__gte=v) if v else q,
-        'created_at__lte': lambda q, v: q.filter(created_at__lte=v) if v else q,
-        'created_at__exact': lambda q, v: q.filter(created_at__exact=v) if v else q,
-        'created_at__gt': lambda q, v: q.filter(created_at__gt=v) if v else q,
-        'created_at__lt': lambda q, v: q.filter(created_at__lt=v) if v else q,
-        'status': lambda q, v: q.filter(status=v) if v else q,
-        'transaction_type': lambda q, v: q.filter(transaction_type=v) if v else q,
-        'category': lambda q, v: q.filter(category=v) if v else q,
-        'subcategory': lambda q, v: q.filter(subcategory=v) if v else q,
-        'amount__gte': lambda q, v: q.filter(amount__gte=v) if v else q,
-        'amount__lte': lambda q, v: q.filter(amount__lte=v) if v else q,
-        'amount__exact': lambda q, v: q.filter(amount__exact=v) if v else q,
-    }
-
-    for key, value in filters.items():
-        if key in filter_handlers:
-            queryset = filter_handlers[key](queryset, value)
+    return _get_filters(filters).apply(queryset)
 
-    return queryset
 
+def _get_filters(filters):
+    if isinstance(filters, TransactionFilters):
+        return filters
+    return parse_filters(filters or {})
+
+
+def get_archive_cutoff(user: User):
+    """
+    Get the moment before which transactions of a user are archived.
+
+    The cutoff is read from the newest archived transaction, with the
+    (user, created_at) index of the archive, so it does not depend on the
+    TRANSACTIONS_ARCHIVE_AFTER_DAYS setting the transactions were archived with.
 
-def get_transaction_by_id(transaction_id: int, user: User):
+    Args:
+        user: User object who owns the transactions
+
+    Returns:
+        datetime | None: The moment just after the newest archived transaction,
+            or None if no transaction of the user is archived
+    """
+    newest = TransactionArchive.objects.filter(user=user).aggregate(
+        newest=Max('created_at')
+    )['newest']
+    return None if newest is None else newest + timedelta(microseconds=1)
+
+
+def filters_reach_archive(filters, user: User):
+    """
+    Check whether created_at filters select a range reaching archived transactions.
+
+    Without created_at filters only the hot table is read. A range that has an
+    upper bound but no lower bound reaches back to the oldest transactions.
+
+    Args:
+        filters (TransactionFilters | dict): Parsed filters, or query
+            parameters to parse with parse_filters
+        user: User object who owns the transactions
+
+    Returns:
+        bool: True if archived transactions may match the filters
+    """
+    filters = _get_filters(filters)
+    if filters.start is None and filters.end is None:
+        return False
+    cutoff = get_archive_cutoff(user)
+    return cutoff is not None and filters.reaches(cutoff)
+
+
+def archive_transactions(cutoff: datetime, batch_size: int):
+    """
+    Move transactions created before the cutoff to the archive table.
+
+    Rows are moved in batches ordered by creation time, each in its own
+    database transaction, so an interrupted run is resumed by running again.
+
+    Args:
+        cutoff (datetime): Transactions created before this moment are archived
+        batch_size (int): Number of transactions moved per database transaction
+
+    Yields:
+        int: Number of transactions archived by each batch
+    """
+    while True:
+        with db_transaction.atomic():
+            rows = list(
+                Transaction.objects.filter(created_at__lt=cutoff)
+                .order_by('created_at', 'id')
+                .select_for_update(skip_locked=True)
+                .values(*ARCHIVE_FIELDS)[:batch_size]
+            )
+            if not rows:
+                return
+
+            TransactionArchive.objects.bulk_create(
+                [TransactionArchive(**row) for row in rows], ignore_conflicts=True
+            )
+            Transaction.objects.filter(
+                id__in=[row['id'] for row in rows], created_at__lt=cutoff
+            ).delete()
+
+        yield len(rows)
+
+
+def _get_by_id_queryset(model, only: tuple = None):
+    if only:
+        related = [field.split('__')[0] for field in only if '__' in field]
+        queryset = model.objects.only('user', *only)
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset
+    return model.objects.select_related(
+        'status', 'transaction_type', 'category', 'subcategory', 'user'
+    )
+
+
+def get_transaction_by_id(
+    transaction_id: int, user: User, only: tuple = None, lock: bool = False
+):
     """
     Retrieve a specific transaction for a user.
 
+    Transactions moved to the archive are returned as TransactionArchive
+    instances, they can be read but not changed.
+
     Args:
         transaction_id: ID of the transaction to retrieve
         user: User object who owns the transaction
+        only (tuple, optional): Fields to load, as for get_user_transactions
+        lock (bool): Whether to lock the row until the end of the database
+            transaction, which must be open, to change it
 
     Returns:
-        Transaction: The requested transaction object
+        Transaction | TransactionArchive: The requested transaction object
 
     Raises:
         NotFound: If the transaction doesn't exist or doesn't belong to the user
         PermissionDenied: If the user doesn't have permission to access the transaction
+        TransactionArchived: If the transaction to lock is archived
     """
+    queryset = _get_by_id_queryset(Transaction, only)
+    if lock:
+        queryset = queryset.select_for_update(of=('self',))
     try:
-        transaction = Transaction.objects.select_related(
-            'status', 'transaction_type', 'category', 'subcategory', 'user'
-        ).get(id=transaction_id)
-
-        if transaction.user != user:
-            raise PermissionDenied(
-                "You don't have permission to access this transaction"
+        transaction = queryset.get(id=transaction_id)
+    except Transaction.DoesNotExist:
+        try:
+            transaction = _get_by_id_queryset(TransactionArchive, only).get(
+                id=transaction_id
             )
+        except TransactionArchive.DoesNotExist as error:
+            raise NotFound(f'Transaction with ID {transaction_id} not found') from error
 
-        return transaction
-    except Transaction.DoesNotExist as error:
-        raise NotFound(f'Transaction with ID {transaction_id} not found') from error
+    if transaction.user_id != user.pk:
+        raise PermissionDenied("You don't have permission to access this transaction")
+    if lock and isinstance(transaction, TransactionArchive):
+        raise TransactionArchived
+    return transaction
 
 
 def create_transaction(data: dict, user: User):
@@ -115,7 +271,9 @@ def create_transaction(data: dict, user: User):
         data.get('category'), data.get('subcategory'), data.get('transaction_type')
     )
 
-    transaction = Transaction.objects.create(user=user, **data)
+    with db_transaction.atomic():
+        transaction = Transaction.objects.create(user=user, **data)
+        record_created([transaction])
     return transaction
 
 
@@ -134,21 +292,29 @@ def update_transaction(transaction_id: int, data: dict, user: User):
     Raises:
         NotFound: If the transaction doesn't exist
         PermissionDenied: If the user doesn't own the transaction
+        TransactionArchived: If the transaction is archived
         ValidationError: If validation fails
     """
-    transaction = get_transaction_by_id(transaction_id, user)
-
-    # Prepare data for validation with current values as fallback
-    category = data.get('category', transaction.category)
-    subcategory = data.get('subcategory', transaction.subcategory)
-    transaction_type = data.get('transaction_type', transaction.transaction_type)
-
-    validate_transaction_relationships(category, subcategory, transaction_type)
-
-    for key, value in data.items():
-        setattr(transaction, key, value)
-
-    transaction.save()
+    with db_transaction.atomic():
+        # Concurrent updates apply their stats changes to the saved row
+        transaction = get_transaction_by_id(transaction_id, user, lock=True)
+
+        # Prepare data for validation with current values as fallback
+        category = data.get('category', transaction.category)
+        subcategory = data.get('subcategory', transaction.subcategory)
+        transaction_type = data.get('transaction_type', transaction.transaction_type)
+
+        validate_transaction_relationships(category, subcategory, transaction_type)
+
+        transaction_type_id = transaction.transaction_type_id
+        amount = transaction.amount
+        for key, value in data.items():
+            setattr(transaction, key, value)
+
+        transaction.save()
+        record_updated(transaction, transaction_type_id, amount)
+    # Past buckets of the cached running balance may have changed
+    db_transaction.on_commit(lambda: invalidate_balance(user.pk))
     return transaction
 
 
@@ -163,9 +329,14 @@ def delete_transaction(transaction_id: int, user: User):
     Raises:
         NotFound: If the transaction doesn't exist
         PermissionDenied: If the user doesn't own the transaction
+        TransactionArchived: If the transaction is archived
     """
-    transaction = get_transaction_by_id(transaction_id, user)
-    transaction.delete()
+    with db_transaction.atomic():
+        transaction = get_transaction_by_id(transaction_id, user, lock=True)
+        # A concurrent delete is only removed from the stats once
+        if transaction.delete()[0]:
+            record_deleted([transaction])
+    db_transaction.on_commit(lambda: invalidate_balance(user.pk))
 
 
 def validate_transaction_relationships(
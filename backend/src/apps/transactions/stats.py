@@ -0,0 +1,266 @@
+"""
+Per-user counter cache of the transaction count, totals and date range.
+
+Every write of transactions applies its change to the UserLedgerStats row of
+the user in the same database transaction, so the headline numbers of the
+whole history are read from one row. The row is upserted with increments, so
+concurrent writes of a user are serialized on it rather than lost.
+
+Archiving moves transactions between tables and leaves the stats unchanged.
+Writes that bypass the services are fixed by reconcile_ledger_stats.
+"""
+
+from decimal import Decimal
+
+from django.db import connection
+from django.db import transaction as db_transaction
+
+from apps.reference.enums import TransactionTypeEnum
+from apps.reference.models import TransactionType
+from apps.reference.registry import get_reference_names
+from apps.transactions.models import Transaction, TransactionArchive, UserLedgerStats
+from apps.users.models import User
+
+_TABLES = {
+    'stats': UserLedgerStats._meta.db_table,
+    'transactions': Transaction._meta.db_table,
+    'archived_transactions': TransactionArchive._meta.db_table,
+    'transaction_types': TransactionType._meta.db_table,
+}
+
+ADD_SQL = """
+    INSERT INTO {stats} AS s (
+        user_id, transaction_count, income_total, expense_total,
+        first_created_at, last_created_at
+    )
+    VALUES (
+        %(user_id)s, %(count)s, %(income)s, %(expense)s, %(first)s, %(last)s
+    )
+    ON CONFLICT (user_id) DO UPDATE SET
+        transaction_count = s.transaction_count + EXCLUDED.transaction_count,
+        income_total = s.income_total + EXCLUDED.income_total,
+        expense_total = s.expense_total + EXCLUDED.expense_total,
+        first_created_at = LEAST(s.first_created_at, EXCLUDED.first_created_at),
+        last_created_at = GREATEST(s.last_created_at, EXCLUDED.last_created_at)
+""".format(**_TABLES)
+
+# The bounds are looked up again, with one index seek per table, only when a
+# removed transaction was the first or the last one
+REMOVE_SQL = """
+    UPDATE {stats} SET
+        transaction_count = transaction_count - %(count)s,
+        income_total = income_total - %(income)s,
+        expense_total = expense_total - %(expense)s,
+        first_created_at = CASE WHEN first_created_at < %(first)s
+            THEN first_created_at
+            ELSE LEAST(
+                (SELECT MIN(created_at) FROM {transactions}
+                 WHERE user_id = %(user_id)s),
+                (SELECT MIN(created_at) FROM {archived_transactions}
+                 WHERE user_id = %(user_id)s)
+            ) END,
+        last_created_at = CASE WHEN last_created_at > %(last)s
+            THEN last_created_at
+            ELSE GREATEST(
+                (SELECT MAX(created_at) FROM {transactions}
+                 WHERE user_id = %(user_id)s),
+                (SELECT MAX(created_at) FROM {archived_transactions}
+                 WHERE user_id = %(user_id)s)
+            ) END
+    WHERE user_id = %(user_id)s
+""".format(**_TABLES)
+
+# Stats of users without transactions are only kept if they exist already
+RECONCILE_SQL = """
+    WITH ledger AS (
+        SELECT t.user_id, t.amount, t.created_at, tt.name
+        FROM {transactions} t
+        JOIN {transaction_types} tt ON tt.id = t.transaction_type_id
+        WHERE t.user_id = ANY(%(user_ids)s)
+        UNION ALL
+        SELECT t.user_id, t.amount, t.created_at, tt.name
+        FROM {archived_transactions} t
+        JOIN {transaction_types} tt ON tt.id = t.transaction_type_id
+        WHERE t.user_id = ANY(%(user_ids)s)
+    ), totals AS (
+        SELECT u.id AS user_id,
+               COUNT(l.user_id) AS transaction_count,
+               COALESCE(SUM(l.amount) FILTER (WHERE l.name = %(income)s), 0)
+                   AS income_total,
+               COALESCE(SUM(l.amount) FILTER (WHERE l.name = %(expense)s), 0)
+                   AS expense_total,
+               MIN(l.created_at) AS first_created_at,
+               MAX(l.created_at) AS last_created_at
+        FROM unnest(%(user_ids)s::bigint[]) AS u(id)
+        LEFT JOIN ledger l ON l.user_id = u.id
+        GROUP BY u.id
+    )
+    INSERT INTO {stats} AS s (
+        user_id, transaction_count, income_total, expense_total,
+        first_created_at, last_created_at
+    )
+    SELECT * FROM totals
+    WHERE transaction_count > 0
+       OR user_id IN (SELECT user_id FROM {stats} WHERE user_id = ANY(%(user_ids)s))
+    ON CONFLICT (user_id) DO UPDATE SET
+        transaction_count = EXCLUDED.transaction_count,
+        income_total = EXCLUDED.income_total,
+        expense_total = EXCLUDED.expense_total,
+        first_created_at = EXCLUDED.first_created_at,
+        last_created_at = EXCLUDED.last_created_at
+    WHERE (
+        s.transaction_count, s.income_total, s.expense_total,
+        s.first_created_at, s.last_created_at
+    ) IS DISTINCT FROM (
+        EXCLUDED.transaction_count, EXCLUDED.income_total, EXCLUDED.expense_total,
+        EXCLUDED.first_created_at, EXCLUDED.last_created_at
+    )
+    RETURNING user_id
+""".format(**_TABLES)
+
+
+def _signed_totals(transaction_type_id: int, amount: Decimal):
+    """
+    Get the (income, expense) totals a transaction adds to.
+    """
+    name = get_reference_names()['transaction_types'].get(transaction_type_id)
+    amount = Decimal(amount)
+    if name == TransactionTypeEnum.INCOME.value:
+        return amount, Decimal('0')
+    if name == TransactionTypeEnum.EXPENSE.value:
+        return Decimal('0'), amount
+    return Decimal('0'), Decimal('0')
+
+
+def _get_changes(transactions):
+    """
+    Sum transactions up per user, in the order of the user IDs.
+    """
+    changes = {}
+    for transaction in transactions:
+        change = changes.setdefault(
+            transaction.user_id,
+            {
+                'user_id': transaction.user_id,
+                'count': 0,
+                'income': Decimal('0'),
+                'expense': Decimal('0'),
+                'first': transaction.created_at,
+                'last': transaction.created_at,
+            },
+        )
+        income, expense = _signed_totals(
+            transaction.transaction_type_id, transaction.amount
+        )
+        change['count'] += 1
+        change['income'] += income
+        change['expense'] += expense
+        change['first'] = min(change['first'], transaction.created_at)
+        change['last'] = max(change['last'], transaction.created_at)
+    # Rows of several users are always locked in the same order
+    return [changes[user_id] for user_id in sorted(changes)]
+
+
+def record_created(transactions):
+    """
+    Add created transactions to the stats of their users.
+
+    Must be called in the database transaction that created them.
+
+    Args:
+        transactions (Iterable[Transaction]): The saved transactions.
+    """
+    with connection.cursor() as cursor:
+        for change in _get_changes(transactions):
+            cursor.execute(ADD_SQL, change)
+
+
+def record_updated(transaction: Transaction, transaction_type_id: int, amount):
+    """
+    Apply a changed amount or transaction type to the stats of the user.
+
+    Args:
+        transaction (Transaction): The saved transaction.
+        transaction_type_id (int): The transaction type before the update.
+        amount (Decimal): The amount before the update.
+    """
+    old_income, old_expense = _signed_totals(transaction_type_id, amount)
+    income, expense = _signed_totals(
+        transaction.transaction_type_id, transaction.amount
+    )
+    if (income, expense) == (old_income, old_expense):
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            ADD_SQL,
+            {
+                'user_id': transaction.user_id,
+                'count': 0,
+                'income': income - old_income,
+                'expense': expense - old_expense,
+                'first': transaction.created_at,
+                'last': transaction.created_at,
+            },
+        )
+
+
+def record_deleted(transactions):
+    """
+    Remove deleted transactions from the stats of their users.
+
+    Must be called in the database transaction that deleted them, after the
+    deletion.
+
+    Args:
+        transactions (Iterable[Transaction]): The deleted transactions.
+    """
+    with connection.cursor() as cursor:
+        for change in _get_changes(transactions):
+            cursor.execute(REMOVE_SQL, change)
+
+
+def get_ledger_stats(user: User):
+    """
+    Get the transaction count, totals and date range of a user.
+
+    Returns:
+        UserLedgerStats: The stats, unsaved and empty if the user never had
+            transactions.
+    """
+    try:
+        return UserLedgerStats.objects.get(user=user)
+    except UserLedgerStats.DoesNotExist:
+        return UserLedgerStats(user=user)
+
+
+def reconcile_ledger_stats(user_ids: list):
+    """
+    Recompute the stats of users from their transactions.
+
+    The stats rows are locked first, so writes of the users wait for the
+    recomputed stats instead of being overwritten by them.
+
+    Args:
+        user_ids (list[int]): IDs of the users.
+
+    Returns:
+        list[int]: IDs of the users whose stats were missing or wrong.
+    """
+    with db_transaction.atomic():
+        list(
+            UserLedgerStats.objects.select_for_update()
+            .filter(user_id__in=user_ids)
+            .order_by('user_id')
+            .values_list('user_id', flat=True)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                RECONCILE_SQL,
+                {
+                    'user_ids': list(user_ids),
+                    'income': TransactionTypeEnum.INCOME.value,
+                    'expense': TransactionTypeEnum.EXPENSE.value,
+                },
+            )
+            return sorted(row[0] for row in cursor.fetchall())
@@ -0,0 +1,224 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.admin import site
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.core.admin import EstimatedCountPaginator
+from apps.reference.tests.factories import CategoryFactory, TransactionTypeFactory
+from apps.transactions.models import Transaction
+from apps.transactions.stats import get_ledger_stats, reconcile_ledger_stats
+from apps.transactions.tests.factories import TransactionFactory
+from apps.users.models import User
+
+# Created by the 0009 migration if pg_trgm is available
+TRIGRAM_INDEX = 'transaction_comment_trgm_idx'
+
+
+class TransactionAdminTests(TestCase):
+    """Test cases for the transactions changelist of the admin."""
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser('admin@example.com', 'password')
+        self.client.force_login(self.admin)
+        self.url = reverse('admin:transactions_transaction_changelist')
+
+        self.transactions = [TransactionFactory() for _ in range(5)]
+        now = timezone.now()
+        for index, transaction in enumerate(self.transactions):
+            Transaction.objects.filter(pk=transaction.pk).update(
+                created_at=now - timedelta(minutes=index)
+            )
+
+    def get_ids(self, response):
+        return [transaction.pk for transaction in response.context['cl'].result_list]
+
+    @mock.patch('apps.transactions.admin.TransactionAdmin.list_per_page', 2)
+    @mock.patch.object(
+        EstimatedCountPaginator, '_get_table_estimate', return_value=50_000_000
+    )
+    def test_keyset_pages(self, get_table_estimate):
+        """Test that pages follow each other with a cursor of the last row."""
+        # Session, user, filter choices of the 4 reference tables and the page
+        with self.assertNumQueries(7):
+            response = self.client.get(self.url)
+
+        cl = response.context['cl']
+        self.assertTrue(cl.keyset)
+        self.assertEqual(cl.result_count, 50_000_000)
+        self.assertContains(response, '~50000000 transactions')
+        ids = self.get_ids(response)
+        while cl.next_page_url:
+            response = self.client.get(self.url + cl.next_page_url)
+            cl = response.context['cl']
+            ids += self.get_ids(response)
+
+        self.assertEqual(ids, [transaction.pk for transaction in self.transactions])
+        self.assertContains(response, 'First page')
+
+    def test_invalid_cursor(self):
+        """Test that an invalid cursor is reported like an invalid filter."""
+        response = self.client.get(self.url, {'after': 'yesterday,1'})
+
+        self.assertRedirects(response, f'{self.url}?e=1')
+
+    def test_other_ordering_paged_by_number(self):
+        """Test that lists sorted by another column are paged as usual."""
+        response = self.client.get(self.url, {'o': '7'})
+
+        self.assertFalse(response.context['cl'].keyset)
+        self.assertEqual(len(self.get_ids(response)), 5)
+
+    def test_search(self):
+        """Test that transactions are searched by email or comment."""
+        transaction = self.transactions[2]
+        Transaction.objects.filter(pk=transaction.pk).update(comment='Coffee beans')
+
+        response = self.client.get(self.url, {'q': transaction.user.email.upper()})
+        self.assertEqual(self.get_ids(response), [transaction.pk])
+
+        response = self.client.get(self.url, {'q': 'fee bea'})
+        self.assertEqual(self.get_ids(response), [transaction.pk])
+
+    def search(self, search_term):
+        model_admin = site._registry[Transaction]
+        queryset, _ = model_admin.get_search_results(
+            None, Transaction.objects.all(), search_term
+        )
+        return queryset
+
+    def test_search_comment_expression(self):
+        """Test that comments are searched with the expression of the index."""
+        sql = str(self.search('fee bea').query)
+
+        self.assertIn('UPPER("transactions_transaction"."comment"::text) LIKE', sql)
+
+    def test_search_comment_uses_trigram_index(self):
+        """Test that the comment search is planned with the trigram index."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT 1 FROM pg_indexes WHERE indexname = %s', [TRIGRAM_INDEX]
+            )
+            if cursor.fetchone() is None:
+                self.skipTest('pg_trgm is not available')
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+        plan = self.search('fee bea').explain()
+
+        self.assertIn('Bitmap Index Scan', plan)
+
+    def get_count(self, user):
+        return get_ledger_stats(user).transaction_count
+
+    @mock.patch('apps.transactions.reports.invalidate_balance')
+    def test_change_refreshes_users(self, invalidate_balance):
+        """Test that changes update the stats and balances of both users."""
+        transaction = self.transactions[0]
+        user, other_user = transaction.user, self.transactions[1].user
+        reconcile_ledger_stats([user.pk, other_user.pk])
+        category = CategoryFactory(
+            name='Admin category', transaction_type=TransactionTypeFactory()
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse('admin:transactions_transaction_change', args=[transaction.pk]),
+                {
+                    'user': other_user.pk,
+                    'status': transaction.status_id,
+                    'transaction_type': category.transaction_type_id,
+                    'category': category.pk,
+                    'subcategory': '',
+                    'amount': '1.00',
+                    'comment': '',
+                },
+            )
+
+        self.assertRedirects(response, self.url)
+        self.assertEqual((self.get_count(user), self.get_count(other_user)), (0, 2))
+        self.assertEqual(
+            sorted(call.args[0] for call in invalidate_balance.call_args_list),
+            sorted([user.pk, other_user.pk]),
+        )
+
+    @mock.patch('apps.transactions.reports.invalidate_balance')
+    def test_delete_refreshes_user(self, invalidate_balance):
+        """Test that deletions update the stats and balance of the user."""
+        transaction = self.transactions[0]
+        reconcile_ledger_stats([transaction.user_id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse('admin:transactions_transaction_delete', args=[transaction.pk]),
+                {'post': 'yes'},
+            )
+
+        self.assertFalse(Transaction.objects.filter(pk=transaction.pk).exists())
+        self.assertEqual(self.get_count(transaction.user), 0)
+        invalidate_balance.assert_called_once_with(transaction.user_id)
+
+    @mock.patch('apps.transactions.reports.invalidate_balance')
+    def test_bulk_delete_refreshes_users(self, invalidate_balance):
+        """Test that bulk deletions update the stats and balances of the users."""
+        first, second, third, *_ = self.transactions
+        reconcile_ledger_stats([first.user_id, second.user_id, third.user_id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                self.url,
+                {
+                    'action': 'delete_selected',
+                    '_selected_action': [first.pk, second.pk],
+                    'post': 'yes',
+                },
+            )
+
+        self.assertEqual(
+            [self.get_count(t.user) for t in (first, second, third)], [0, 0, 1]
+        )
+        self.assertEqual(
+            sorted(call.args[0] for call in invalidate_balance.call_args_list),
+            sorted([first.user_id, second.user_id]),
+        )
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    """Test cases for estimating the count of large querysets."""
+
+    def setUp(self):
+        for _ in range(3):
+            TransactionFactory()
+
+    def test_small_counts_exact(self):
+        """Test that counts below the limit are counted exactly."""
+        paginator = EstimatedCountPaginator(Transaction.objects.all(), 2)
+
+        self.assertEqual(paginator.count, 3)
+        self.assertFalse(paginator.estimated)
+
+    def test_large_counts_estimated(self):
+        """Test that counts above the limit come from the statistics."""
+        paginator = EstimatedCountPaginator(Transaction.objects.all(), 2)
+        paginator.exact_count_limit = 2
+
+        with mock.patch.object(
+            EstimatedCountPaginator, '_get_table_estimate', return_value=50_000_000
+        ):
+            self.assertEqual(paginator.count, 50_000_000)
+        self.assertTrue(paginator.estimated)
+
+    def test_filtered_counts_planned(self):
+        """Test that filtered counts are estimated from the query plan."""
+        queryset = Transaction.objects.filter(amount__gte=0)
+        paginator = EstimatedCountPaginator(queryset, 2)
+        paginator.exact_count_limit = 0
+
+        with mock.patch.object(
+            EstimatedCountPaginator, '_get_table_estimate'
+        ) as get_table_estimate:
+            self.assertGreater(paginator.count, 0)
+        get_table_estimate.assert_not_called()
+        self.assertTrue(paginator.estimated)
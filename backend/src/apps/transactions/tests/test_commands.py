@@ -0,0 +1,147 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.transactions.models import Transaction, TransactionArchive, UserLedgerStats
+from apps.transactions.partitions import PARTITIONED_TABLE
+from apps.transactions.tests.factories import TransactionFactory
+
+
+class ManagePartitionsCommandTest(TestCase):
+    """Test suite for the manage_partitions management command."""
+
+    def test_creates_partitions(self):
+        """Test that the command creates partitions of the following months."""
+        out = StringIO()
+        with patch(
+            'apps.transactions.management.commands.manage_partitions.ensure_partitions',
+            return_value=[f'{PARTITIONED_TABLE}_y2100m01'],
+        ) as ensure_partitions:
+            call_command('manage_partitions', '--months-ahead=6', stdout=out)
+
+        ensure_partitions.assert_called_once_with(6)
+        self.assertIn(f'Created partition {PARTITIONED_TABLE}_y2100m01', out.getvalue())
+        self.assertIn('Created 1 partitions', out.getvalue())
+
+    def test_is_idempotent(self):
+        """Test that a repeated run does not create any partitions."""
+        call_command('manage_partitions', stdout=StringIO())
+
+        out = StringIO()
+        call_command('manage_partitions', '--analyze', stdout=out)
+
+        self.assertIn('Created 0 partitions', out.getvalue())
+        self.assertIn('Partition statistics refreshed', out.getvalue())
+
+    def test_detaches_partitions(self):
+        """Test that the command detaches partitions of old months."""
+        out = StringIO()
+        call_command('manage_partitions', '--detach-before=1990-01', stdout=out)
+
+        self.assertIn('Detached 0 partitions', out.getvalue())
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments are rejected."""
+        with self.assertRaises(CommandError):
+            call_command('manage_partitions', '--detach-before=2025/01')
+
+        with self.assertRaises(CommandError):
+            call_command('manage_partitions', '--months-ahead=-1')
+
+
+@override_settings(TRANSACTIONS_ARCHIVE_AFTER_DAYS=365)
+class ArchiveTransactionsCommandTest(TestCase):
+    """Test suite for the archive_transactions management command."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.transaction = TransactionFactory()
+        Transaction.objects.filter(pk=self.transaction.pk).update(
+            created_at=timezone.now() - timedelta(days=400)
+        )
+
+    def test_archives_transactions(self):
+        """Test that the command archives old transactions."""
+        out = StringIO()
+        call_command('archive_transactions', stdout=out)
+
+        self.assertIn('Archived 1 transactions in total', out.getvalue())
+        self.assertTrue(TransactionArchive.objects.filter(pk=self.transaction.pk))
+
+    def test_dry_run(self):
+        """Test that a dry run only reports the number of transactions."""
+        out = StringIO()
+        call_command('archive_transactions', '--dry-run', stdout=out)
+
+        self.assertIn('1 transactions created before', out.getvalue())
+        self.assertFalse(TransactionArchive.objects.exists())
+
+    def test_older_than_days(self):
+        """Test that horizons shorter than the configured one are accepted."""
+        recent = TransactionFactory()
+        Transaction.objects.filter(pk=recent.pk).update(
+            created_at=timezone.now() - timedelta(days=40)
+        )
+
+        call_command('archive_transactions', '--older-than-days=30', stdout=StringIO())
+
+        self.assertEqual(TransactionArchive.objects.count(), 2)
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments are rejected."""
+        with self.assertRaises(CommandError):
+            call_command('archive_transactions', '--older-than-days=-1')
+
+        with self.assertRaises(CommandError):
+            call_command('archive_transactions', '--batch-size=0')
+
+
+class ReconcileLedgerStatsCommandTest(TestCase):
+    """Test suite for the reconcile_ledger_stats management command."""
+
+    def test_fixes_drifted_stats(self):
+        """Test that the command recomputes stats in batches of users."""
+        transaction = TransactionFactory()
+        TransactionFactory()
+        UserLedgerStats.objects.create(user=transaction.user, transaction_count=5)
+
+        out = StringIO()
+        call_command('reconcile_ledger_stats', '--batch-size=1', stdout=out)
+
+        self.assertIn(
+            f'Fixed the ledger stats of user #{transaction.user.pk}', out.getvalue()
+        )
+        self.assertIn('2 users, 2 fixed', out.getvalue())
+        self.assertEqual(
+            UserLedgerStats.objects.get(user=transaction.user).transaction_count, 1
+        )
+
+        out = StringIO()
+        call_command('reconcile_ledger_stats', stdout=out)
+        self.assertIn('0 fixed', out.getvalue())
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments are rejected."""
+        with self.assertRaises(CommandError):
+            call_command('reconcile_ledger_stats', '--batch-size=0')
+
+        with self.assertRaises(CommandError):
+            call_command('reconcile_ledger_stats', '--user=missing@example.com')
+
+
+class BenchmarkRenderersCommandTest(TestCase):
+    """Test suite for the benchmark_renderers management command."""
+
+    def test_reports_render_time(self):
+        """Test that the command reports render time of every renderer."""
+        out = StringIO()
+        call_command('benchmark_renderers', '--rows=100', '--repeat=1', stdout=out)
+
+        self.assertIn('JSONRenderer', out.getvalue())
+        self.assertIn('ORJSONRenderer', out.getvalue())
+        self.assertIn('ms / 10k rows', out.getvalue())
@@ -0,0 +1,129 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+from django.http import QueryDict
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from apps.transactions.filters import parse_filters
+from apps.transactions.models import Transaction
+from apps.transactions.tests.factories import TransactionFactory
+from apps.users.tests.factories import UserFactory
+
+
+class ParseFiltersTests(SimpleTestCase):
+    """Test cases for parsing transaction filters."""
+
+    def assertInvalid(self, params, param):
+        with self.assertRaises(ValidationError) as context:
+            parse_filters(params)
+        self.assertIn(param, context.exception.detail)
+
+    def test_dates_cover_whole_days(self):
+        """Test that date bounds include the whole day in the time zone."""
+        filters = parse_filters(
+            {'created_at__gte': '2024-03-01', 'created_at__lte': '10.03.2024'},
+            tz=ZoneInfo('Europe/Berlin'),
+        )
+
+        self.assertEqual(filters.start, datetime(2024, 2, 29, 23, tzinfo=UTC))
+        self.assertEqual(filters.end, datetime(2024, 3, 10, 23, tzinfo=UTC))
+
+    def test_created_at_bounds_combine_to_one_range(self):
+        """Test that created_at bounds compile to a single half-open range."""
+        filters = parse_filters(
+            {
+                'created_at__gt': '2024-03-01T10:00:00Z',
+                'created_at__gte': '2024-02-01',
+                'created_at__lt': '2024-03-05',
+            },
+            tz=UTC,
+        )
+
+        self.assertEqual(filters.start, datetime(2024, 3, 1, 10, 0, 0, 1, tzinfo=UTC))
+        self.assertEqual(filters.end, datetime(2024, 3, 5, tzinfo=UTC))
+        self.assertEqual(
+            [child[0] for child in filters.q.children],
+            ['created_at__gte', 'created_at__lt'],
+        )
+
+    def test_reference_lists(self):
+        """Test that several IDs, comma-separated or repeated, match any."""
+        filters = parse_filters(QueryDict('category=3,1&category=2&status=5'))
+
+        self.assertIn(('category__in', [1, 2, 3]), filters.q.children)
+        self.assertIn(('status', 5), filters.q.children)
+
+        filters = parse_filters({'subcategory__in': '4'})
+        self.assertEqual(filters.q.children, [('subcategory', 4)])
+
+    def test_zero_amount(self):
+        """Test that falsy values are applied rather than dropped."""
+        filters = parse_filters({'amount__exact': '0'})
+
+        self.assertEqual(filters.q.children, [('amount__exact', Decimal('0'))])
+
+    def test_other_parameters_ignored(self):
+        """Test that parameters which are not filters are left to the view."""
+        filters = parse_filters({'ordering': '-amount', 'fields': 'id'})
+
+        self.assertFalse(filters)
+        self.assertIsNone(filters.start)
+
+    def test_invalid_filters(self):
+        """Test that unsupported and invalid filters are rejected."""
+        self.assertInvalid({'amount__in': '1,2'}, 'amount__in')
+        self.assertInvalid({'comment__icontains': 'a'}, 'comment__icontains')
+        self.assertInvalid({'amount__gte': 'ten'}, 'amount__gte')
+        self.assertInvalid({'amount__gte': ['1', '2']}, 'amount__gte')
+        self.assertInvalid({'category': 'food'}, 'category')
+        self.assertInvalid({'category__in': ''}, 'category__in')
+        self.assertInvalid({'created_at__gte': 'yesterday'}, 'created_at__gte')
+        self.assertInvalid(
+            {'status__in': ','.join(str(i) for i in range(1, 102))}, 'status__in'
+        )
+
+
+class TransactionFilterQueryTests(TestCase):
+    """Test cases for filtering transaction queries."""
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('transaction-list-create')
+
+    def test_last_day_of_range_included(self):
+        """Test that transactions later on the last day of a range are listed."""
+        transaction = TransactionFactory(user=self.user)
+        Transaction.objects.filter(pk=transaction.pk).update(
+            created_at=datetime(2024, 3, 10, 18, tzinfo=UTC)
+        )
+
+        response = self.client.get(
+            self.url,
+            {'created_at__gte': '2024-03-10', 'created_at__lte': '2024-03-10'},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([tx['id'] for tx in response.data], [transaction.pk])
+
+    def test_zero_amount(self):
+        """Test that an amount of zero filters transactions."""
+        zero = TransactionFactory(user=self.user, amount=0)
+        TransactionFactory(user=self.user, amount=10)
+
+        response = self.client.get(self.url, {'amount__exact': '0'})
+
+        self.assertEqual([tx['id'] for tx in response.data], [zero.pk])
+
+    def test_invalid_filter_rejected(self):
+        """Test that invalid filters are answered with 400."""
+        response = self.client.get(self.url, {'created_at__gte': '2024-13-45'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('created_at__gte', response.data['errors'])
@@ -0,0 +1,231 @@
+import time
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.reference import registry
+from apps.reference.tests.factories import (
+    CategoryFactory,
+    StatusFactory,
+    SubcategoryFactory,
+    TransactionTypeFactory,
+)
+from apps.transactions import ingest
+from apps.transactions.models import Transaction
+from apps.transactions.serializers import TransactionIngestSerializer
+from apps.transactions.stats import get_ledger_stats
+from apps.users.tests.factories import UserFactory
+
+
+class IngestTestMixin:
+    def setUp(self):
+        cache.clear()
+        registry.clear_reference_ids()
+        # Rows left by other test cases refer to rolled back data
+        ingest._buffer.clear()
+        self.user = UserFactory()
+        self.status = StatusFactory()
+        self.transaction_type = TransactionTypeFactory()
+        self.category = CategoryFactory(transaction_type=self.transaction_type)
+        self.subcategory = SubcategoryFactory(category=self.category)
+
+    def tearDown(self):
+        registry.clear_reference_ids()
+
+    def row(self, **fields):
+        return {
+            'status_id': self.status.id,
+            'transaction_type_id': self.transaction_type.id,
+            'category_id': self.category.id,
+            'subcategory_id': self.subcategory.id,
+            'amount': '10.50',
+            'comment': 'Ingested',
+            **fields,
+        }
+
+
+@mock.patch.object(ingest, '_start_flusher')
+class TransactionIngestTests(IngestTestMixin, TestCase):
+    """Test cases for the write-behind transaction ingestion."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('transaction-ingest')
+        self.ticket_url = lambda ticket: reverse(
+            'transaction-ingest-ticket', args=[ticket]
+        )
+
+    def test_ingest_queues_until_flushed(self, start_flusher):
+        """Test that ingested transactions are created by the flush."""
+        response = self.client.post(
+            self.url, {'transactions': [self.row()] * 3}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['status'], ingest.QUEUED)
+        self.assertEqual(response.data['count'], 3)
+        self.assertFalse(Transaction.objects.exists())
+        start_flusher.assert_called_once()
+
+        # One more query adds the transactions to the stats of the user
+        with self.assertNumQueries(4):
+            self.assertEqual(ingest.flush_transactions(), 3)
+
+        transactions = Transaction.objects.filter(user=self.user)
+        self.assertEqual(transactions.count(), 3)
+        self.assertEqual(get_ledger_stats(self.user).transaction_count, 3)
+        self.assertEqual(transactions[0].amount, Decimal('10.50'))
+        self.assertEqual(transactions[0].subcategory, self.subcategory)
+
+        response = self.client.get(self.ticket_url(response.data['ticket']))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], ingest.COMMITTED)
+
+    @override_settings(TRANSACTIONS_INGEST_BATCH_SIZE=2)
+    def test_full_buffer_wakes_flusher(self, start_flusher):
+        """Test that the flusher is woken up once the buffer holds a batch."""
+        buffer = ingest._get_buffer()
+
+        ingest.enqueue_transactions([], self.user)
+        self.assertFalse(buffer['wakeup'].is_set())
+
+        self.client.post(self.url, {'transactions': [self.row()] * 2}, format='json')
+        self.assertTrue(buffer['wakeup'].is_set())
+
+    def test_validation_uses_cached_reference_data(self, start_flusher):
+        """Test that rows are validated without a query per row."""
+        registry.get_reference_ids()
+
+        with self.assertNumQueries(0):
+            serializer = TransactionIngestSerializer(
+                data={'transactions': [self.row()] * 50}
+            )
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+
+    def test_ingest_invalid_rows(self, start_flusher):
+        """Test that invalid rows are rejected with their index."""
+        other_category = CategoryFactory(
+            name='Other', transaction_type=TransactionTypeFactory(name='Other')
+        )
+        response = self.client.post(
+            self.url,
+            {
+                'transactions': [
+                    self.row(),
+                    self.row(status_id=10**6),
+                    self.row(category_id=other_category.id, subcategory_id=None),
+                    self.row(subcategory_id=None, amount='oops'),
+                ]
+            },
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ingest._get_buffer()['rows'])
+
+        response = self.client.post(
+            self.url,
+            {
+                'transactions': [
+                    self.row(),
+                    self.row(status_id=10**6),
+                    self.row(category_id=other_category.id, subcategory_id=None),
+                ]
+            },
+            format='json',
+        )
+        errors = response.data['errors']['transactions']
+        self.assertEqual(set(errors), {1, 2})
+        self.assertIn('status_id', errors[1])
+        self.assertIn('category', errors[2])
+
+        # Amounts must fit the column
+        response = self.client.post(
+            self.url,
+            {'transactions': [self.row(amount='10000000000.00')]},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_failed_flush_marks_tickets(self, start_flusher):
+        """Test that the tickets of a failed flush are marked failed."""
+        ticket = ingest.enqueue_transactions([self.row()], self.user)
+
+        with (
+            mock.patch.object(
+                Transaction.objects, 'bulk_create', side_effect=DatabaseError('down')
+            ),
+            self.assertLogs(ingest.logger, 'ERROR'),
+        ):
+            self.assertEqual(ingest.flush_transactions(), 0)
+
+        self.assertEqual(
+            ingest.get_ticket(ticket, self.user),
+            {
+                'status': ingest.FAILED,
+                'count': 1,
+                'error': 'The transactions could not be saved',
+            },
+        )
+
+    def test_failed_ticket_does_not_fail_batch(self, start_flusher):
+        """Test that the other tickets of a failed batch are committed."""
+        other_user = UserFactory()
+        committed = ingest.enqueue_transactions([self.row()] * 2, self.user)
+        # The amount does not fit the column, bypassing the serializer
+        failed = ingest.enqueue_transactions(
+            [self.row(amount=Decimal('10000000000.00'))], other_user
+        )
+
+        with self.assertLogs(ingest.logger, 'ERROR'):
+            self.assertEqual(ingest.flush_transactions(), 2)
+
+        self.assertEqual(
+            ingest.get_ticket(committed, self.user)['status'], ingest.COMMITTED
+        )
+        self.assertEqual(
+            ingest.get_ticket(failed, other_user),
+            {
+                'status': ingest.FAILED,
+                'count': 1,
+                'error': 'The transactions could not be saved',
+            },
+        )
+        self.assertEqual(Transaction.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(get_ledger_stats(self.user).transaction_count, 2)
+        self.assertFalse(Transaction.objects.filter(user=other_user).exists())
+
+    def test_ticket_of_other_user(self, start_flusher):
+        """Test that tickets are only visible to their owner."""
+        ticket = ingest.enqueue_transactions([self.row()], UserFactory())
+
+        response = self.client.get(self.ticket_url(ticket))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(TRANSACTIONS_INGEST_FLUSH_INTERVAL_MS=10)
+class TransactionIngestFlusherTests(IngestTestMixin, TransactionTestCase):
+    """Test cases for the background flusher thread."""
+
+    def test_flusher_commits_in_background(self):
+        """Test that the flusher thread commits buffered transactions."""
+        ticket = ingest.enqueue_transactions([self.row()] * 2, self.user)
+
+        deadline = time.monotonic() + 5
+        while ingest.get_ticket(ticket, self.user)['status'] == ingest.QUEUED:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+        self.assertEqual(
+            ingest.get_ticket(ticket, self.user)['status'], ingest.COMMITTED
+        )
+        self.assertEqual(Transaction.objects.filter(user=self.user).count(), 2)
@@ -0,0 +1,125 @@
+from datetime import UTC, date, datetime
+
+from django.db import connection
+from django.test import TestCase
+
+from apps.transactions.models import Transaction
+from apps.transactions.partitions import (
+    DEFAULT_PARTITION,
+    PARTITIONED_TABLE,
+    add_months,
+    create_partition,
+    detach_partitions,
+    ensure_partitions,
+    get_partition_name,
+    get_partitions,
+)
+from apps.transactions.services import get_user_transactions
+from apps.transactions.tests.factories import TransactionFactory
+from apps.users.tests.factories import UserFactory
+
+
+class TransactionPartitionTests(TestCase):
+    """Test cases for monthly partitions of the transactions table."""
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.transaction = TransactionFactory(user=self.user)
+
+    def get_row_partition(self, transaction_id):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT tableoid::regclass::text FROM {PARTITIONED_TABLE} '
+                'WHERE id = %s',
+                [transaction_id],
+            )
+            return cursor.fetchone()[0]
+
+    def move_transaction(self, created_at):
+        Transaction.objects.filter(pk=self.transaction.pk).update(created_at=created_at)
+
+    def test_table_is_partitioned(self):
+        """Test that the transactions table is partitioned by created_at."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT partstrat FROM pg_partitioned_table '
+                'WHERE partrelid = %s::regclass',
+                [PARTITIONED_TABLE],
+            )
+            self.assertEqual(cursor.fetchone(), ('r',))
+
+    def test_current_month_partition_exists(self):
+        """Test that new transactions are stored in the partition of their month."""
+        month = self.transaction.created_at.astimezone(UTC).date()
+
+        self.assertIn(get_partition_name(month), dict(get_partitions()).values())
+        self.assertEqual(
+            self.get_row_partition(self.transaction.pk), get_partition_name(month)
+        )
+
+    def test_add_months(self):
+        """Test shifting months across year boundaries."""
+        self.assertEqual(add_months(date(2025, 11, 15), 2), date(2026, 1, 1))
+        self.assertEqual(add_months(date(2025, 1, 31), -1), date(2024, 12, 1))
+
+    def test_create_partition_moves_default_rows(self):
+        """Test that creating a partition moves its rows out of the default one."""
+        self.move_transaction(datetime(2100, 1, 15, tzinfo=UTC))
+        self.assertEqual(self.get_row_partition(self.transaction.pk), DEFAULT_PARTITION)
+
+        self.assertTrue(create_partition(date(2100, 1, 1)))
+
+        self.assertEqual(
+            self.get_row_partition(self.transaction.pk), f'{PARTITIONED_TABLE}_y2100m01'
+        )
+        self.assertTrue(Transaction.objects.filter(pk=self.transaction.pk).exists())
+
+    def test_create_existing_partition(self):
+        """Test that creating an existing partition is a no-op."""
+        self.assertTrue(create_partition(date(2100, 2, 1)))
+        self.assertFalse(create_partition(date(2100, 2, 10)))
+
+    def test_ensure_partitions(self):
+        """Test that partitions are created for the current and following months."""
+        created = ensure_partitions(months_ahead=2, today=date(2099, 12, 5))
+
+        self.assertEqual(
+            created,
+            [
+                f'{PARTITIONED_TABLE}_y2099m12',
+                f'{PARTITIONED_TABLE}_y2100m01',
+                f'{PARTITIONED_TABLE}_y2100m02',
+            ],
+        )
+        self.assertEqual(ensure_partitions(months_ahead=2, today=date(2099, 12, 5)), [])
+
+    def test_detach_partitions(self):
+        """Test that partitions of old months are detached with their rows."""
+        create_partition(date(1999, 12, 1))
+        self.move_transaction(datetime(1999, 12, 31, tzinfo=UTC))
+
+        detached = detach_partitions(date(2000, 1, 1))
+
+        self.assertEqual(detached, [f'{PARTITIONED_TABLE}_y1999m12'])
+        self.assertNotIn(
+            f'{PARTITIONED_TABLE}_y1999m12', dict(get_partitions()).values()
+        )
+        self.assertFalse(Transaction.objects.filter(pk=self.transaction.pk).exists())
+
+    def test_date_range_filter_prunes_partitions(self):
+        """Test that created_at range filters scan only the matching partitions."""
+        create_partition(date(2100, 3, 1))
+        create_partition(date(2100, 4, 1))
+
+        queryset = get_user_transactions(
+            self.user,
+            filters={
+                'created_at__gte': '2100-03-01T00:00:00Z',
+                'created_at__lt': '2100-04-01T00:00:00Z',
+            },
+        )
+        plan = queryset.explain()
+
+        self.assertIn(f'{PARTITIONED_TABLE}_y2100m03', plan)
+        self.assertNotIn(f'{PARTITIONED_TABLE}_y2100m04', plan)
+        self.assertNotIn(DEFAULT_PARTITION, plan)
@@ -0,0 +1,390 @@
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient, APITestCase
+
+from apps.reference.enums import TransactionTypeEnum
+from apps.reference.models import Category
+from apps.reference.tests.factories import CategoryFactory, TransactionTypeFactory
+from apps.transactions import reports
+from apps.transactions.models import Transaction
+from apps.transactions.services import (
+    archive_transactions,
+    delete_transaction,
+    update_transaction,
+)
+from apps.transactions.stats import reconcile_ledger_stats
+from apps.transactions.tests.factories import TransactionFactory
+from apps.users.tests.factories import UserFactory
+
+UTC_ZONE = ZoneInfo('UTC')
+
+
+class BalanceTestMixin:
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.income = TransactionTypeFactory(name=TransactionTypeEnum.INCOME.value)
+        self.expense = TransactionTypeFactory(name=TransactionTypeEnum.EXPENSE.value)
+
+    def create(self, transaction_type, amount, created_at, user=None, **kwargs):
+        transaction = TransactionFactory(
+            user=user or self.user,
+            transaction_type=transaction_type,
+            amount=Decimal(amount),
+            **kwargs,
+        )
+        Transaction.objects.filter(pk=transaction.pk).update(created_at=created_at)
+        return transaction
+
+
+class TransactionBalanceReportTests(BalanceTestMixin, TestCase):
+    """Test cases for the running balance report."""
+
+    def setUp(self):
+        super().setUp()
+        # Monday, Tuesday and the Monday of the next week
+        self.create(self.income, '100.00', datetime(2024, 3, 4, 9, tzinfo=UTC))
+        self.create(self.expense, '30.00', datetime(2024, 3, 4, 18, tzinfo=UTC))
+        self.create(self.expense, '20.00', datetime(2024, 3, 5, 12, tzinfo=UTC))
+        self.create(self.income, '50.00', datetime(2024, 3, 11, 8, tzinfo=UTC))
+        self.create(
+            self.income, '999.00', datetime(2024, 3, 4, tzinfo=UTC), UserFactory()
+        )
+
+    def test_compute_balance_daily(self):
+        """Test that the balance accumulates signed amounts per day."""
+        buckets = reports.compute_balance(self.user, 'day', UTC_ZONE)
+
+        self.assertEqual(
+            buckets,
+            [
+                (datetime(2024, 3, 4), Decimal('70.00'), Decimal('70.00')),
+                (datetime(2024, 3, 5), Decimal('-20.00'), Decimal('50.00')),
+                (datetime(2024, 3, 11), Decimal('50.00'), Decimal('100.00')),
+            ],
+        )
+
+    def test_compute_balance_weekly_and_monthly(self):
+        """Test that buckets start on Mondays and on the first of the month."""
+        weekly = reports.compute_balance(self.user, 'week', UTC_ZONE)
+        monthly = reports.compute_balance(self.user, 'month', UTC_ZONE)
+
+        self.assertEqual(
+            [(bucket.date(), balance) for bucket, _, balance in weekly],
+            [(date(2024, 3, 4), Decimal('50.00')), (date(2024, 3, 11), 100)],
+        )
+        self.assertEqual(monthly, [(datetime(2024, 3, 1), 100, 100)])
+
+    def test_compute_balance_in_time_zone(self):
+        """Test that buckets start at midnight in the requested time zone."""
+        buckets = reports.compute_balance(self.user, 'day', ZoneInfo('Asia/Tokyo'))
+
+        # 18:00 UTC on March 4th is already March 5th in Tokyo
+        self.assertEqual(
+            [(bucket.date(), change) for bucket, change, _ in buckets],
+            [
+                (date(2024, 3, 4), Decimal('100.00')),
+                (date(2024, 3, 5), Decimal('-50.00')),
+                (date(2024, 3, 11), Decimal('50.00')),
+            ],
+        )
+
+    def test_compute_balance_includes_archive(self):
+        """Test that archived transactions are part of the balance."""
+        archive_transactions(datetime(2024, 3, 6, tzinfo=UTC), 10)
+
+        buckets = reports.compute_balance(self.user, 'day', UTC_ZONE)
+
+        self.assertEqual(buckets[-1][2], Decimal('100.00'))
+        self.assertEqual(len(buckets), 3)
+
+    def test_get_balance_invalid_arguments(self):
+        """Test that unsupported resolutions and time zones are rejected."""
+        with self.assertRaises(ValidationError):
+            reports.get_balance(self.user, resolution='year')
+        with self.assertRaises(ValidationError):
+            reports.get_timezone('Mars/Olympus_Mons')
+
+    @override_settings(TRANSACTIONS_BALANCE_SNAPSHOT_TIMEOUT=0)
+    def test_get_balance_without_snapshot(self):
+        """Test that the balance is computed from scratch without snapshots."""
+        with mock.patch.object(
+            reports, 'compute_balance', wraps=reports.compute_balance
+        ) as compute:
+            reports.get_balance(self.user, tz=UTC_ZONE)
+            reports.get_balance(self.user, tz=UTC_ZONE)
+
+        for call in compute.call_args_list:
+            self.assertNotIn('since', call.kwargs)
+
+    @override_settings(TRANSACTIONS_BALANCE_SNAPSHOT_TIMEOUT=60)
+    def test_get_balance_advances_snapshot(self):
+        """Test that a cached balance is only advanced from its last bucket."""
+        reports.get_balance(self.user, tz=UTC_ZONE)
+        self.create(self.income, '5.00', datetime(2024, 3, 11, 20, tzinfo=UTC))
+        self.create(self.expense, '1.00', datetime(2024, 3, 12, 8, tzinfo=UTC))
+
+        with mock.patch.object(
+            reports, 'compute_balance', wraps=reports.compute_balance
+        ) as compute:
+            buckets = reports.get_balance(self.user, tz=UTC_ZONE)
+
+        compute.assert_called_once()
+        self.assertEqual(
+            compute.call_args.kwargs['since'], datetime(2024, 3, 11, tzinfo=UTC_ZONE)
+        )
+        self.assertEqual(compute.call_args.kwargs['opening'], Decimal('50.00'))
+        self.assertEqual(
+            buckets,
+            reports.compute_balance(self.user, 'day', UTC_ZONE),
+        )
+        self.assertEqual(buckets[-1][2], Decimal('104.00'))
+
+    @override_settings(TRANSACTIONS_BALANCE_SNAPSHOT_TIMEOUT=60)
+    def test_get_balance_invalidated_by_changes(self):
+        """Test that updating or deleting transactions drops the snapshot."""
+        transaction = self.create(
+            self.expense,
+            '10.00',
+            datetime(2024, 3, 4, 12, tzinfo=UTC),
+            category=CategoryFactory(transaction_type=self.expense),
+            subcategory=None,
+        )
+        Category.objects.filter(pk=transaction.category_id).update(
+            transaction_type=self.expense
+        )
+        self.assertEqual(
+            reports.get_balance(self.user, tz=UTC_ZONE)[-1][2], Decimal('90.00')
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            update_transaction(transaction.pk, {'amount': Decimal('40.00')}, self.user)
+        self.assertEqual(
+            reports.get_balance(self.user, tz=UTC_ZONE)[-1][2], Decimal('60.00')
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            delete_transaction(transaction.pk, self.user)
+        self.assertEqual(
+            reports.get_balance(self.user, tz=UTC_ZONE)[-1][2], Decimal('100.00')
+        )
+
+
+class TransactionBalanceViewTests(BalanceTestMixin, APITestCase):
+    """Test suite for the running balance endpoint."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('transaction-balance')
+        self.create(self.income, '100.00', datetime(2024, 1, 10, tzinfo=UTC))
+        self.create(self.expense, '40.00', datetime(2024, 2, 10, tzinfo=UTC))
+
+    def test_get_balance(self):
+        """Test retrieving the monthly running balance."""
+        response = self.client.get(self.url, {'resolution': 'month', 'tz': 'UTC'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['resolution'], 'month')
+        self.assertEqual(response.data['tz'], 'UTC')
+        self.assertEqual(
+            [dict(item) for item in response.data['results']],
+            [
+                {'bucket': '2024-01-01', 'change': '100.00', 'balance': '100.00'},
+                {'bucket': '2024-02-01', 'change': '-40.00', 'balance': '60.00'},
+            ],
+        )
+
+    def test_get_balance_date_range(self):
+        """Test that the date range limits the buckets but not the balance."""
+        response = self.client.get(
+            self.url, {'tz': 'UTC', 'created_at__gte': '2024-02-01'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['balance'], '60.00')
+
+    def test_get_balance_date_input_formats(self):
+        """Test that the date range accepts the formats of the list filters."""
+        response = self.client.get(
+            self.url,
+            {
+                'resolution': 'month',
+                'tz': 'UTC',
+                'created_at__gte': '01.01.2024',
+                'created_at__lte': '01.01.2024',
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item['bucket'] for item in response.data['results']], ['2024-01-01']
+        )
+
+    def test_get_balance_invalid_parameters(self):
+        """Test that invalid parameters are rejected."""
+        for params in [
+            {'resolution': 'hour'},
+            {'tz': 'Nowhere/Land'},
+            {'created_at__gte': 'yesterday'},
+        ]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_balance_unauthenticated(self):
+        """Test that the balance requires authentication."""
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class TransactionTimeseriesReportTests(BalanceTestMixin, TestCase):
+    """Test cases for the time series report."""
+
+    def setUp(self):
+        super().setUp()
+        self.create(self.income, '100.00', datetime(2024, 3, 4, 9, tzinfo=UTC))
+        self.create(self.income, '20.00', datetime(2024, 3, 4, 18, tzinfo=UTC))
+        self.create(self.expense, '30.00', datetime(2024, 3, 7, 12, tzinfo=UTC))
+
+    def test_compute_timeseries_fills_gaps(self):
+        """Test that every bucket between the first and the last is present."""
+        timeseries = reports.compute_timeseries(self.user, 'day', UTC_ZONE)
+
+        self.assertEqual(
+            timeseries['buckets'],
+            [date(2024, 3, day) for day in range(4, 8)],
+        )
+        self.assertEqual(
+            timeseries['series'],
+            sorted(
+                [
+                    {
+                        'id': self.income.pk,
+                        'name': self.income.name,
+                        'values': [Decimal('120.00'), 0, 0, 0],
+                    },
+                    {
+                        'id': self.expense.pk,
+                        'name': self.expense.name,
+                        'values': [0, 0, 0, Decimal('30.00')],
+                    },
+                ],
+                key=lambda series: series['id'],
+            ),
+        )
+
+    def test_compute_timeseries_filters(self):
+        """Test that filters select transactions and bound the buckets."""
+        timeseries = reports.compute_timeseries(
+            self.user,
+            'week',
+            UTC_ZONE,
+            group_by='category',
+            filters={
+                'transaction_type': self.income.pk,
+                'created_at__gte': '2024-02-20',
+                'created_at__lte': '2024-03-10',
+            },
+        )
+
+        self.assertEqual(
+            timeseries['buckets'],
+            [date(2024, 2, 19), date(2024, 2, 26), date(2024, 3, 4)],
+        )
+        self.assertEqual(
+            sum(sum(series['values']) for series in timeseries['series']),
+            Decimal('120.00'),
+        )
+
+    def test_compute_timeseries_includes_archive(self):
+        """Test that archived transactions are read for old date ranges."""
+        archive_transactions(datetime(2024, 3, 5, tzinfo=UTC), 10)
+
+        timeseries = reports.compute_timeseries(
+            self.user, 'month', UTC_ZONE, filters={'created_at__gte': '2024-01-01'}
+        )
+
+        self.assertEqual(timeseries['buckets'][-1], date(2024, 3, 1))
+        self.assertEqual(
+            sorted(series['values'][-1] for series in timeseries['series']),
+            [Decimal('30.00'), Decimal('120.00')],
+        )
+
+    def test_compute_timeseries_without_transactions(self):
+        """Test that no buckets are returned without transactions."""
+        timeseries = reports.compute_timeseries(UserFactory(), 'day', UTC_ZONE)
+
+        self.assertEqual(timeseries, {'buckets': [], 'series': []})
+
+    @override_settings(TRANSACTIONS_TIMESERIES_MAX_BUCKETS=3)
+    def test_compute_timeseries_too_many_buckets(self):
+        """Test that ranges of too many buckets are rejected."""
+        # The dates of the transactions were changed past the stats
+        reconcile_ledger_stats([self.user.pk])
+
+        with self.assertRaises(ValidationError):
+            reports.compute_timeseries(self.user, 'day', UTC_ZONE)
+        with self.assertRaises(ValidationError):
+            reports.compute_timeseries(
+                self.user, 'week', UTC_ZONE, filters={'created_at__gte': '2024-01-01'}
+            )
+
+        timeseries = reports.compute_timeseries(self.user, 'week', UTC_ZONE)
+        self.assertEqual(timeseries['buckets'], [date(2024, 3, 4)])
+
+    def test_compute_timeseries_invalid_group(self):
+        """Test that unsupported groups are rejected."""
+        with self.assertRaises(ValidationError):
+            reports.compute_timeseries(self.user, group_by='comment')
+
+
+class TransactionTimeseriesViewTests(BalanceTestMixin, APITestCase):
+    """Test suite for the time series endpoint."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('transaction-timeseries')
+        self.create(self.income, '100.00', datetime(2024, 1, 10, tzinfo=UTC))
+        self.create(self.income, '40.00', datetime(2024, 3, 10, tzinfo=UTC))
+
+    def test_get_timeseries(self):
+        """Test retrieving monthly sums as parallel arrays."""
+        response = self.client.get(
+            self.url, {'bucket': 'month', 'tz': 'UTC', 'group_by': 'transaction_type'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['buckets'], ['2024-01-01', '2024-02-01', '2024-03-01']
+        )
+        self.assertEqual(len(response.data['series']), 1)
+        self.assertEqual(response.data['series'][0]['id'], self.income.pk)
+        self.assertEqual(
+            response.data['series'][0]['values'], ['100.00', '0.00', '40.00']
+        )
+
+    def test_get_timeseries_invalid_parameters(self):
+        """Test that invalid parameters are rejected."""
+        for params in [
+            {'bucket': 'year'},
+            {'group_by': 'user'},
+            {'tz': 'Nowhere/Land'},
+            {'amount__gte': 'much'},
+            {'created_at__gte': '0001-01-01', 'created_at__lte': '9999-12-30'},
+            {'created_at__lte': '9999-12-31'},
+        ]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
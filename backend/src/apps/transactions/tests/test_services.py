@@ -1,4 +1,8 @@
-from django.test import TestCase
+from datetime import timedelta
+
+from django.db import transaction as db_transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 
 from apps.reference.tests.factories import (
@@ -7,10 +11,13 @@ from apps.reference.tests.factories import (
     SubcategoryFactory,
     TransactionTypeFactory,
 )
-from apps.transactions.models import Transaction
+from apps.transactions.models import Transaction, TransactionArchive
 from apps.transactions.services import (
+    TransactionArchived,
+    archive_transactions,
     create_transaction,
     delete_transaction,
+    filters_reach_archive,
     get_categories_for_transaction_type,
     get_subcategories_for_category,
     get_transaction_by_id,
@@ -185,3 +192,163 @@ class TransactionServiceTests(TestCase):
         categories = get_categories_for_transaction_type(self.transaction_type.id)
         self.assertIn(cat1, categories)
         self.assertIn(cat2, categories)
+
+
+@override_settings(TRANSACTIONS_ARCHIVE_AFTER_DAYS=365)
+class TransactionArchiveServiceTests(TestCase):
+    """Test cases for archiving transactions and reading archived ones."""
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.now = timezone.now()
+        self.recent = TransactionFactory(user=self.user)
+        self.old = TransactionFactory(user=self.user)
+        Transaction.objects.filter(pk=self.old.pk).update(
+            created_at=self.now - timedelta(days=400)
+        )
+
+    def archive(self):
+        return list(archive_transactions(self.now - timedelta(days=365), 10))
+
+    def test_archive_transactions_moves_old_transactions(self):
+        """Test that only transactions older than the cutoff are archived."""
+        self.assertEqual(self.archive(), [1])
+
+        self.assertFalse(Transaction.objects.filter(pk=self.old.pk).exists())
+        self.assertTrue(Transaction.objects.filter(pk=self.recent.pk).exists())
+        archived = TransactionArchive.objects.get(pk=self.old.pk)
+        self.assertEqual(archived.comment, self.old.comment)
+        self.assertEqual(archived.category_id, self.old.category_id)
+
+    def test_archive_transactions_in_batches(self):
+        """Test that transactions are archived in batches and reruns are no-ops."""
+        for _ in range(2):
+            transaction = TransactionFactory(user=self.user)
+            Transaction.objects.filter(pk=transaction.pk).update(
+                created_at=self.now - timedelta(days=500)
+            )
+
+        batches = list(archive_transactions(self.now - timedelta(days=365), 2))
+
+        self.assertEqual(batches, [2, 1])
+        self.assertEqual(TransactionArchive.objects.count(), 3)
+        self.assertEqual(self.archive(), [])
+
+    def test_filters_reach_archive(self):
+        """Test detection of created_at filters reaching the archived range."""
+        old_date = (self.now - timedelta(days=400)).date().isoformat()
+        recent_date = (self.now - timedelta(days=10)).date().isoformat()
+        self.assertFalse(
+            filters_reach_archive({'created_at__gte': old_date}, self.user)
+        )
+
+        self.archive()
+
+        self.assertFalse(filters_reach_archive({}, self.user))
+        self.assertFalse(filters_reach_archive({'amount__gte': 10}, self.user))
+        self.assertFalse(
+            filters_reach_archive({'created_at__gte': recent_date}, self.user)
+        )
+        self.assertTrue(filters_reach_archive({'created_at__gte': old_date}, self.user))
+        self.assertTrue(
+            filters_reach_archive({'created_at__lte': recent_date}, self.user)
+        )
+        self.assertFalse(
+            filters_reach_archive({'created_at__gte': old_date}, UserFactory())
+        )
+        with self.assertRaises(ValidationError):
+            filters_reach_archive({'created_at__gte': 'invalid'}, self.user)
+
+    def test_filters_reach_archive_after_setting_change(self):
+        """Test that raising the archive age keeps archived rows reachable."""
+        self.archive()
+        old_date = (self.now - timedelta(days=400)).date().isoformat()
+
+        with override_settings(TRANSACTIONS_ARCHIVE_AFTER_DAYS=1000):
+            self.assertTrue(
+                filters_reach_archive({'created_at__gte': old_date}, self.user)
+            )
+
+    def test_get_transaction_by_id_reads_archive(self):
+        """Test that archived transactions are found but cannot be locked."""
+        self.archive()
+
+        transaction = get_transaction_by_id(self.old.pk, self.user)
+
+        self.assertIsInstance(transaction, TransactionArchive)
+        self.assertEqual(transaction.category.name, self.old.category.name)
+        with self.assertRaises(PermissionDenied):
+            get_transaction_by_id(self.old.pk, UserFactory())
+        with self.assertRaises(TransactionArchived), db_transaction.atomic():
+            get_transaction_by_id(self.old.pk, self.user, lock=True)
+        with self.assertRaises(TransactionArchived):
+            delete_transaction(self.old.pk, self.user)
+
+    def test_get_user_transactions_excludes_archive_without_date_filter(self):
+        """Test that archived transactions are not read without a date filter."""
+        self.archive()
+
+        transactions = get_user_transactions(self.user)
+
+        self.assertEqual([t.id for t in transactions], [self.recent.id])
+
+    def test_get_user_transactions_includes_archive_for_old_range(self):
+        """Test that archived transactions are read when the range reaches them."""
+        self.archive()
+        TransactionArchive.objects.create(
+            id=10**9,
+            user=UserFactory(),
+            status=self.old.status,
+            transaction_type=self.old.transaction_type,
+            category=self.old.category,
+            amount=1,
+            created_at=self.now - timedelta(days=400),
+            updated_at=self.now - timedelta(days=400),
+        )
+
+        transactions = get_user_transactions(
+            self.user,
+            filters={
+                'created_at__gte': (self.now - timedelta(days=450)).isoformat(),
+                'amount__gte': 0,
+            },
+        )
+
+        self.assertEqual([t.id for t in transactions], [self.recent.id, self.old.id])
+        self.assertEqual(transactions[1].category.name, self.old.category.name)
+
+    def test_get_user_transactions_values_include_archive(self):
+        """Test that rows fetched as values are read from both tables."""
+        self.archive()
+
+        rows = get_user_transactions(
+            self.user,
+            filters={'created_at__gte': (self.now - timedelta(days=450)).isoformat()},
+            values=('id', 'category_id', 'created_at'),
+        )
+
+        self.assertEqual(
+            [row[:2] for row in rows],
+            [
+                (self.recent.id, self.recent.category_id),
+                (self.old.id, self.old.category_id),
+            ],
+        )
+
+    def test_get_user_transactions_only_include_archive(self):
+        """Test that column-pruned instances are read from both tables."""
+        self.archive()
+
+        transactions = get_user_transactions(
+            self.user,
+            filters={'created_at__gte': (self.now - timedelta(days=450)).isoformat()},
+            only=('amount', 'category', 'category__name'),
+        )
+
+        self.assertEqual(
+            [(t.id, t.category.name) for t in transactions],
+            [
+                (self.recent.id, self.recent.category.name),
+                (self.old.id, self.old.category.name),
+            ],
+        )
@@ -0,0 +1,191 @@
+import threading
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connections
+from django.db import transaction as db_transaction
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+
+from apps.reference import registry
+from apps.reference.enums import TransactionTypeEnum
+from apps.reference.tests.factories import (
+    CategoryFactory,
+    StatusFactory,
+    TransactionTypeFactory,
+)
+from apps.transactions.models import Transaction, UserLedgerStats
+from apps.transactions.services import (
+    archive_transactions,
+    create_transaction,
+    delete_transaction,
+    update_transaction,
+)
+from apps.transactions.stats import get_ledger_stats, reconcile_ledger_stats
+from apps.transactions.tests.factories import TransactionFactory
+from apps.users.tests.factories import UserFactory
+
+
+class LedgerStatsTestMixin:
+    def setUp(self):
+        cache.clear()
+        registry.clear_reference_ids()
+        self.user = UserFactory()
+        self.status = StatusFactory()
+        self.income = TransactionTypeFactory(name=TransactionTypeEnum.INCOME.value)
+        self.expense = TransactionTypeFactory(name=TransactionTypeEnum.EXPENSE.value)
+        self.income_category = CategoryFactory(
+            name='Ledger income', transaction_type=self.income
+        )
+        self.expense_category = CategoryFactory(
+            name='Ledger expense', transaction_type=self.expense
+        )
+
+    def tearDown(self):
+        registry.clear_reference_ids()
+
+    def create(self, amount, income=True):
+        return create_transaction(
+            {
+                'status': self.status,
+                'transaction_type': self.income if income else self.expense,
+                'category': self.income_category if income else self.expense_category,
+                'amount': Decimal(amount),
+            },
+            self.user,
+        )
+
+    def assertStats(self, count, income, expense, first=None, last=None):
+        stats = get_ledger_stats(self.user)
+        self.assertEqual(
+            (stats.transaction_count, stats.income_total, stats.expense_total),
+            (count, Decimal(income), Decimal(expense)),
+        )
+        self.assertEqual((stats.first_created_at, stats.last_created_at), (first, last))
+
+
+class LedgerStatsTests(LedgerStatsTestMixin, TestCase):
+    """Test cases for the per-user counter cache of transactions."""
+
+    def test_empty(self):
+        """Test that users without transactions have empty stats."""
+        self.assertStats(0, 0, 0)
+        self.assertFalse(UserLedgerStats.objects.exists())
+
+    def test_create_update_delete(self):
+        """Test that the services keep the stats up to date."""
+        first = self.create('100.50')
+        last = self.create('40', income=False)
+        self.assertStats(2, '100.50', '40', first.created_at, last.created_at)
+
+        update_transaction(
+            first.pk,
+            {'transaction_type': self.expense, 'category': self.expense_category},
+            self.user,
+        )
+        self.assertStats(2, 0, '140.50', first.created_at, last.created_at)
+
+        update_transaction(last.pk, {'amount': Decimal('10')}, self.user)
+        self.assertStats(2, 0, '110.50', first.created_at, last.created_at)
+
+        delete_transaction(last.pk, self.user)
+        self.assertStats(1, 0, '100.50', first.created_at, first.created_at)
+
+        delete_transaction(first.pk, self.user)
+        self.assertStats(0, 0, 0)
+
+    def test_delete_keeps_bounds_of_archive(self):
+        """Test that deleting the last hot transaction keeps archived ones."""
+        archived = self.create('5')
+        Transaction.objects.filter(pk=archived.pk).update(
+            created_at=archived.created_at - timedelta(days=400)
+        )
+        reconcile_ledger_stats([self.user.pk])
+        list(archive_transactions(timezone.now() - timedelta(days=365), 10))
+        transaction = self.create('7')
+
+        delete_transaction(transaction.pk, self.user)
+
+        archived_at = archived.created_at - timedelta(days=400)
+        self.assertStats(1, '5', 0, archived_at, archived_at)
+
+    def test_reconcile(self):
+        """Test that reconciling fixes stats that drifted."""
+        transaction = self.create('20')
+        drifted = TransactionFactory(
+            user=self.user,
+            status=self.status,
+            transaction_type=self.expense,
+            category=self.expense_category,
+            subcategory=None,
+            amount=Decimal('3'),
+        )
+        other_user = UserFactory()
+
+        self.assertEqual(
+            reconcile_ledger_stats([self.user.pk, other_user.pk]), [self.user.pk]
+        )
+        self.assertStats(2, '20', '3', transaction.created_at, drifted.created_at)
+        self.assertFalse(UserLedgerStats.objects.filter(user=other_user).exists())
+
+        self.assertEqual(reconcile_ledger_stats([self.user.pk]), [])
+
+
+class LedgerStatsConcurrencyTests(LedgerStatsTestMixin, TransactionTestCase):
+    """Test cases for the stats of transactions changed concurrently."""
+
+    def run_concurrently(self, change):
+        """
+        Run a change in another thread while the transaction of the caller
+        is open, and wait for it after the caller commits.
+        """
+        errors = []
+
+        def run():
+            try:
+                change()
+            except Exception as error:
+                errors.append(error)
+            finally:
+                connections.close_all()
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        # Let the thread wait for the row locked by the caller
+        time.sleep(0.2)
+        return thread, errors
+
+    def test_concurrent_updates(self):
+        """Test that concurrent updates apply their deltas one after another."""
+        transaction = self.create('100', income=False)
+
+        with db_transaction.atomic():
+            update_transaction(transaction.pk, {'amount': Decimal('40')}, self.user)
+            thread, errors = self.run_concurrently(
+                lambda: update_transaction(
+                    transaction.pk, {'amount': Decimal('70')}, self.user
+                )
+            )
+        thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertStats(1, 0, '70', transaction.created_at, transaction.created_at)
+
+    def test_concurrent_deletes(self):
+        """Test that a transaction deleted twice is removed from the stats once."""
+        transaction = self.create('100')
+        self.create('5')
+
+        with db_transaction.atomic():
+            delete_transaction(transaction.pk, self.user)
+            thread, errors = self.run_concurrently(
+                lambda: delete_transaction(transaction.pk, self.user)
+            )
+        thread.join()
+
+        self.assertEqual([type(error) for error in errors], [NotFound])
+        self.assertEqual(get_ledger_stats(self.user).transaction_count, 1)
+        self.assertEqual(get_ledger_stats(self.user).income_total, Decimal('5'))
@@ -1,14 +1,22 @@
+from datetime import timedelta
+
+import msgpack
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 
+from apps.reference import registry
 from apps.reference.tests.factories import (
     CategoryFactory,
     StatusFactory,
     SubcategoryFactory,
     TransactionTypeFactory,
 )
-from apps.transactions.models import Transaction
+from apps.transactions.models import Transaction, TransactionArchive
+from apps.transactions.services import TransactionArchived, archive_transactions
 from apps.transactions.tests.factories import TransactionFactory
 from apps.users.tests.factories import UserFactory
 
@@ -56,6 +64,116 @@ class TransactionViewsTestCase(APITestCase):
         self.assertEqual(response.data['amount'], '123.45')
         self.assertEqual(response.data['comment'], 'Test transaction')
 
+    def test_list_transactions_msgpack(self):
+        """Test retrieving a list of transactions as MessagePack."""
+        response = self.client.get(self.list_url, HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        data = msgpack.unpackb(response.content)
+        self.assertTrue(any(tx['id'] == self.transaction.id for tx in data))
+
+    def test_list_transactions_compact(self):
+        """Test retrieving transactions as arrays with a single reference map."""
+        registry.clear_reference_ids()
+        self.addCleanup(registry.clear_reference_ids)
+        registry.get_reference_names()
+        expected = self.client.get(self.list_url).data
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.list_url, {'format': 'compact'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('JOIN', queries[0]['sql'])
+
+        data = response.json()
+        rows = [dict(zip(data['fields'], row, strict=True)) for row in data['results']]
+        self.assertEqual(
+            rows,
+            [
+                {key: value for key, value in tx.items() if not key.endswith('_name')}
+                for tx in expected
+            ],
+        )
+        self.assertEqual(
+            data['reference'],
+            {
+                'statuses': {str(self.status.id): self.status.name},
+                'transaction_types': {
+                    str(self.transaction_type.id): self.transaction_type.name
+                },
+                'categories': {str(self.category.id): self.category.name},
+                'subcategories': {str(self.subcategory.id): self.subcategory.name},
+            },
+        )
+
+    def test_list_transactions_sparse_fields(self):
+        """Test that only the requested fields are read and returned."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.list_url, {'fields': 'amount,id'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.transaction.refresh_from_db()
+        self.assertEqual(
+            response.data,
+            [{'id': self.transaction.id, 'amount': f'{self.transaction.amount:.2f}'}],
+        )
+        sql = queries[-1]['sql']
+        self.assertNotIn('JOIN', sql)
+        self.assertNotIn('comment', sql)
+
+        response = self.client.get(self.list_url, {'fields': 'id,category_name'})
+        self.assertEqual(
+            response.data,
+            [{'id': self.transaction.id, 'category_name': self.category.name}],
+        )
+
+    def test_sparse_fields_unknown(self):
+        """Test that unknown fields are rejected."""
+        response = self.client.get(self.list_url, {'fields': 'id,user_email'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('fields', response.data['errors'])
+
+        response = self.client.get(
+            self.detail_url(self.transaction.id), {'fields': ','}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_transaction_detail_sparse_fields(self):
+        """Test retrieving selected fields of a transaction."""
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.detail_url(self.transaction.id),
+                {'fields': 'id,user_email,status_name'},
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            {
+                'id': self.transaction.id,
+                'user_email': self.user.email,
+                'status_name': self.status.name,
+            },
+        )
+
+    def test_create_transaction_msgpack(self):
+        """Test creating a new transaction from a MessagePack body."""
+        data = {
+            'status_id': self.status.id,
+            'transaction_type_id': self.transaction_type.id,
+            'category_id': self.category.id,
+            'subcategory_id': self.subcategory.id,
+            'amount': '123.45',
+        }
+        response = self.client.post(
+            self.list_url,
+            msgpack.packb(data),
+            content_type='application/msgpack',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['amount'], '123.45')
+
     def test_create_transaction_invalid(self):
         """Test creating a transaction with invalid data fails."""
         transaction_type = TransactionTypeFactory(name='EXPENSE')
@@ -118,6 +236,33 @@ class TransactionViewsTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Transaction.objects.filter(id=self.transaction.id).exists())
 
+    def test_archived_transaction_detail(self):
+        """Test that archived transactions can be read but not changed."""
+        transaction = TransactionFactory(user=self.user)
+        Transaction.objects.filter(pk=transaction.pk).update(
+            created_at=timezone.now() - timedelta(days=400)
+        )
+        list(archive_transactions(timezone.now() - timedelta(days=365), 10))
+        url = self.detail_url(transaction.id)
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], transaction.id)
+
+        archived = {
+            'message': 'Transaction archived',
+            'error': TransactionArchived.default_detail,
+        }
+
+        response = self.client.patch(url, {'comment': 'Updated'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+        self.assertEqual(response.data, archived)
+
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+        self.assertEqual(response.data, archived)
+        self.assertTrue(TransactionArchive.objects.filter(id=transaction.id).exists())
+
     def test_permission_denied_for_other_user(self):
         """Test that users cannot access transactions that belong to other users."""
         other_user = UserFactory()
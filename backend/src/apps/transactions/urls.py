@@ -1,6 +1,13 @@
 from django.urls import path
 
-from apps.transactions.views import TransactionDetailView, TransactionListCreateView
+from apps.transactions.views import (
+    TransactionBalanceView,
+    TransactionDetailView,
+    TransactionIngestTicketView,
+    TransactionIngestView,
+    TransactionListCreateView,
+    TransactionTimeseriesView,
+)
 
 urlpatterns = [
     path(
@@ -8,6 +15,26 @@ urlpatterns = [
         TransactionListCreateView.as_view(),
         name='transaction-list-create',
     ),
+    path(
+        'transactions/balance/',
+        TransactionBalanceView.as_view(),
+        name='transaction-balance',
+    ),
+    path(
+        'transactions/timeseries/',
+        TransactionTimeseriesView.as_view(),
+        name='transaction-timeseries',
+    ),
+    path(
+        'transactions/ingest/',
+        TransactionIngestView.as_view(),
+        name='transaction-ingest',
+    ),
+    path(
+        'transactions/ingest/<str:ticket>/',
+        TransactionIngestTicketView.as_view(),
+        name='transaction-ingest-ticket',
+    ),
     path(
         'transactions/<int:id>/',
         TransactionDetailView.as_view(),
@@ -1,19 +1,43 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils import timezone
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.core.db.prepared import prepare_statements
+from apps.core.db.routers import read_from_replica
+from apps.core.parsers import MessagePackParser
+from apps.core.renderers import CompactJSONRenderer, MessagePackRenderer
+from apps.core.throttling import BulkThrottle, TransactionCreateThrottle
+from apps.transactions.filters import parse_filters
+from apps.transactions.ingest import enqueue_transactions, get_ticket
+from apps.transactions.models import TransactionArchive
+from apps.transactions.reports import (
+    RESOLUTIONS,
+    TIMESERIES_GROUPS,
+    compute_timeseries,
+    get_balance,
+    get_timezone,
+)
 from apps.transactions.serializers import (
+    TransactionBalanceSerializer,
+    TransactionCompactListSerializer,
     TransactionCreateSerializer,
     TransactionDetailSerializer,
+    TransactionIngestSerializer,
+    TransactionIngestTicketSerializer,
     TransactionListSerializer,
+    TransactionTimeseriesSerializer,
     TransactionUpdateSerializer,
 )
 from apps.transactions.services import (
+    TransactionArchived,
     create_transaction,
     delete_transaction,
     get_transaction_by_id,
@@ -21,13 +45,115 @@ from apps.transactions.services import (
     update_transaction,
 )
 
+FILTER_PARAMETERS = [
+    openapi.Parameter(
+        'created_at__gte',
+        openapi.IN_QUERY,
+        description='Filter by created at or after, a date includes the whole day',
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        'created_at__lte',
+        openapi.IN_QUERY,
+        description='Filter by created at or before, a date includes the whole day',
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        'status',
+        openapi.IN_QUERY,
+        description='Filter by status ID, comma-separated IDs match any',
+        type=openapi.TYPE_INTEGER,
+    ),
+    openapi.Parameter(
+        'transaction_type',
+        openapi.IN_QUERY,
+        description='Filter by transaction type ID, comma-separated IDs match any',
+        type=openapi.TYPE_INTEGER,
+    ),
+    openapi.Parameter(
+        'category',
+        openapi.IN_QUERY,
+        description='Filter by category ID, comma-separated IDs match any',
+        type=openapi.TYPE_INTEGER,
+    ),
+    openapi.Parameter(
+        'subcategory',
+        openapi.IN_QUERY,
+        description='Filter by subcategory ID, comma-separated IDs match any',
+        type=openapi.TYPE_INTEGER,
+    ),
+    openapi.Parameter(
+        'amount__gte',
+        openapi.IN_QUERY,
+        description='Filter by amount greater than or equal to',
+        type=openapi.TYPE_NUMBER,
+    ),
+    openapi.Parameter(
+        'amount__lte',
+        openapi.IN_QUERY,
+        description='Filter by amount less than or equal to',
+        type=openapi.TYPE_NUMBER,
+    ),
+    openapi.Parameter(
+        'amount__exact',
+        openapi.IN_QUERY,
+        description='Filter by amount equal to',
+        type=openapi.TYPE_NUMBER,
+    ),
+]
+
+
+FIELDS_PARAMETER = openapi.Parameter(
+    'fields',
+    openapi.IN_QUERY,
+    description='Comma-separated fields to return, e.g. id,created_at,amount',
+    type=openapi.TYPE_STRING,
+)
+
+
+def get_sparse_fields(request, serializer_class):
+    """
+    Get the fields requested with ?fields= and the model fields they read.
+
+    Returns:
+        tuple: The field names and the model field paths to load, both None
+            if all fields are requested.
+
+    Raises:
+        ValidationError: If an unknown field is requested.
+    """
+    if 'fields' not in request.query_params:
+        return None, None
+    fields = serializer_class.parse_fields(request.query_params['fields'])
+    return fields, serializer_class(fields=fields).get_model_fields()
+
+
+def get_filters(request, tz=None):
+    """
+    Parse the transaction filters of the query parameters.
+
+    Raises:
+        ValidationError: If a filter is not supported or invalid.
+    """
+    return parse_filters(request.query_params, tz=tz)
+
 
 class TransactionListCreateView(APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
+    # Bulk-oriented clients may exchange MessagePack instead of JSON
+    renderer_classes = [
+        *api_settings.DEFAULT_RENDERER_CLASSES,
+        MessagePackRenderer,
+        CompactJSONRenderer,
+    ]
+    parser_classes = [*api_settings.DEFAULT_PARSER_CLASSES, MessagePackParser]
+    # Only creation is throttled
+    throttle_classes = [TransactionCreateThrottle]
 
     # Get
     list_serializer_class = TransactionListSerializer
+    compact_list_serializer_class = TransactionCompactListSerializer
 
     # Post
     create_in_serializer_class = TransactionCreateSerializer
@@ -36,59 +162,24 @@ class TransactionListCreateView(APIView):
     @swagger_auto_schema(
         operation_summary='List user transactions',
         operation_description='Returns a list of all transactions '
-        'for the authenticated user.',
+        'for the authenticated user. Send `Accept: application/msgpack` '
+        'to receive MessagePack instead of JSON.\n\n'
+        'With `?format=compact` the response is an object of the row `fields`, '
+        'the `results` as arrays of values in the order of `fields` and a '
+        '`reference` object mapping the referenced status, transaction type, '
+        'category and subcategory IDs to their names; `fields` does not apply '
+        'to it.',
         security=[{'Bearer': []}],
         manual_parameters=[
+            *FILTER_PARAMETERS,
             openapi.Parameter(
-                'created_at__gte',
-                openapi.IN_QUERY,
-                description='Filter by created date greater than or equal to',
-                type=openapi.TYPE_STRING,
-                format=openapi.FORMAT_DATE,
-            ),
-            openapi.Parameter(
-                'created_at__lte',
+                'format',
                 openapi.IN_QUERY,
-                description='Filter by created date less than or equal to',
+                description='Return rows as arrays with a single reference map',
                 type=openapi.TYPE_STRING,
-                format=openapi.FORMAT_DATE,
-            ),
-            openapi.Parameter(
-                'status',
-                openapi.IN_QUERY,
-                description='Filter by status ID',
-                type=openapi.TYPE_INTEGER,
-            ),
-            openapi.Parameter(
-                'transaction_type',
-                openapi.IN_QUERY,
-                description='Filter by transaction type ID',
-                type=openapi.TYPE_INTEGER,
-            ),
-            openapi.Parameter(
-                'category',
-                openapi.IN_QUERY,
-                description='Filter by category ID',
-                type=openapi.TYPE_INTEGER,
-            ),
-            openapi.Parameter(
-                'subcategory',
-                openapi.IN_QUERY,
-                description='Filter by subcategory ID',
-                type=openapi.TYPE_INTEGER,
-            ),
-            openapi.Parameter(
-                'amount__gte',
-                openapi.IN_QUERY,
-                description='Filter by amount greater than or equal to',
-                type=openapi.TYPE_NUMBER,
-            ),
-            openapi.Parameter(
-                'amount__lte',
-                openapi.IN_QUERY,
-                description='Filter by amount less than or equal to',
-                type=openapi.TYPE_NUMBER,
+                enum=['compact'],
             ),
+            FIELDS_PARAMETER,
             openapi.Parameter(
                 'ordering',
                 openapi.IN_QUERY,
@@ -99,25 +190,21 @@ class TransactionListCreateView(APIView):
         ],
         responses={
             200: list_serializer_class(many=True),
+            400: 'Invalid filters or unknown fields requested',
             401: 'Authentication credentials were not provided.',
         },
     )
+    @read_from_replica
+    @prepare_statements
     def get(self, request):
-        filters = {}
-        for param in [
-            'created_at__gte',
-            'created_at__lte',
-            'created_at__exact',
-            'status',
-            'transaction_type',
-            'category',
-            'subcategory',
-            'amount__gte',
-            'amount__lte',
-            'amount__exact',
-        ]:
-            if param in request.query_params:
-                filters[param] = request.query_params.get(param)
+        try:
+            filters = get_filters(request)
+            fields, only = get_sparse_fields(request, self.list_serializer_class)
+        except ValidationError as error:
+            return Response(
+                {'message': 'Validation failed', 'errors': error.detail},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         ordering = None
         if 'ordering' in request.query_params:
@@ -128,24 +215,37 @@ class TransactionListCreateView(APIView):
         else:
             ordering = ['-created_at']
 
+        if request.accepted_renderer.format == CompactJSONRenderer.format:
+            # Names come from the cached reference maps instead of joins
+            rows = get_user_transactions(
+                user=request.user,
+                filters=filters,
+                ordering=ordering,
+                values=self.compact_list_serializer_class.row_fields,
+            )
+            return Response(self.compact_list_serializer_class(rows).data)
+
         transactions = get_user_transactions(
-            user=request.user, filters=filters, ordering=ordering
+            user=request.user, filters=filters, ordering=ordering, only=only
         )
 
-        serializer = self.list_serializer_class(transactions, many=True)
+        serializer = self.list_serializer_class(transactions, many=True, fields=fields)
         return Response(serializer.data)
 
     @swagger_auto_schema(
         operation_summary='Create a transaction',
-        operation_description='Creates a new transaction for the authenticated user.',
+        operation_description='Creates a new transaction for the authenticated user. '
+        'The body may also be sent as `application/msgpack`.',
         security=[{'Bearer': []}],
         request_body=create_in_serializer_class,
         responses={
             201: create_out_serializer_class,
             400: 'Invalid data provided',
             401: 'Authentication credentials were not provided.',
+            429: 'Too many transactions created, retry after Retry-After seconds.',
         },
     )
+    @prepare_statements
     def post(self, request):
         serializer = self.create_in_serializer_class(
             data=request.data, context={'request': request}
@@ -182,18 +282,31 @@ class TransactionDetailView(APIView):
     @swagger_auto_schema(
         operation_summary='Get transaction details',
         operation_description='Returns detailed information about '
-        'a specific transaction.',
+        'a specific transaction, archived transactions included.',
         security=[{'Bearer': []}],
+        manual_parameters=[FIELDS_PARAMETER],
         responses={
             200: out_serializer_class,
+            400: 'Unknown fields requested',
             401: 'Authentication credentials were not provided.',
             403: "You don't have permission to access this transaction.",
             404: 'Transaction not found.',
         },
     )
+    @prepare_statements
     def get(self, request, id):
         try:
-            transaction = get_transaction_by_id(transaction_id=id, user=request.user)
+            fields, only = get_sparse_fields(request, self.out_serializer_class)
+        except ValidationError as error:
+            return Response(
+                {'message': 'Validation failed', 'errors': error.detail},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            transaction = get_transaction_by_id(
+                transaction_id=id, user=request.user, only=only
+            )
         except (NotFound, PermissionDenied) as error:
             if isinstance(error, NotFound):
                 return Response(
@@ -205,9 +318,9 @@ class TransactionDetailView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        transaction = get_transaction_by_id(transaction_id=id, user=request.user)
         return Response(
-            self.out_serializer_class(transaction).data, status=status.HTTP_200_OK
+            self.out_serializer_class(transaction, fields=fields).data,
+            status=status.HTTP_200_OK,
         )
 
     @swagger_auto_schema(
@@ -221,30 +334,44 @@ class TransactionDetailView(APIView):
             401: 'Authentication credentials were not provided.',
             403: "You don't have permission to modify this transaction.",
             404: 'Transaction not found.',
+            410: 'The transaction is archived and can no longer be changed.',
         },
     )
+    @prepare_statements
     def patch(self, request, id):
-        transaction = get_transaction_by_id(transaction_id=id, user=request.user)
-        serializer = self.in_serializer_class(
-            transaction, data=request.data, partial=True
-        )
-
-        if not serializer.is_valid():
-            return Response(
-                {'message': 'Validation failed', 'errors': serializer.errors},
-                status=status.HTTP_400_BAD_REQUEST,
+        try:
+            transaction = get_transaction_by_id(transaction_id=id, user=request.user)
+            if isinstance(transaction, TransactionArchive):
+                raise TransactionArchived
+            serializer = self.in_serializer_class(
+                transaction, data=request.data, partial=True
             )
 
-        try:
+            if not serializer.is_valid():
+                return Response(
+                    {'message': 'Validation failed', 'errors': serializer.errors},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
             updated_transaction = update_transaction(
                 transaction_id=id, data=serializer.validated_data, user=request.user
             )
-        except (NotFound, PermissionDenied, ValidationError) as error:
+        except (
+            NotFound,
+            PermissionDenied,
+            TransactionArchived,
+            ValidationError,
+        ) as error:
             if isinstance(error, NotFound):
                 return Response(
                     {'message': 'Transaction not found', 'errors': error.detail},
                     status=status.HTTP_404_NOT_FOUND,
                 )
+            elif isinstance(error, TransactionArchived):
+                return Response(
+                    {'message': 'Transaction archived', 'error': error.detail},
+                    status=status.HTTP_410_GONE,
+                )
             elif isinstance(error, PermissionDenied):
                 return Response(
                     {'message': 'Permission denied', 'errors': error.detail},
@@ -269,20 +396,291 @@ class TransactionDetailView(APIView):
             401: 'Authentication credentials were not provided.',
             403: "You don't have permission to delete this transaction.",
             404: 'Transaction not found.',
+            410: 'The transaction is archived and can no longer be changed.',
         },
     )
+    @prepare_statements
     def delete(self, request, id):
         try:
             delete_transaction(transaction_id=id, user=request.user)
-        except (NotFound, PermissionDenied) as error:
+        except (NotFound, PermissionDenied, TransactionArchived) as error:
             if isinstance(error, NotFound):
                 return Response(
                     {'message': 'Not found', 'error': error.detail},
                     status=status.HTTP_404_NOT_FOUND,
                 )
+            if isinstance(error, TransactionArchived):
+                return Response(
+                    {'message': 'Transaction archived', 'error': error.detail},
+                    status=status.HTTP_410_GONE,
+                )
             return Response(
                 {'message': 'Permission denied', 'error': error.detail},
                 status=status.HTTP_403_FORBIDDEN,
             )
 
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class TransactionBalanceView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    out_serializer_class = TransactionBalanceSerializer
+
+    @swagger_auto_schema(
+        operation_summary='Get the running balance',
+        operation_description='Returns the balance of the authenticated user '
+        'at the end of every day, week or month with transactions. Income '
+        'increases the balance, expense decreases it.',
+        security=[{'Bearer': []}],
+        manual_parameters=[
+            openapi.Parameter(
+                'resolution',
+                openapi.IN_QUERY,
+                description='Length of the buckets',
+                type=openapi.TYPE_STRING,
+                enum=list(RESOLUTIONS),
+                default='day',
+            ),
+            openapi.Parameter(
+                'tz',
+                openapi.IN_QUERY,
+                description='IANA time zone the buckets start in, '
+                'defaults to the server time zone',
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                'created_at__gte',
+                openapi.IN_QUERY,
+                description='Only return buckets starting on or after this date',
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATE,
+            ),
+            openapi.Parameter(
+                'created_at__lte',
+                openapi.IN_QUERY,
+                description='Only return buckets starting on or before this date',
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATE,
+            ),
+        ],
+        responses={
+            200: openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    'resolution': openapi.Schema(type=openapi.TYPE_STRING),
+                    'tz': openapi.Schema(type=openapi.TYPE_STRING),
+                    'results': openapi.Schema(
+                        type=openapi.TYPE_ARRAY,
+                        items=openapi.Schema(
+                            type=openapi.TYPE_OBJECT,
+                            properties={
+                                'bucket': openapi.Schema(
+                                    type=openapi.TYPE_STRING,
+                                    format=openapi.FORMAT_DATE,
+                                ),
+                                'change': openapi.Schema(
+                                    type=openapi.TYPE_STRING,
+                                    format=openapi.FORMAT_DECIMAL,
+                                ),
+                                'balance': openapi.Schema(
+                                    type=openapi.TYPE_STRING,
+                                    format=openapi.FORMAT_DECIMAL,
+                                ),
+                            },
+                        ),
+                    ),
+                },
+            ),
+            400: 'Invalid query parameters',
+            401: 'Authentication credentials were not provided.',
+        },
+    )
+    @read_from_replica
+    def get(self, request):
+        resolution = request.query_params.get('resolution', 'day')
+        try:
+            tz = get_timezone(request.query_params.get('tz'))
+            filters = parse_filters(
+                {
+                    param: request.query_params[param]
+                    for param in ['created_at__gte', 'created_at__lte']
+                    if request.query_params.get(param)
+                },
+                tz=tz,
+            )
+            buckets = get_balance(request.user, resolution=resolution, tz=tz)
+        except (ValidationError, ValueError) as error:
+            return Response(
+                {
+                    'message': 'Validation failed',
+                    'errors': getattr(error, 'detail', str(error)),
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        results = [
+            {'bucket': bucket.date(), 'change': change, 'balance': balance}
+            for bucket, change, balance in buckets
+            if filters.includes(timezone.make_aware(bucket, tz))
+        ]
+        return Response(
+            {
+                'resolution': resolution,
+                'tz': tz.key,
+                'results': self.out_serializer_class(results, many=True).data,
+            }
+        )
+
+
+class TransactionTimeseriesView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    out_serializer_class = TransactionTimeseriesSerializer
+
+    @swagger_auto_schema(
+        operation_summary='Get transaction sums over time',
+        operation_description='Returns the sums of the amounts of the '
+        'authenticated user per day, week or month and per group as parallel '
+        'arrays: `buckets` holds the start dates and every series holds its '
+        'sums in the same order. Buckets without transactions are included '
+        'with zero sums. Accepts the filters of the transaction list.',
+        security=[{'Bearer': []}],
+        manual_parameters=[
+            openapi.Parameter(
+                'bucket',
+                openapi.IN_QUERY,
+                description='Length of the buckets',
+                type=openapi.TYPE_STRING,
+                enum=list(RESOLUTIONS),
+                default='day',
+            ),
+            openapi.Parameter(
+                'group_by',
+                openapi.IN_QUERY,
+                description='Field every series is a value of',
+                type=openapi.TYPE_STRING,
+                enum=list(TIMESERIES_GROUPS),
+                default='transaction_type',
+            ),
+            openapi.Parameter(
+                'tz',
+                openapi.IN_QUERY,
+                description='IANA time zone the buckets start in, '
+                'defaults to the server time zone',
+                type=openapi.TYPE_STRING,
+            ),
+            *FILTER_PARAMETERS,
+        ],
+        responses={
+            200: out_serializer_class,
+            400: 'Invalid query parameters',
+            401: 'Authentication credentials were not provided.',
+        },
+    )
+    @read_from_replica
+    def get(self, request):
+        resolution = request.query_params.get('bucket', 'day')
+        group_by = request.query_params.get('group_by', 'transaction_type')
+        try:
+            tz = get_timezone(request.query_params.get('tz'))
+            timeseries = compute_timeseries(
+                request.user,
+                resolution=resolution,
+                tz=tz,
+                group_by=group_by,
+                filters=get_filters(request, tz=tz),
+            )
+        except (ValidationError, DjangoValidationError, ValueError) as error:
+            return Response(
+                {
+                    'message': 'Validation failed',
+                    'errors': getattr(error, 'detail', None)
+                    or getattr(error, 'messages', str(error)),
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            self.out_serializer_class(
+                {
+                    'resolution': resolution,
+                    'tz': tz.key,
+                    'group_by': group_by,
+                    **timeseries,
+                }
+            ).data
+        )
+
+
+class TransactionIngestView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, MessagePackRenderer]
+    parser_classes = [*api_settings.DEFAULT_PARSER_CLASSES, MessagePackParser]
+    throttle_classes = [BulkThrottle]
+
+    in_serializer_class = TransactionIngestSerializer
+    out_serializer_class = TransactionIngestTicketSerializer
+
+    @swagger_auto_schema(
+        operation_summary='Ingest transactions',
+        operation_description='Validates a batch of transactions and queues it '
+        'to be created shortly after, in bulk with batches of other clients. '
+        'Returns a ticket to poll the status of the batch with. Meant for '
+        'clients creating many transactions per second; the body may also be '
+        'sent as `application/msgpack`.',
+        security=[{'Bearer': []}],
+        request_body=in_serializer_class,
+        responses={
+            202: out_serializer_class,
+            400: 'Invalid data provided',
+            401: 'Authentication credentials were not provided.',
+            429: 'Too many batches sent, retry after Retry-After seconds.',
+        },
+    )
+    def post(self, request):
+        serializer = self.in_serializer_class(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {'message': 'Validation failed', 'errors': serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        rows = serializer.validated_data['transactions']
+        ticket = enqueue_transactions(rows, user=request.user)
+        return Response(
+            self.out_serializer_class(
+                {'ticket': ticket, **get_ticket(ticket, request.user)}
+            ).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class TransactionIngestTicketView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    out_serializer_class = TransactionIngestTicketSerializer
+
+    @swagger_auto_schema(
+        operation_summary='Get the status of an ingest ticket',
+        operation_description='Returns whether the transactions of an ingested '
+        'batch are still queued, committed or failed.',
+        security=[{'Bearer': []}],
+        responses={
+            200: out_serializer_class,
+            401: 'Authentication credentials were not provided.',
+            404: 'Ticket not found.',
+        },
+    )
+    def get(self, request, ticket):
+        data = get_ticket(ticket, request.user)
+        if data is None:
+            return Response(
+                {'message': 'Not found', 'error': 'Ticket not found.'},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(self.out_serializer_class({'ticket': ticket, **data}).data)
@@ -0,0 +1,16 @@
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from apps.jobs.registry import job
+
+
+@job('users.prune_tokens', concurrency=1)
+def prune_tokens(job):
+    """
+    Delete expired refresh tokens along with their blacklist entries.
+
+    Returns:
+        dict: The number of deleted tokens.
+    """
+    count, _ = OutstandingToken.objects.filter(expires_at__lte=timezone.now()).delete()
+    return {'deleted': count}
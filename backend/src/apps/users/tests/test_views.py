@@ -1,3 +1,6 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase, APITransactionTestCase
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -190,6 +193,20 @@ class UserDetailViewTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    @override_settings(REPLICA_DATABASE_ALIAS='replica')
+    def test_get_user_details_reads_from_primary(self):
+        """Test that the user is loaded from the primary with a replica configured."""
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.detail_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(
+            any('"users_user"' in query['sql'] for query in queries.captured_queries)
+        )
+
 
 class UserViewsIntegrationTests(APITransactionTestCase):
     """Integration tests for user views working together."""
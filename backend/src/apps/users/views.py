@@ -9,6 +9,7 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import TokenError
 
+from apps.core.throttling import LoginThrottle, RegisterThrottle
 from apps.users.serializers import (
     UserDetailSerializer,
     UserLoginSerializer,
@@ -20,6 +21,7 @@ from apps.users.services import login, logout, register
 
 class UserRegisterView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [RegisterThrottle]
     serializer_class = UserRegisterSerializer
 
     @swagger_auto_schema(
@@ -55,6 +57,7 @@ class UserRegisterView(APIView):
                     },
                 ),
             ),
+            429: 'Too many attempts, retry after Retry-After seconds.',
         },
     )
     def post(self, request: Request):
@@ -78,6 +81,8 @@ class UserRegisterView(APIView):
 
 class UserLoginView(APIView):
     permission_classes = [AllowAny]
+    # Every attempt hashes the password, bursts would saturate the workers
+    throttle_classes = [LoginThrottle]
     serializer_class = UserLoginSerializer
 
     @swagger_auto_schema(
@@ -136,6 +141,7 @@ class UserLoginView(APIView):
                     },
                 ),
             ),
+            429: 'Too many attempts, retry after Retry-After seconds.',
         },
     )
     def post(self, request: Request):
@@ -0,0 +1,32 @@
+"""
+Gunicorn configuration for money-flow project.
+
+Used with --preload: the application is loaded once in the master process and
+inherited by the forked workers. Settings are passed on the command line,
+this module only defines the server hooks.
+"""
+
+
+def when_ready(server):
+    # Build the URL lookups once in the master, so every forked worker inherits
+    # them, and close connections opened while preloading: a connection must not
+    # be shared by several processes.
+    from django.db import connections
+
+    from apps.core.services.warmup import resolve_url_patterns
+
+    resolve_url_patterns()
+    connections.close_all()
+
+
+def post_worker_init(worker):
+    from apps.core.services.warmup import warm_up
+
+    try:
+        timings = warm_up()
+    except Exception:
+        # A cold worker is still able to serve requests
+        worker.log.exception('Worker warm-up failed')
+        return
+
+    worker.log.info('Worker warmed up in %.1f ms: %s', timings['total'], timings)
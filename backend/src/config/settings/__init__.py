@@ -1,6 +1,13 @@
 from config.settings.auth import *
 from config.settings.base import *
+from config.settings.cache import *
+from config.settings.compression import *
 from config.settings.database import *
 from config.settings.docs import *
+from config.settings.jobs import *
 from config.settings.logging import *
+from config.settings.profiling import *
+from config.settings.reference import *
 from config.settings.security import *
+from config.settings.throttling import *
+from config.settings.transactions import *
@@ -38,12 +38,19 @@ REST_FRAMEWORK = {
     'DATE_INPUT_FORMATS': [
         '%d.%m.%Y',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'apps.core.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 if not DEBUG:
-    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
-        'rest_framework.renderers.JSONRenderer'
-    ]
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = ['apps.core.renderers.ORJSONRenderer']
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
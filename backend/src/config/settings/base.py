@@ -23,9 +23,11 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     # Project apps
+    'apps.core',
     'apps.users',
     'apps.reference',
     'apps.transactions',
+    'apps.jobs',
     # Third-party apps
     'corsheaders',
     'drf_yasg',
@@ -35,18 +37,24 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'apps.core.middleware.metrics.WorkerMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'apps.core.middleware.compression.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apps.core.middleware.profiling.ProfilingMiddleware',
+    'apps.core.middleware.replica.PrimaryStickyMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
 
+TEST_RUNNER = 'apps.core.runner.TestRunner'
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -0,0 +1,16 @@
+"""
+Cache settings for money-flow project.
+"""
+
+import os
+
+# Use a backend shared between workers (e.g. FileBasedCache) in production,
+# so per-user state like replica stickiness is seen by every worker.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'DJANGO_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.getenv('DJANGO_CACHE_LOCATION', 'money-flow'),
+    }
+}
@@ -0,0 +1,17 @@
+"""
+Response compression settings for money-flow project.
+"""
+
+import os
+
+# Responses of these content types are compressed by CompressionMiddleware
+COMPRESSION_CONTENT_TYPES = [
+    'application/json',
+    'application/openapi+json',
+    'application/msgpack',
+]
+# Smaller responses are not worth compressing (bytes, streamed responses
+# are always compressed)
+COMPRESSION_MIN_SIZE = int(os.getenv('DJANGO_COMPRESSION_MIN_SIZE', 1024))
+COMPRESSION_GZIP_LEVEL = int(os.getenv('DJANGO_COMPRESSION_GZIP_LEVEL', 6))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv('DJANGO_COMPRESSION_BROTLI_QUALITY', 5))
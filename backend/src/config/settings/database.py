@@ -12,5 +12,48 @@ DATABASES = {
         'PASSWORD': os.getenv('POSTGRES_PASSWORD'),
         'HOST': os.getenv('DOCKER_POSTGRES_HOST'),
         'PORT': os.getenv('DOCKER_POSTGRES_PORT'),
+        # Persistent connections (seconds, 0 - close after each request)
+        'CONN_MAX_AGE': int(os.getenv('DJANGO_DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': bool(int(os.getenv('DJANGO_DB_CONN_HEALTH_CHECKS', 1))),
+        'OPTIONS': {},
     }
 }
+
+# Connection pool (psycopg3). Pooling replaces persistent connections,
+# so CONN_MAX_AGE must be 0 when it is enabled.
+if bool(int(os.getenv('DJANGO_DB_POOL', 0))):
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.getenv('DJANGO_DB_POOL_MIN_SIZE', 2)),
+        'max_size': int(os.getenv('DJANGO_DB_POOL_MAX_SIZE', 10)),
+        'timeout': float(os.getenv('DJANGO_DB_POOL_TIMEOUT', 10)),
+    }
+
+# Server-side prepared statements (psycopg3). Parameters are bound on the
+# server, queries executed prepare_threshold times on a connection are
+# prepared, and queries of views marked with `prepare_statements` right away.
+# Prepared statements belong to their connection and are kept by persistent
+# and pooled connections alike; behind PgBouncer in transaction mode they
+# need max_prepared_statements (PgBouncer 1.21+).
+if bool(int(os.getenv('DJANGO_DB_PREPARED_STATEMENTS', 0))):
+    DATABASES['default']['OPTIONS']['server_side_binding'] = True
+    DATABASES['default']['OPTIONS']['prepare_threshold'] = int(
+        os.getenv('DJANGO_DB_PREPARE_THRESHOLD', 5)
+    )
+
+# Read replica. Reads of views marked with `read_from_replica` go to this alias
+# unless the user has written within the sticky period.
+if os.getenv('DOCKER_POSTGRES_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': os.getenv('DOCKER_POSTGRES_REPLICA_HOST'),
+        'PORT': os.getenv(
+            'DOCKER_POSTGRES_REPLICA_PORT', os.getenv('DOCKER_POSTGRES_PORT')
+        ),
+        'OPTIONS': {**DATABASES['default']['OPTIONS']},
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['apps.core.db.routers.PrimaryReplicaRouter']
+REPLICA_DATABASE_ALIAS = 'replica' if 'replica' in DATABASES else None
+REPLICA_STICKY_SECONDS = int(os.getenv('DJANGO_DB_REPLICA_STICKY_SECONDS', 5))
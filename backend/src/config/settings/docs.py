@@ -2,6 +2,8 @@
 Swagger documentation settings for money-flow project.
 """
 
+import os
+
 SWAGGER_SETTINGS = {
     'USE_SESSION_AUTH': False,
     'DEFAULT_MODEL_RENDERING': 'example',
@@ -13,4 +15,14 @@ SWAGGER_SETTINGS = {
         },
     },
     'SECURITY_REQUIREMENTS': None,
+    'DEFAULT_INFO': 'config.yasg.docs_info_v1',
+    # Sets host and schemes of the schema, which is generated without a request
+    'DEFAULT_API_URL': os.getenv('DJANGO_DOCS_API_URL', 'http://api.localhost'),
 }
+
+# Schema file generated by the generate_schema command. When set, the schema is
+# served from the file, otherwise it is generated on the first request.
+DOCS_SCHEMA_FILE = os.getenv('DJANGO_DOCS_SCHEMA_FILE') or None
+
+# Serve the API documentation (Swagger UI and schema documents)
+DOCS_ENABLED = bool(int(os.getenv('DJANGO_DOCS_ENABLED', 1)))
@@ -0,0 +1,15 @@
+"""
+Background jobs settings for money-flow project.
+"""
+
+import os
+
+# Number of job processes started by run_workers
+JOBS_CONCURRENCY = int(os.getenv('DJANGO_JOBS_CONCURRENCY', 2))
+# Seconds between polls of the queue when it is empty
+JOBS_POLL_INTERVAL = float(os.getenv('DJANGO_JOBS_POLL_INTERVAL', 1))
+JOBS_MAX_ATTEMPTS = int(os.getenv('DJANGO_JOBS_MAX_ATTEMPTS', 3))
+# Seconds before the first retry of a failed job, doubled on every attempt
+JOBS_RETRY_DELAY = int(os.getenv('DJANGO_JOBS_RETRY_DELAY', 30))
+# Running jobs not finished after this many seconds are considered lost
+JOBS_LEASE_TIMEOUT = int(os.getenv('DJANGO_JOBS_LEASE_TIMEOUT', 3600))
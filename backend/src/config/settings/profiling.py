@@ -0,0 +1,15 @@
+"""
+Request profiling settings for money-flow project.
+"""
+
+import os
+
+from config.settings.base import BASE_DIR
+
+# Profiles written by ProfilingMiddleware, one file per profiled request
+PROFILING_DIR = os.getenv('DJANGO_PROFILING_DIR', os.path.join(BASE_DIR, 'profiles'))
+# Share of all requests profiled with PROFILING_SAMPLE_MODE, e.g. 0.001
+PROFILING_SAMPLE_RATE = float(os.getenv('DJANGO_PROFILING_SAMPLE_RATE', 0))
+PROFILING_SAMPLE_MODE = os.getenv('DJANGO_PROFILING_SAMPLE_MODE', 'cprofile')
+# Frames kept per allocation by the tracemalloc mode
+PROFILING_TRACEMALLOC_FRAMES = int(os.getenv('DJANGO_PROFILING_TRACEMALLOC_FRAMES', 10))
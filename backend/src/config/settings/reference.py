@@ -0,0 +1,8 @@
+"""
+Reference data settings for money-flow project.
+"""
+
+import os
+
+# Cache-Control max-age of the bundled reference data (seconds)
+REFERENCE_BUNDLE_MAX_AGE = int(os.getenv('DJANGO_REFERENCE_BUNDLE_MAX_AGE', 3600))
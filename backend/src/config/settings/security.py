@@ -12,4 +12,5 @@ FRONTEND_URL = f'http://{os.getenv("FRONTEND_BASE")}'
 
 CSRF_TRUSTED_ORIGINS = [FRONTEND_URL]
 CORS_ALLOWED_ORIGINS = [FRONTEND_URL]
-CORS_ALLOW_HEADERS = list(default_headers)
+CORS_ALLOW_HEADERS = [*default_headers, 'x-profile']
+CORS_EXPOSE_HEADERS = ['X-Profile-File']
@@ -0,0 +1,33 @@
+"""
+Throttling settings for money-flow project.
+"""
+
+import os
+import tempfile
+
+from config.settings.auth import REST_FRAMEWORK
+
+THROTTLE_ENABLED = bool(int(os.getenv('DJANGO_THROTTLE_ENABLED', 1)))
+
+# Memory-mapped file holding the token buckets shared by the workers of a host
+THROTTLE_STORE_PATH = os.getenv(
+    'DJANGO_THROTTLE_STORE_PATH',
+    os.path.join(
+        '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir(),
+        'money-flow-throttle',
+    ),
+)
+THROTTLE_STORE_SLOTS = int(os.getenv('DJANGO_THROTTLE_STORE_SLOTS', 65536))
+
+# Reverse proxies in front of the app, the client IP is the last address they
+# appended to X-Forwarded-For; 0 uses the address of the connection
+REST_FRAMEWORK['NUM_PROXIES'] = int(os.getenv('DJANGO_THROTTLE_NUM_PROXIES', 1))
+
+REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] = {
+    'login': os.getenv('DJANGO_THROTTLE_LOGIN_RATE', '10/min'),
+    'register': os.getenv('DJANGO_THROTTLE_REGISTER_RATE', '5/hour'),
+    'transaction_create': os.getenv(
+        'DJANGO_THROTTLE_TRANSACTION_CREATE_RATE', '120/min'
+    ),
+    'bulk': os.getenv('DJANGO_THROTTLE_BULK_RATE', '30/min'),
+}
@@ -0,0 +1,39 @@
+"""
+Transactions settings for money-flow project.
+"""
+
+import os
+
+# Transactions older than this are moved to the archive table
+# by the archive_transactions command
+TRANSACTIONS_ARCHIVE_AFTER_DAYS = int(
+    os.getenv('DJANGO_TRANSACTIONS_ARCHIVE_AFTER_DAYS', 365)
+)
+TRANSACTIONS_ARCHIVE_BATCH_SIZE = int(
+    os.getenv('DJANGO_TRANSACTIONS_ARCHIVE_BATCH_SIZE', 1000)
+)
+
+# Lifetime of the per-user running balance snapshots (seconds, 0 - disabled)
+TRANSACTIONS_BALANCE_SNAPSHOT_TIMEOUT = int(
+    os.getenv('DJANGO_TRANSACTIONS_BALANCE_SNAPSHOT_TIMEOUT', 86400)
+)
+
+# Most buckets a time series report may span
+TRANSACTIONS_TIMESERIES_MAX_BUCKETS = int(
+    os.getenv('DJANGO_TRANSACTIONS_TIMESERIES_MAX_BUCKETS', 5000)
+)
+
+# Write-behind ingestion: rows buffered by a worker are committed when the
+# buffer holds BATCH_SIZE rows or every FLUSH_INTERVAL_MS milliseconds
+TRANSACTIONS_INGEST_BATCH_SIZE = int(
+    os.getenv('DJANGO_TRANSACTIONS_INGEST_BATCH_SIZE', 500)
+)
+TRANSACTIONS_INGEST_FLUSH_INTERVAL_MS = int(
+    os.getenv('DJANGO_TRANSACTIONS_INGEST_FLUSH_INTERVAL_MS', 200)
+)
+TRANSACTIONS_INGEST_MAX_ROWS = int(
+    os.getenv('DJANGO_TRANSACTIONS_INGEST_MAX_ROWS', 1000)
+)
+TRANSACTIONS_INGEST_TICKET_TIMEOUT = int(
+    os.getenv('DJANGO_TRANSACTIONS_INGEST_TICKET_TIMEOUT', 3600)
+)
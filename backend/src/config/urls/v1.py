@@ -1,29 +1,23 @@
+from django.conf import settings
 from django.urls import include, path
 
-from config.yasg import docs_schema_view_v1
+from apps.core.views.docs import docs_file_view, docs_ui_view
 
 __all__ = ['urlpatterns']
 
 apps_patterns_v1 = [
+    path('', include('apps.core.urls')),
     path('', include('apps.users.urls')),
     path('', include('apps.reference.urls')),
     path('', include('apps.transactions.urls')),
 ]
 
 third_party_patterns_v1 = [
-    path(
-        'docs/',
-        docs_schema_view_v1.with_ui('swagger', cache_timeout=0),
-        name='docs-ui-v1',
-    ),
-    path(
-        'docs<format>/',
-        docs_schema_view_v1.without_ui(cache_timeout=0),
-        name='docs-file-v1',
-    ),
+    path('docs/', docs_ui_view, name='docs-ui-v1'),
+    path('docs<format>/', docs_file_view, name='docs-file-v1'),
 ]
 
 urlpatterns = [
     *apps_patterns_v1,
-    *third_party_patterns_v1,
+    *(third_party_patterns_v1 if settings.DOCS_ENABLED else []),
 ]
@@ -1,7 +1,9 @@
 #!/bin/sh
 
 poetry run python manage.py migrate
+poetry run python manage.py manage_partitions
 poetry run python manage.py load_reference
+poetry run python manage.py generate_schema
 poetry run python manage.py collectstatic --no-input
 
 exec "$@"
@@ -22,6 +22,13 @@ interface Status {
   name: string
 }
 
+interface ReferenceBundle {
+  statuses: Status[]
+  transaction_types: TransactionType[]
+  categories: Category[]
+  subcategories: Subcategory[]
+}
+
 interface Transaction {
   id: number
   created_at: string
@@ -147,17 +154,12 @@ export const useTransactionsStore = defineStore('transactions', {
       const config = useNuxtApp().$config
 
       try {
-        const [transactionTypes, categories, subcategories, statuses] = await Promise.all([
-          $fetch<TransactionType[]>(`${config.public.apiBase}/v1/transaction-types/`),
-          $fetch<Category[]>(`${config.public.apiBase}/v1/categories/`),
-          $fetch<Subcategory[]>(`${config.public.apiBase}/v1/subcategories/`),
-          $fetch<Status[]>(`${config.public.apiBase}/v1/statuses/`)
-        ])
-
-        this.transactionTypes = transactionTypes
-        this.categories = categories
-        this.subcategories = subcategories
-        this.statuses = statuses
+        const reference = await $fetch<ReferenceBundle>(`${config.public.apiBase}/v1/reference/`)
+
+        this.transactionTypes = reference.transaction_types
+        this.categories = reference.categories
+        this.subcategories = reference.subcategories
+        this.statuses = reference.statuses
       } catch (error) {
         console.error('Fetch metadata error:', error)
         throw error